@@ -1,3 +1,6 @@
+import asyncio
+import random
+import threading
 from abc import ABC, abstractmethod
 
 class BaseAgent(ABC):
@@ -6,6 +9,10 @@ class BaseAgent(ABC):
     Defines the interface required by the environment.
     """
 
+    # Set to True to receive game_state["hand_state"], a HandState snapshot
+    # of the hand that search-based agents can clone and branch on
+    requires_hand_state = False
+
     def __init__(self, name, reasoning_engine):
         """
         :param name: A string identifier for the agent.
@@ -17,10 +24,12 @@ class BaseAgent(ABC):
         self.current_contribution = 0  # The current bet amount the agent has committed to
         self.stack = 0 # current stack
         self.net_profit = 0 # Track the agent's net gain/loss
+        self.all_in_adjustment = 0.0 # all-in equity minus actual winnings; net_profit plus this is EV-adjusted
         self.folded = False  # Flag to indicate if the agent has folded
         self.previous_action = None
-        self.settled = False # Flag to indicate if the agent has settled their bet
-        self.is_raiser = False
+        # Source of any randomness in decisions; a seeded PokerEnv replaces it
+        # with the agent's own stream for every hand
+        self.rng = random
 
     @abstractmethod
     def decide_action(self, game_state):
@@ -34,3 +43,42 @@ class BaseAgent(ABC):
         :return: An action, e.g. "fold", "call", "raise", along with optional raise size.
         """
         pass
+
+    async def decide_action_async(self, game_state):
+        """
+        Async version of decide_action, used by PokerEnv.play_async.
+        Agents that wait on I/O (remote bots, human clients) override this.
+        By default the synchronous decide_action runs in a daemon thread of
+        its own, so a slow agent does not stall other tables on the event
+        loop. A decision that outlives its deadline is discarded, not
+        cancelled: the thread runs on and its answer is dropped, and being
+        a daemon it never holds up the loop's or the interpreter's shutdown.
+        Agents whose decide_action blocks on input or draws from self.rng
+        should not run that way, since a late thread would still read the
+        input or consume the seeded stream; they override this method.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def decide():
+            try:
+                outcome = (self.decide_action(game_state), None)
+            except BaseException as exc:
+                outcome = (None, exc)
+            try:
+                loop.call_soon_threadsafe(_settle, future, *outcome)
+            except RuntimeError:
+                pass  # the loop closed before the decision came back
+
+        threading.Thread(target=decide, name=f"decide-{self.name}", daemon=True).start()
+        return await future
+
+
+def _settle(future, result, exc):
+    # Runs on the loop; the caller may have stopped waiting already
+    if future.done():
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
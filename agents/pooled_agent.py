@@ -0,0 +1,217 @@
+import asyncio
+import atexit
+import random
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+from environment.legal_actions import LegalActions
+from utils.cards import encode_cards, int_to_card
+from .base_agent import BaseAgent
+
+_shared_pools = {}
+# Event loop -> {batcher key: _Batcher}, dropped with the loop
+_batchers = weakref.WeakKeyDictionary()
+
+# Agents built inside a worker process, one per (agent class, reasoning
+# factory), so reasoning caches are shared by every decision the worker makes
+_worker_agents = {}
+
+
+def _seed_worker():
+    # Forked workers inherit the parent's random state; give each its own
+    random.seed()
+
+
+def _shared_pool(processes):
+    """
+    A process pool shared by every PooledAgent with the same `processes`.
+    Pools are shut down at interpreter exit.
+    """
+    pool = _shared_pools.get(processes)
+    if pool is None:
+        pool = ProcessPoolExecutor(max_workers=processes, initializer=_seed_worker)
+        _shared_pools[processes] = pool
+    return pool
+
+
+@atexit.register
+def _shutdown_pools():
+    for pool in _shared_pools.values():
+        pool.shutdown(wait=False, cancel_futures=True)
+    _shared_pools.clear()
+
+
+def pack_state(game_state, agent):
+    """
+    Compact, cheaply pickled form of a decision: the game state as a flat
+    tuple with cards as encoded ints, plus the agent's stack and contribution
+    and a seed drawn from agent.rng for the worker's draws.
+    """
+    return (
+        game_state["game_stage"],
+        tuple(encode_cards(game_state["hand"])),
+        tuple(encode_cards(game_state["community_cards"])),
+        game_state["pot"],
+        game_state["num_players"],
+        game_state["current_bet"],
+        game_state["buy_in"],
+        game_state["small_blind"],
+        game_state["big_blind"],
+        tuple(game_state["legal_actions"]),
+        agent.stack,
+        agent.current_contribution,
+        game_state.get("hand_state"),
+        agent.rng.getrandbits(64),
+    )
+
+
+def unpack_state(packed, agent):
+    """
+    Rebuild the game_state dict from pack_state() and load the agent's stack,
+    contribution and hand from it, and seed its rng.
+    """
+    (stage, hand, community_cards, pot, num_players, current_bet, buy_in,
+     small_blind, big_blind, legal, agent.stack, agent.current_contribution, hand_state, seed) = packed
+    agent.rng.seed(seed)
+    agent.hand = [int_to_card(card) for card in hand]
+    game_state = {
+        "game_stage": stage,
+        "previous_action": None,
+        "hand": agent.hand,
+        "community_cards": [int_to_card(card) for card in community_cards],
+        "pot": pot,
+        "num_players": num_players,
+        "current_bet": current_bet,
+        "buy_in": buy_in,
+        "small_blind": small_blind,
+        "big_blind": big_blind,
+        "legal_actions": LegalActions(*legal),
+    }
+    if hand_state is not None:
+        game_state["hand_state"] = hand_state
+    return game_state
+
+
+def _decide_batch(spec, states):
+    """
+    Worker body: decide every packed state with the worker's agent for `spec`.
+    """
+    agent = _worker_agents.get(spec)
+    if agent is None:
+        agent_class, reasoning_factory = spec
+        reasoning_engine = reasoning_factory() if reasoning_factory is not None else None
+        agent = agent_class("pooled", reasoning_engine)
+        # Reseeded for every decision from the parent agent's stream
+        agent.rng = random.Random()
+        _worker_agents[spec] = agent
+    return [tuple(agent.decide_action(unpack_state(packed, agent))) for packed in states]
+
+
+class _Batcher:
+    """
+    Collects decisions for one (pool, agent spec) on an event loop and sends
+    them to a worker together, once `batch_size` are waiting or `batch_wait`
+    seconds after the first one arrived.
+    """
+
+    def __init__(self, pool, spec, batch_size, batch_wait):
+        self.pool = pool
+        self.spec = spec
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.pending = []
+        self.timer = None
+
+    def submit(self, packed):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((packed, future))
+        if len(self.pending) >= self.batch_size:
+            self._flush()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.batch_wait, self._flush)
+        return future
+
+    def _flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        done = asyncio.wrap_future(self.pool.submit(_decide_batch, self.spec, [packed for packed, _ in batch]))
+        done.add_done_callback(lambda done: self._resolve(batch, done))
+
+    @staticmethod
+    def _resolve(batch, done):
+        # Futures of decisions that already timed out are cancelled; skip them
+        if done.cancelled():
+            for _, future in batch:
+                future.cancel()
+            return
+        if done.exception() is not None:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(done.exception())
+            return
+        for (_, future), decision in zip(batch, done.result()):
+            if not future.done():
+                future.set_result(decision)
+
+
+class PooledAgent(BaseAgent):
+    """
+    Runs another agent's decide_action in a shared process pool, so tables
+    using CPU-heavy reasoning decide in parallel on all cores.
+
+    Each worker builds its own copy of the agent from `agent_class` and
+    `reasoning_factory` (both must be picklable, e.g. classes) and keeps it
+    for every decision it handles. Game states travel in the compact form of
+    pack_state(). Under PokerEnv.play_async, decisions from several tables
+    can be batched into one worker call with `batch_size` > 1.
+    """
+
+    def __init__(self, name, agent_class, reasoning_factory=None, processes=None,
+                 batch_size=1, batch_wait=0.002):
+        """
+        :param name: A string identifier for the agent.
+        :param agent_class: the agent class that makes the decisions
+        :param reasoning_factory: builds the reasoning engine in each worker
+        :param processes: pool size (default: all cores); agents with the same
+                          value share one pool
+        :param batch_size: decisions sent to a worker together (async only)
+        :param batch_wait: longest time, in seconds, a decision waits for its batch to fill
+        """
+        super().__init__(name, None)
+        self.spec = (agent_class, reasoning_factory)
+        self.requires_hand_state = agent_class.requires_hand_state
+        self.processes = processes
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+
+    def decide_action(self, game_state):
+        pool = _shared_pool(self.processes)
+        return pool.submit(_decide_batch, self.spec, [pack_state(game_state, self)]).result()[0]
+
+    def decide_batch(self, decisions):
+        """
+        Decide many (game_state, agent) pairs at once, e.g. for a batch
+        simulator, split into chunks of `batch_size` across the pool.
+        """
+        pool = _shared_pool(self.processes)
+        packed = [pack_state(game_state, agent) for game_state, agent in decisions]
+        size = max(self.batch_size, 1)
+        chunks = [pool.submit(_decide_batch, self.spec, packed[start:start + size])
+                  for start in range(0, len(packed), size)]
+        return [decision for chunk in chunks for decision in chunk.result()]
+
+    async def decide_action_async(self, game_state):
+        pool = _shared_pool(self.processes)
+        packed = pack_state(game_state, self)
+        if self.batch_size <= 1:
+            return (await asyncio.wrap_future(pool.submit(_decide_batch, self.spec, [packed])))[0]
+
+        batchers = _batchers.setdefault(asyncio.get_running_loop(), {})
+        key = (self.processes, self.spec, self.batch_size, self.batch_wait)
+        batcher = batchers.get(key)
+        if batcher is None:
+            batcher = batchers[key] = _Batcher(pool, self.spec, self.batch_size, self.batch_wait)
+        return await batcher.submit(packed)
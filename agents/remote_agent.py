@@ -0,0 +1,225 @@
+import asyncio
+import atexit
+import itertools
+import statistics
+import threading
+import time
+from collections import deque
+
+from environment.bot_protocol import ProtocolError, encode_message, read_message, state_to_json
+from .base_agent import BaseAgent
+
+_io_loop = None
+_io_lock = threading.Lock()
+_pools = {}
+
+
+def _get_io_loop():
+    """
+    The event loop, running in a daemon thread, that owns every bot
+    connection. Sync and async callers both hand their requests to it.
+    """
+    global _io_loop
+    with _io_lock:
+        if _io_loop is None:
+            _io_loop = asyncio.new_event_loop()
+            threading.Thread(target=_io_loop.run_forever, name="bot-io", daemon=True).start()
+        return _io_loop
+
+
+@atexit.register
+def _close_pools():
+    for pool in list(_pools.values()):
+        pool.close()
+
+
+def get_pool(address, size=4):
+    """
+    The shared connection pool for a bot address: a (host, port) tuple for
+    TCP or a path for a Unix socket.
+    """
+    key = tuple(address) if isinstance(address, (tuple, list)) else address
+    pool = _pools.get(key)
+    if pool is None:
+        pool = _pools[key] = BotConnectionPool(key, size)
+    return pool
+
+
+class _Connection:
+    """
+    One persistent connection. Requests are pipelined: many can be in flight
+    at once and a reader task matches responses to them by id.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.pending = {}
+        self.closed = False
+        self.task = asyncio.get_running_loop().create_task(self._read_responses())
+
+    async def _read_responses(self):
+        error = ProtocolError("Connection closed by the bot.")
+        try:
+            while True:
+                message = await read_message(self.reader)
+                if message is None:
+                    break
+                future = self.pending.pop(message.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except (OSError, EOFError, ProtocolError, ValueError) as exc:
+            error = exc
+        finally:
+            self.closed = True
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self.pending.clear()
+            self.writer.close()
+
+
+class BotConnectionPool:
+    """
+    Up to `size` persistent connections to one bot server. Each request goes
+    to the open connection with the fewest requests in flight; a new
+    connection is opened only while all are busy and the pool is not full.
+    Keeps per-decision latency and connection reuse counters.
+    """
+
+    def __init__(self, address, size=4, latency_window=10000):
+        self.address = address
+        self.size = size
+        self.connections = []
+        self._connecting = set()    # connect tasks in flight
+        self._ids = itertools.count()
+        self.requests = 0
+        self.connections_opened = 0
+        self.reused = 0
+        self.latencies = deque(maxlen=latency_window)
+
+    def request(self, message):
+        """
+        Send `message` (without its id) and return a concurrent Future for
+        the response. Safe to call from any thread.
+        """
+        return asyncio.run_coroutine_threadsafe(self._request(message), _get_io_loop())
+
+    def _connect(self):
+        """
+        Start opening a connection. The task is tracked until it finishes,
+        so it counts against `size` while in flight and other requests can
+        wait for it instead of opening their own.
+        """
+        task = asyncio.get_running_loop().create_task(self._open())
+        self._connecting.add(task)
+        task.add_done_callback(self._connecting.discard)
+        return task
+
+    async def _open(self):
+        if isinstance(self.address, tuple):
+            reader, writer = await asyncio.open_connection(*self.address)
+        else:
+            reader, writer = await asyncio.open_unix_connection(self.address)
+        self.connections_opened += 1
+        connection = _Connection(reader, writer)
+        self.connections.append(connection)
+        return connection
+
+    async def _acquire(self):
+        """
+        The connection for the next request. Never more than `size`
+        connections are open or being opened: when none is open yet and
+        the pool is full of connects in flight, wait for one of those.
+        """
+        while True:
+            self.connections = [connection for connection in self.connections if not connection.closed]
+            connection = min(self.connections, key=lambda c: len(c.pending), default=None)
+            room = len(self.connections) + len(self._connecting) < self.size
+            if room and (connection is None or connection.pending):
+                return await self._connect()
+            if connection is not None:
+                self.reused += 1
+                return connection
+            await asyncio.wait(list(self._connecting), return_when=asyncio.FIRST_COMPLETED)
+
+    async def _request(self, message):
+        connection = await self._acquire()
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        start = time.perf_counter()
+        try:
+            connection.pending[request_id] = future
+            connection.writer.write(encode_message(dict(message, id=request_id)))
+            await connection.writer.drain()
+            response = await future
+        finally:
+            connection.pending.pop(request_id, None)
+        self.requests += 1
+        self.latencies.append(time.perf_counter() - start)
+        return response
+
+    def stats(self):
+        """
+        Request count, connections opened, share of requests that reused an
+        open connection, and decision latency (mean, p50, p99) in seconds
+        over the most recent requests.
+        """
+        latencies = sorted(self.latencies)
+        total = self.reused + self.connections_opened
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "open_connections": sum(1 for connection in self.connections if not connection.closed),
+            "reuse_rate": self.reused / total if total else 0.0,
+            "latency_mean": statistics.fmean(latencies) if latencies else 0.0,
+            "latency_p50": latencies[len(latencies) // 2] if latencies else 0.0,
+            "latency_p99": latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)] if latencies else 0.0,
+        }
+
+    def close(self):
+        for connection in self.connections:
+            if not connection.closed:
+                _get_io_loop().call_soon_threadsafe(connection.writer.close)
+        self.connections = []
+
+
+class RemoteAgent(BaseAgent):
+    """
+    An agent whose decisions are made by an external bot service speaking
+    the protocol in environment/bot_protocol.py. All RemoteAgents for the
+    same address share a pool of persistent connections, so requests from
+    many tables are pipelined over a few sockets.
+    """
+
+    def __init__(self, name, address, pool_size=4, timeout=10.0):
+        """
+        :param name: A string identifier for the agent.
+        :param address: (host, port) for TCP or a Unix socket path
+        :param pool_size: most connections kept open to the bot
+        :param timeout: seconds a synchronous decision waits for the bot
+        """
+        super().__init__(name, None)
+        self.pool = get_pool(address, pool_size)
+        self.timeout = timeout
+
+    def _message(self, game_state):
+        return {"type": "decide", "state": state_to_json(game_state, self)}
+
+    @staticmethod
+    def _decision(response):
+        if "error" in response:
+            raise ProtocolError(f"Bot error: {response['error']}")
+        return response["action"], int(response.get("amount", 0))
+
+    def decide_action(self, game_state):
+        return self._decision(self.pool.request(self._message(game_state)).result(self.timeout))
+
+    async def decide_action_async(self, game_state):
+        return self._decision(await asyncio.wrap_future(self.pool.request(self._message(game_state))))
+
+    def latency_stats(self):
+        """
+        Latency and connection reuse counters of this agent's bot pool.
+        """
+        return self.pool.stats()
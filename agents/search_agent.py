@@ -0,0 +1,17 @@
+from .base_agent import BaseAgent
+
+class SearchAgent(BaseAgent):
+    # Search engines (MCTSReasoning, CFRReasoning) branch on the hand itself
+    requires_hand_state = True
+
+    def __init__(self, name, reasoning_engine, strategy=None):
+        super().__init__(name, reasoning_engine)
+        self.strategy = strategy
+
+    def decide_action(self, game_state):
+        # Delegates the decision to the search engine, which reads
+        # game_state["hand_state"]
+        decision = self.reasoning_engine.evaluate(
+            game_state, strategy=self.strategy
+        )
+        return decision
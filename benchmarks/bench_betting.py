@@ -0,0 +1,216 @@
+"""
+Betting-round throughput of PokerEnv.
+
+Plays headless hands at tables of 2, 6 and 10 seats with agents that answer
+instantly, so the time measured is the engine's own: betting-round control,
+applying actions and settling the hand. Two action mixes are played: a
+passive one that mostly calls and an aggressive one with many raises, which
+is where per-action work that grows with the table size shows.
+
+Each configuration runs on PokerEnv as it is, driven by BettingRound, and
+on BaselineEnv, which reproduces the per-action loop that step() ran
+before: an orbit counter plus settled/is_raiser flags that a raise resets
+on every agent. Prints decisions per second for both and hands per second,
+best of REPEATS runs. The two engines do not always ask the same agents to
+act (the old loop could ask a player who had already called), so decision
+counts differ slightly between them.
+
+Run from the repository root:
+    python -m benchmarks.bench_betting
+"""
+
+import random
+import time
+
+from agents.base_agent import BaseAgent
+from environment.poker_game import PokerEnv
+
+HANDS = 10000
+REPEATS = 3
+TABLE_SIZES = (2, 6, 10)
+MIXES = (("passive", 0.1), ("aggressive", 0.4))
+
+
+class _InstantAgent(BaseAgent):
+    """
+    Decides without thinking: min-raises with probability `raise_rate`, folds
+    10% of the time, otherwise calls or checks.
+    """
+
+    decisions = 0
+    raise_rate = 0.1
+
+    def decide_action(self, game_state):
+        _InstantAgent.decisions += 1
+        legal = game_state["legal_actions"]
+        roll = random.random()
+        if roll < self.raise_rate and legal.can("raise"):
+            return "raise", legal.min_raise
+        if roll < self.raise_rate + 0.1 and legal.can("fold"):
+            return "fold", 0
+        if legal.can("call"):
+            return "call", legal.call_amount
+        return "check", 0
+
+
+class _RoundCounts:
+    """
+    The two BettingRound counters that _play_hand reads after a round.
+    """
+
+    def __init__(self, agents):
+        self.active = sum(1 for agent in agents if not agent.folded)
+        self.all_in = sum(1 for agent in agents if not agent.folded and agent.stack == 0)
+
+
+class BaselineEnv(PokerEnv):
+    """
+    PokerEnv with the betting-round loop and _apply_action it had before
+    BettingRound: a raise walks every agent to reset their flags, and every
+    orbit walks them again to count who has settled.
+    """
+
+    def __init__(self, agents, *args, **kwargs):
+        super().__init__(agents, *args, **kwargs)
+        self._clear_flags()
+
+    def reset(self):
+        super().reset()
+        self._clear_flags()
+
+    def _clear_flags(self):
+        for agent in self.agents:
+            agent.settled = False
+            agent.is_raiser = False
+
+    def _betting_round(self):
+        curr_action_agent = self.table.get_action()
+        previous_action = None
+        total_actions = 0
+
+        self.event_sink.emit("betting_round", self)
+
+        while True:
+            if self.total_players == 1:
+                break
+
+            if not curr_action_agent.agent.folded and curr_action_agent.agent.stack > 0:
+                self.event_sink.emit("turn", self, agent=curr_action_agent.agent)
+
+                if curr_action_agent.agent.is_raiser:
+
+                    # at original raiser, need to reset bets.
+
+                    settled_count = len([agent for agent in self.agents if agent.settled])
+
+                    self.event_sink.emit("raiser", self, agent=curr_action_agent.agent, settled=settled_count)
+
+                    if len(self.agents) - settled_count == 1:
+                        # Everyone called raise or folded
+                        break
+
+                    self.current_bet = 0
+
+                    for agent in self.agents:
+                        agent.net_profit -= agent.current_contribution
+                        agent.current_contribution = 0
+                        agent.is_raiser = False
+
+                agent_state = {
+                    "game_stage": self.round_stage,
+                    "previous_action": previous_action,
+                    "hand": curr_action_agent.agent.hand,
+                    "community_cards": self.community_cards,
+                    "pot": self.pot,
+                    "num_players": self.total_players,
+                    "current_bet": self.current_bet,
+                    "buy_in": self.buy_in,
+                    "small_blind": self.small_blind,
+                    "big_blind": self.big_blind,
+                }
+                self.action_seat = curr_action_agent
+                if curr_action_agent.agent.requires_hand_state:
+                    agent_state["hand_state"] = self.hand_state(viewer=curr_action_agent.agent)
+
+                legal = self.legal_actions(curr_action_agent.agent)
+                agent_state["legal_actions"] = legal
+                decision = yield curr_action_agent.agent, agent_state
+                action, amount = legal.validate(*decision)
+                curr_action_agent.agent.previous_action = (action, amount)
+                self._apply_action(curr_action_agent.agent, action, amount)
+
+                self.event_sink.emit("action", self, agent=curr_action_agent.agent, action=action, amount=amount)
+
+                total_actions += 1
+
+            else:
+                # Folded and all-in players have nothing left to decide
+                curr_action_agent.agent.settled = True
+                self.event_sink.emit("skip", self, agent=curr_action_agent.agent)
+                total_actions += 1
+
+            if total_actions == len(self.agents):
+                settled_count = len([agent for agent in self.agents if agent.settled])
+                self.event_sink.emit("orbit", self, settled=settled_count, total_actions=total_actions)
+                if settled_count == len(self.agents):
+                    break
+                else:
+                    total_actions = 0
+
+            curr_action_agent = curr_action_agent.next
+
+        self.action_seat = None
+        self.current_bet = 0
+        self.betting = _RoundCounts(self.agents)
+
+        for agent in self.agents:
+            agent.net_profit -= agent.current_contribution
+            agent.current_contribution = 0
+            agent.is_raiser = False
+
+    def _apply_action(self, agent, action, amount):
+        super()._apply_action(agent, action, amount)
+        if action in ("fold", "call", "check"):
+            agent.settled = True
+        elif action == "raise":
+            agent.is_raiser = True
+            for curr_agent in self.agents:
+                if not curr_agent.folded:
+                    curr_agent.settled = False
+                if curr_agent.name != agent.name:
+                    curr_agent.is_raiser = False
+
+
+def _run(env_class, seats):
+    """
+    Best time of REPEATS runs of HANDS hands, and the decisions they took.
+    """
+    elapsed = float("inf")
+    for _ in range(REPEATS):
+        random.seed(0)
+        env = env_class([_InstantAgent(f"P{i}", None) for i in range(seats)], 100, headless=True)
+        _InstantAgent.decisions = 0
+        start = time.perf_counter()
+        for _ in range(HANDS):
+            env.play()
+            env.rotate()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed, _InstantAgent.decisions
+
+
+def main():
+    print(f"{'mix':<12}{'seats':>5}{'hands':>10}{'baseline dec/s':>16}{'decisions/s':>14}"
+          f"{'speedup':>9}{'hands/s':>11}")
+    print("-" * 77)
+    for mix, raise_rate in MIXES:
+        _InstantAgent.raise_rate = raise_rate
+        for seats in TABLE_SIZES:
+            baseline_elapsed, baseline_decisions = _run(BaselineEnv, seats)
+            elapsed, decisions = _run(PokerEnv, seats)
+            baseline_rate, rate = baseline_decisions / baseline_elapsed, decisions / elapsed
+            print(f"{mix:<12}{seats:>5}{HANDS:>10,}{baseline_rate:>16,.0f}{rate:>14,.0f}"
+                  f"{rate / baseline_rate:>8.2f}x{HANDS / elapsed:>11,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Blueprint file vs pickled dict for storing a trained strategy.
+
+Builds a synthetic strategy of STRATEGY_SIZES information sets shaped like
+the CFR engine's, then for each storage prints the size on disk, the time
+for a fresh process to get ready to play (unpickling the dict vs mapping
+the blueprint file) and the time per lookup.
+
+Run from the repository root:
+    python -m benchmarks.bench_blueprint
+"""
+
+import os
+import pickle
+import random
+import tempfile
+import time
+
+from reasoning.blueprint import Blueprint, write_blueprint
+
+STRATEGY_SIZES = (10_000, 100_000, 1_000_000)
+LOOKUPS = 100_000
+LABELS = (("k", "r0.5", "r1", "a"), ("f", "c", "r0.5", "r1", "a"), ("f", "c", "a"))
+
+
+def _strategy(size, rng):
+    strategy = {}
+    while len(strategy) < size:
+        labels = rng.choice(LABELS)
+        key = (rng.randrange(4), rng.randrange(8), rng.randrange(2, 10), rng.randrange(10),
+               rng.randrange(7), rng.randrange(8), rng.randrange(1 << 20), labels)
+        weights = [rng.random() for _ in labels]
+        total = sum(weights)
+        strategy[key] = [weight / total for weight in weights]
+    return strategy
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def _load_pickle(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def _lookups(table, keys):
+    for key in keys:
+        table.get(key)
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'infosets':>10}{'storage':>10}{'size (MB)':>11}{'ready (ms)':>12}{'lookup (us)':>13}")
+    print("-" * 56)
+    with tempfile.TemporaryDirectory() as directory:
+        for size in STRATEGY_SIZES:
+            strategy = _strategy(size, rng)
+            keys = rng.choices(list(strategy), k=LOOKUPS)
+
+            pickle_path = os.path.join(directory, "strategy.pkl")
+            with open(pickle_path, "wb") as f:
+                pickle.dump(strategy, f, protocol=pickle.HIGHEST_PROTOCOL)
+            loaded, ready = _timed(_load_pickle, pickle_path)
+            _, elapsed = _timed(_lookups, loaded, keys)
+            print(f"{size:>10,}{'pickle':>10}{os.path.getsize(pickle_path) / 1e6:>11.1f}"
+                  f"{ready * 1e3:>12.1f}{elapsed / LOOKUPS * 1e6:>13.2f}")
+            del loaded
+
+            for encoding in ("uint8", "float16"):
+                path = os.path.join(directory, f"strategy.{encoding}.bin")
+                write_blueprint(path, strategy, encoding=encoding)
+                blueprint, ready = _timed(Blueprint, path)
+                _, elapsed = _timed(_lookups, blueprint, keys)
+                print(f"{size:>10,}{encoding:>10}{os.path.getsize(path) / 1e6:>11.1f}"
+                      f"{ready * 1e3:>12.1f}{elapsed / LOOKUPS * 1e6:>13.2f}")
+                blueprint.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Exact enumeration vs Monte Carlo sampling for the equity engine.
+
+For each spot, prints the time and result of exact_equity and of
+monte_carlo_equity at its default tolerance, plus the sampling error.
+
+Run from the repository root:
+    python -m benchmarks.bench_equity
+"""
+
+import time
+
+from utils.equity import enumeration_size, exact_equity, monte_carlo_equity
+
+SPOTS = [
+    ("river, heads-up", [('A', 'hearts'), ('K', 'hearts')],
+     [('Q', 'hearts'), ('J', 'clubs'), ('2', 'clubs'), ('7', 'spades'), ('3', 'diamonds')], 1),
+    ("turn, heads-up", [('A', 'hearts'), ('K', 'hearts')],
+     [('Q', 'hearts'), ('J', 'hearts'), ('2', 'clubs'), ('7', 'spades')], 1),
+    ("river, 2 opponents", [('9', 'spades'), ('9', 'clubs')],
+     [('Q', 'hearts'), ('J', 'clubs'), ('2', 'clubs'), ('7', 'spades'), ('3', 'diamonds')], 2),
+    ("turn, 2 opponents", [('9', 'spades'), ('9', 'clubs')],
+     [('Q', 'hearts'), ('J', 'clubs'), ('2', 'clubs'), ('7', 'spades')], 2),
+]
+
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(f"{'spot':<22}{'combinations':>14}{'exact':>16}{'sampled':>16}{'error':>9}{'speedup':>9}")
+    print("-" * 86)
+    for label, hand, board, opponents in SPOTS:
+        size = enumeration_size(len(board), 52 - 2 - len(board), opponents)
+        exact, exact_time = _timed(exact_equity, hand, board, num_opponents=opponents)
+        sampled, sampled_time = _timed(monte_carlo_equity, hand, board, num_opponents=opponents, seed=0)
+        print(f"{label:<22}{size:>14,}"
+              f"{exact.equity:>8.4f} {exact_time * 1000:>5.0f}ms"
+              f"{sampled.equity:>8.4f} {sampled_time * 1000:>5.0f}ms"
+              f"{abs(sampled.equity - exact.equity):>9.4f}"
+              f"{sampled_time / exact_time:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
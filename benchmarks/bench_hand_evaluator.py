@@ -0,0 +1,108 @@
+"""
+Hands-per-second benchmark for the hand evaluators.
+
+Compares the original Counter/Enum based evaluate_hand (reproduced below as
+the baseline) with the compatibility wrapper and with the raw lookup-table
+evaluator on pre-encoded ints, then 7-card showdown ranking done over the
+21 five-card subsets against the direct 7-card evaluator and the NumPy
+batch evaluator.
+
+Run from the repository root:
+    python -m benchmarks.bench_hand_evaluator [num_hands]
+"""
+
+import random
+import sys
+import time
+from collections import Counter
+from itertools import combinations
+
+from utils.cards import RANKS, SUITS, encode_cards
+from utils.batch_evaluator import encode_batch, evaluate_batch
+from utils.hand_evaluator import evaluate_5, evaluate_cards
+from utils.utils import PokerHand, evaluate_hand, hand_rank
+
+POKER_VALUES = {rank: i + 2 for i, rank in enumerate(RANKS)}
+
+
+def baseline_evaluate_hand(cards):
+    """
+    The evaluator that utils.evaluate_hand used before the lookup tables.
+    """
+    values = sorted([POKER_VALUES[card[0]] for card in cards], reverse=True)
+    is_flush = len(set(card[1] for card in cards)) == 1
+    is_straight = False
+    if len(set(values)) == 5:
+        if values[0] - values[4] == 4:
+            is_straight = True
+        elif values == [14, 5, 4, 3, 2]:
+            is_straight = True
+            values = [5, 4, 3, 2, 1]
+    if is_straight and is_flush:
+        if values[0] == 14:
+            return (PokerHand.ROYAL_FLUSH, values)
+        return (PokerHand.STRAIGHT_FLUSH, values)
+    value_counts = Counter(values)
+    counts = sorted(value_counts.values(), reverse=True)
+    by_count = sorted(value_counts, key=lambda v: (value_counts[v], v), reverse=True)
+    if counts == [4, 1]:
+        return (PokerHand.FOUR_OF_A_KIND, by_count)
+    if counts == [3, 2]:
+        return (PokerHand.FULL_HOUSE, by_count)
+    if is_flush:
+        return (PokerHand.FLUSH, values)
+    if is_straight:
+        return (PokerHand.STRAIGHT, values)
+    if counts == [3, 1, 1]:
+        return (PokerHand.THREE_OF_A_KIND, by_count)
+    if counts == [2, 2, 1]:
+        return (PokerHand.TWO_PAIR, by_count)
+    if counts == [2, 1, 1, 1]:
+        return (PokerHand.PAIR, by_count)
+    return (PokerHand.HIGH_CARD, values)
+
+
+def _time(label, func, hands, baseline=None):
+    start = time.perf_counter()
+    for hand in hands:
+        func(hand)
+    elapsed = time.perf_counter() - start
+    rate = len(hands) / elapsed
+    speedup = f"  ({rate / baseline:5.1f}x)" if baseline else ""
+    print(f"{label:<40}{rate:>14,.0f} hands/s{speedup}")
+    return rate
+
+
+def main(num_hands=200_000):
+    rng = random.Random(0)
+    deck = [(rank, suit) for rank in RANKS for suit in SUITS]
+    hands = [rng.sample(deck, 5) for _ in range(num_hands)]
+    encoded = [encode_cards(hand) for hand in hands]
+
+    print(f"Evaluating {num_hands:,} random 5-card hands")
+    print("-" * 70)
+    baseline = _time("baseline evaluate_hand (tuples)", baseline_evaluate_hand, hands)
+    _time("evaluate_hand wrapper (tuples)", evaluate_hand, hands, baseline)
+    _time("hand_rank (tuples)", hand_rank, hands, baseline)
+    _time("hand_rank (encoded ints)", hand_rank, encoded, baseline)
+    _time("evaluate_5 (encoded ints)", lambda h: evaluate_5(*h), encoded, baseline)
+
+    sevens = [rng.sample(deck, 7) for _ in range(num_hands // 10)]
+    encoded_sevens = [encode_cards(hand) for hand in sevens]
+
+    print()
+    print(f"Ranking {len(sevens):,} random 7-card hands")
+    print("-" * 70)
+    baseline = _time("best of 21 subsets, evaluate_5", lambda h: max(evaluate_5(*c) for c in combinations(h, 5)), encoded_sevens)
+    _time("hand_rank (tuples)", hand_rank, sevens, baseline)
+    evaluate_cards_rate = _time("evaluate_cards (encoded ints)", evaluate_cards, encoded_sevens, baseline)
+
+    batch = encode_batch(sevens * 10)
+    start = time.perf_counter()
+    evaluate_batch(batch)
+    rate = len(batch) / (time.perf_counter() - start)
+    print(f"{'evaluate_batch (numpy, 7 cards)':<40}{rate:>14,.0f} hands/s  ({rate / evaluate_cards_rate:5.1f}x vs evaluate_cards)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,54 @@
+"""
+Exact vs sampled ICM equity.
+
+For fields of 2 to 10 players with every place paid, and for larger fields
+where icm_equity switches to sampling, prints the time of the exact subset
+recursion, of the sampled estimate and of a memoized repeat call, plus the
+largest sampling error where the exact answer is known.
+
+Run from the repository root:
+    python -m benchmarks.bench_icm
+"""
+
+import random
+import time
+
+from utils import icm
+
+FIELDS = (2, 4, 6, 8, 10, 12, 20, 50)
+PAID_SHARE = 0.3    # share of a field paid once it is too large for exact
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'players':>8}{'paid':>6}{'subsets':>20}{'exact (ms)':>12}{'sampled (ms)':>14}"
+          f"{'cached (us)':>13}{'error':>9}")
+    print("-" * 82)
+    for players in FIELDS:
+        paid = players if players <= 10 else max(3, int(players * PAID_SHARE))
+        stacks = [rng.randint(1, 100) for _ in range(players)]
+        payouts = sorted((rng.randint(1, 100) for _ in range(paid)), reverse=True)
+        subsets = icm._subsets(players, paid)
+
+        sampled, sampled_time = _timed(icm._sampled_equity, stacks, payouts, icm.DEFAULT_SAMPLES, 0)
+        if subsets <= icm.MAX_EXACT_SUBSETS:
+            exact, exact_time = _timed(icm._exact_equity, stacks, payouts)
+            error = f"{max(abs(a - b) for a, b in zip(exact, sampled)) / sum(payouts):>9.4f}"
+            exact_time = f"{exact_time * 1e3:>12.2f}"
+        else:
+            exact_time, error = f"{'-':>12}", f"{'-':>9}"
+
+        icm.icm_equity(stacks, payouts)
+        _, cached_time = _timed(icm.icm_equity, stacks, payouts)
+        print(f"{players:>8}{paid:>6}{subsets:>20,}{exact_time}{sampled_time * 1e3:>14.2f}"
+              f"{cached_time * 1e6:>13.1f}{error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Decision latency and search throughput of MCTSReasoning.
+
+Plays headless heads-up hands of a SearchAgent running MCTS against the
+rule-based engine, for each time budget in TIME_LIMITS and each number of
+search processes in PROCESSES. Prints the mean and worst time per decision
+and the iterations searched per decision and per second. Root
+parallelization only pays off with as many free cores as processes.
+
+Run from the repository root:
+    python -m benchmarks.bench_mcts
+"""
+
+import time
+
+from agents.passive_agent import PassiveAgent
+from agents.search_agent import SearchAgent
+from environment.poker_game import PokerEnv
+from reasoning.mcts import MCTSReasoning
+from reasoning.rule_based import RuleBasedReasoning
+
+HANDS = 50
+TIME_LIMITS = (0.01, 0.05, 0.2)
+PROCESSES = (1, 2, 4)
+
+
+class _TimedSearch(MCTSReasoning):
+    """
+    MCTSReasoning recording the time and root visits of every decision.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.times = []
+        self.visits = []
+
+    def evaluate(self, game_state, strategy=None):
+        start = time.perf_counter()
+        decision = super().evaluate(game_state, strategy)
+        self.times.append(time.perf_counter() - start)
+        self.visits.append(self.last_visits)
+        return decision
+
+
+def main():
+    print(f"{'budget (ms)':>12}{'processes':>11}{'mean (ms)':>11}{'worst (ms)':>12}"
+          f"{'iterations':>12}{'iterations/s':>14}")
+    print("-" * 72)
+    for time_limit in TIME_LIMITS:
+        for processes in PROCESSES:
+            engine = _TimedSearch(iterations=10 ** 9, time_limit=time_limit, processes=processes, seed=0)
+            agents = [SearchAgent("mcts", engine), PassiveAgent("rules", RuleBasedReasoning())]
+            env = PokerEnv(agents, 100, headless=True, seed=0)
+            for _ in range(HANDS):
+                env.play()
+                env.rotate()
+            engine.close()
+
+            decisions = len(engine.times)
+            mean = sum(engine.times) / decisions
+            # Visits at the root include those kept from earlier decisions
+            # of the hand; they are what the choice is made on
+            iterations = sum(engine.visits) / decisions
+            print(f"{time_limit * 1e3:>12.0f}{processes:>11}{mean * 1e3:>11.1f}{max(engine.times) * 1e3:>12.1f}"
+                  f"{iterations:>12,.0f}{iterations / mean:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
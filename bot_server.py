@@ -0,0 +1,78 @@
+"""
+Reference bot server for the protocol in environment/bot_protocol.py.
+
+Answers every decision with a random legal action, which is enough to test
+RemoteAgent and to serve as a template for real bots:
+
+    python bot_server.py --port 9999
+    python bot_server.py --unix /tmp/poker-bot.sock
+"""
+
+import argparse
+import asyncio
+import random
+
+from environment.bot_protocol import ProtocolError, encode_message, read_message
+
+
+def random_policy(state):
+    """
+    A random legal (action, amount) for a decoded state.
+    """
+    legal = state["legal_actions"]
+    action = random.choice(legal["actions"])
+    if action == "raise":
+        return action, random.randint(legal["min_raise"], legal["max_raise"])
+    if action == "call":
+        return action, legal["call_amount"]
+    return action, 0
+
+
+async def handle_connection(reader, writer, policy=random_policy):
+    """
+    Serve one client: answer each request in the order it arrives, so
+    pipelined requests are handled back to back.
+    """
+    try:
+        while True:
+            message = await read_message(reader)
+            if message is None:
+                break
+            try:
+                action, amount = policy(message["state"])
+                response = {"id": message.get("id"), "action": action, "amount": amount}
+            except Exception as exc:
+                response = {"id": message.get("id"), "error": str(exc)}
+            writer.write(encode_message(response))
+            await writer.drain()
+    except (ConnectionError, ProtocolError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host="127.0.0.1", port=9999, unix_path=None, policy=random_policy):
+    """
+    Run a bot server until cancelled.
+    """
+    async def handler(reader, writer):
+        await handle_connection(reader, writer, policy)
+
+    if unix_path is not None:
+        server = await asyncio.start_unix_server(handler, unix_path)
+    else:
+        server = await asyncio.start_server(handler, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reference poker bot server (random legal actions).")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host to listen on")
+    parser.add_argument("--port", type=int, default=9999, help="TCP port to listen on")
+    parser.add_argument("--unix", default=None, help="listen on this Unix socket path instead of TCP")
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.unix))
+
+if __name__ == "__main__":
+    main()
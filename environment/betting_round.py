@@ -0,0 +1,91 @@
+"""
+Control of one betting round as an explicit state machine.
+
+A round starts with every live player who still has chips owing an action.
+It keeps three counters: live players (`active`), live players with no
+chips behind (`all_in`), and players with chips who have acted since the
+last bet or raise (`settled`). It also keeps a pointer to the last
+aggressor. record() updates these in O(1) per action:
+
+- check / call: the player is settled, or all-in if the call took every chip
+- fold:         one less live player
+- raise:        the raiser becomes the last aggressor and everybody else
+                with chips owes an action again (settled drops to 0, or 1
+                for the raiser when they still have chips)
+
+The round is over once one live player is left or nobody with chips still
+owes an action, i.e. `settled + all_in == active`. Players count as settled
+by comparing the action number of their last action with that of the last
+raise, so a raise never has to touch the other players.
+
+This is the same street-closing rule as HandState.
+"""
+
+
+class BettingRound:
+    """
+    Counters and turn pointer of the betting round in progress.
+    """
+
+    def __init__(self, table, first):
+        """
+        :param table: the PokerTable being played
+        :param first: the seat (Node) that opens the round
+        """
+        self.active = 0
+        self.all_in = 0
+        self.settled = 0
+        self.last_aggressor = None
+        self.actions = 0
+        self._last_acted = {}     # agent -> number of their last action
+        self._raised_at = 0       # number of the last bet or raise
+        for seat in table.occupied():
+            if not seat.agent.folded:
+                self.active += 1
+                if seat.agent.stack == 0:
+                    self.all_in += 1
+        self.to_act = first
+        self.closed = self.active <= 1 or self.pending() == 0
+
+    def advance(self):
+        """
+        Pass the turn to the next seat.
+        """
+        self.to_act = self.to_act.next
+        return self.to_act
+
+    def pending(self):
+        """
+        Players with chips who still owe an action this round.
+        """
+        return self.active - self.all_in - self.settled
+
+    def is_settled(self, agent):
+        """
+        Whether a live agent has acted since the last bet or raise.
+        """
+        return self._last_acted.get(agent, -1) >= self._raised_at
+
+    def record(self, agent, action):
+        """
+        Update the round after `agent` played `action`, which the
+        environment has already applied, so agent.stack is the stack
+        after it.
+        """
+        self.actions += 1
+        if action == "fold":
+            self.active -= 1
+        elif action == "raise":
+            self.last_aggressor = agent
+            self._raised_at = self.actions
+            self.settled = 0
+            if agent.stack == 0:
+                self.all_in += 1
+            else:
+                self.settled = 1
+        elif agent.stack == 0:
+            self.all_in += 1
+        else:
+            self.settled += 1
+        self._last_acted[agent] = self.actions
+        self.closed = self.active <= 1 or self.settled + self.all_in == self.active
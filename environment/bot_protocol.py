@@ -0,0 +1,94 @@
+"""
+Wire protocol between RemoteAgent and external bot services.
+
+Every message is a 4-byte big-endian length followed by that many bytes of
+UTF-8 JSON. The client sends
+
+    {"id": 17, "type": "decide", "state": {...}}
+
+and the bot answers with
+
+    {"id": 17, "action": "raise", "amount": 40}
+
+or {"id": 17, "error": "..."}. Ids let a client pipeline several requests on
+one connection; a bot may answer them in any order. The state is the game
+state an agent sees, with cards as [rank, suit] pairs and the legal actions
+spelled out:
+
+    {"stage": "Flop", "hand": [["A", "spades"], ["K", "spades"]],
+     "community_cards": [...], "pot": 24, "num_players": 3,
+     "current_bet": 8, "small_blind": 2, "big_blind": 4, "buy_in": 20,
+     "stack": 12, "contribution": 0,
+     "legal_actions": {"actions": ["fold", "call", "raise"], "call_amount": 8,
+                       "min_raise": 16, "max_raise": 12}}
+
+Raise amounts are totals to raise to, as everywhere else in the engine.
+"""
+
+import asyncio
+import json
+import struct
+
+HEADER = struct.Struct(">I")
+MAX_MESSAGE_SIZE = 1 << 20
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def encode_message(message):
+    """
+    Frame a JSON-serializable message.
+    """
+    body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    if len(body) > MAX_MESSAGE_SIZE:
+        raise ProtocolError(f"Message of {len(body)} bytes exceeds {MAX_MESSAGE_SIZE}.")
+    return HEADER.pack(len(body)) + body
+
+
+async def read_message(reader):
+    """
+    Read one framed message from an asyncio StreamReader, or None at EOF.
+    A connection closed partway through a message raises ProtocolError.
+    """
+    try:
+        header = await reader.readexactly(HEADER.size)
+    except asyncio.IncompleteReadError as exc:
+        if exc.partial:
+            raise ProtocolError("Truncated message header.") from exc
+        return None
+    (size,) = HEADER.unpack(header)
+    if size > MAX_MESSAGE_SIZE:
+        raise ProtocolError(f"Message of {size} bytes exceeds {MAX_MESSAGE_SIZE}.")
+    try:
+        body = await reader.readexactly(size)
+    except asyncio.IncompleteReadError as exc:
+        raise ProtocolError(f"Truncated message: got {len(exc.partial)} of {size} bytes.") from exc
+    return json.loads(body)
+
+
+def state_to_json(game_state, agent):
+    """
+    The JSON form of a decision for `agent`.
+    """
+    legal = game_state["legal_actions"]
+    return {
+        "stage": game_state["game_stage"],
+        "hand": [list(card) for card in game_state["hand"]],
+        "community_cards": [list(card) for card in game_state["community_cards"]],
+        "pot": game_state["pot"],
+        "num_players": game_state["num_players"],
+        "current_bet": game_state["current_bet"],
+        "small_blind": game_state["small_blind"],
+        "big_blind": game_state["big_blind"],
+        "buy_in": game_state["buy_in"],
+        "stack": agent.stack,
+        "contribution": agent.current_contribution,
+        "legal_actions": {
+            "actions": legal.actions(),
+            "call_amount": legal.call_amount,
+            "min_raise": legal.min_raise,
+            "max_raise": legal.max_raise,
+        },
+    }
@@ -0,0 +1,198 @@
+"""
+Event sinks for PokerEnv.
+
+The engine itself does no terminal I/O: everything it used to print is
+reported as an event through `sink.emit(event, env, **data)`. Pick the sink
+that fits the run:
+
+- NullSink:       drops every event (headless, fastest)
+- LoggingSink:    one structured record per event through `logging`
+- ConsolePrinter: the original banner-style terminal output
+"""
+
+import logging
+
+
+class EventSink:
+    """
+    Base class for event sinks. Subclasses override emit().
+
+    Events and their data:
+        init                                   environment created
+        stage                                  a stage finished (deal, blinds, a street)
+        betting_round                          a betting round starts
+        turn          agent                    an agent is about to act
+        action        agent, action, amount    an agent acted
+        skip          agent                    a folded or all-in agent was skipped
+        timeout       agent, action            an agent ran out of time; action was played for it
+        runout        equities                 nobody can bet any more; the board was dealt out
+                                               (equities: {agent: equity} or None)
+        betting_closed last_aggressor,         a betting round ended; last_aggressor is
+                      actions                  None if nobody bet or raised
+        round_over    winner, hand_type        the hand was settled
+    """
+
+    def emit(self, event, env, **data):
+        pass
+
+
+class NullSink(EventSink):
+    """
+    Ignores every event.
+    """
+
+
+class LoggingSink(EventSink):
+    """
+    Logs each event as a structured record: the message is the event name
+    and the record carries `event` plus a flat dict of JSON-friendly fields
+    in `poker` (agents are reported by name).
+    """
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger("poker")
+        self.level = level
+
+    def emit(self, event, env, **data):
+        if not self.logger.isEnabledFor(self.level):
+            return
+        fields = {
+            "stage": env.round_stage,
+            "pot": env.pot,
+            "current_bet": env.current_bet,
+        }
+        for key, value in data.items():
+            if isinstance(value, dict):
+                value = {getattr(item, "name", item): entry for item, entry in value.items()}
+            fields[key] = getattr(value, "name", value)
+        self.logger.log(self.level, event, extra={"event": event, "poker": fields})
+
+
+def format_game_state(env):
+    """
+    The formatted view of the current game state including all player
+    information, community cards, pot, and current betting information.
+    """
+    lines = ["\n" + "="*80, f"{env.round_stage} RESULTS".center(80), "="*80]
+
+    # Print dealer, small blind, and big blind positions
+    small_blind = env.table.get_small_blind().agent.name
+    big_blind = env.table.get_big_blind().agent.name
+    lines.append(f"Small Blind (${env.small_blind}): {small_blind}")
+    lines.append(f"Big Blind (${env.big_blind}): {big_blind}")
+
+    # Print community cards
+    if env.community_cards:
+        community_str = ", ".join([f"{rank} of {suit}" for rank, suit in env.community_cards])
+        lines.append(f"\nCommunity Cards: {community_str}")
+    else:
+        lines.append("\nCommunity Cards: None")
+
+    # Print pot and current bet
+    lines.append(f"\nPot: ${env.pot}")
+    lines.append(f"Current Bet: ${env.current_bet}")
+    lines.append(f"Players Remaining: {env.total_players}")
+
+    # Print player information
+    lines.append("\nPLAYER STATUS:")
+    lines.append("-"*80)
+    for curr in env.table.occupied():
+        agent = curr.agent
+        position = "Small Blind" if curr == env.table.get_small_blind() else \
+                  "Big Blind" if curr == env.table.get_big_blind() else \
+                  "Player"
+
+        status = "FOLDED" if agent.folded else "ACTIVE"
+
+        lines.append(f"\nPlayer: {agent.name} ({position}) - {status}")
+
+        if env.round_stage == "Round Over" or agent.name == "User":
+            hand_str = ", ".join([f"{rank} of {suit}" for rank, suit in agent.hand]) if not agent.folded else "FOLDED"
+            lines.append(f"Hand: {hand_str}")
+        else:
+            lines.append("Hand: Hidden")
+
+        lines.append(f"Stack: ${agent.stack}")
+        lines.append(f"Current Bet: ${agent.current_contribution}")
+        lines.append(f"Net Profit: ${agent.net_profit}")
+        if agent.previous_action:
+            action, amount = agent.previous_action
+            action_str = f"Last Action: {action.upper()}"
+            if amount > 0:
+                action_str += f" ${amount}"
+            lines.append(action_str)
+        lines.append("-"*40)
+    lines.append("\n")
+    return "\n".join(lines)
+
+
+class ConsolePrinter(EventSink):
+    """
+    Pretty-prints events to the terminal, as the environment originally did.
+    """
+
+    def emit(self, event, env, **data):
+        handler = getattr(self, f"_on_{event}", None)
+        if handler is not None:
+            handler(env, **data)
+
+    def _on_init(self, env):
+        print("Initializing frontend...")
+
+    def _on_stage(self, env):
+        print(format_game_state(env))
+
+    def _on_runout(self, env, equities):
+        print("All-in: dealing the rest of the board")
+        if equities:
+            for agent, equity in equities.items():
+                print(f"{agent.name}: {equity:.1%} equity")
+        print(format_game_state(env))
+
+    def _on_betting_round(self, env):
+        print("\n" + "="*80)
+        print(f"{env.round_stage} ACTION".center(80))
+        print("="*80)
+
+    def _on_turn(self, env, agent):
+        print("="*80)
+        print(f"Stack: {agent.stack}")
+        print(f"Current Bet: {agent.current_contribution}")
+        print(f"Net Profit: {agent.net_profit}")
+        print(f"Raiser: {agent is env.betting.last_aggressor}")
+        print(f"Still to act: {env.betting.pending()}")
+        print("="*80)
+
+    def _on_action(self, env, agent, action, amount):
+        print("\n" + "="*80)
+        print("CURRENT PLAYER ACTION".center(80))
+        print("="*80)
+        print(f"Player: {agent.name}")
+        action_str = f"Action: {action.upper()}"
+        if amount > 0:
+            action_str += f" ${amount}"
+        print(action_str)
+        print("="*80 + "\n")
+
+    def _on_skip(self, env, agent):
+        print(f"{agent.name} has folded")
+
+    def _on_timeout(self, env, agent, action):
+        print(f"{agent.name} ran out of time and will {action}")
+
+    def _on_betting_closed(self, env, last_aggressor, actions):
+        print("="*80)
+        if env.total_players == 1:
+            print("Everyone else folded")
+        elif last_aggressor is not None:
+            print(f"Everyone called {last_aggressor.name}'s raise or folded")
+        else:
+            print("All agents have settled")
+        print(f"Total Actions: {actions}")
+        print("="*80)
+
+    def _on_round_over(self, env, winner, hand_type):
+        if hand_type == "Last Man Standing":
+            print(f"{winner.name} won the round because they did not fold.")
+        else:
+            print(f"{winner.name} won the round with a {hand_type}")
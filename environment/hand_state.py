@@ -0,0 +1,242 @@
+"""
+Compact, self-contained state of one hand for search agents.
+
+HandState keeps everything a search needs to branch on a hand in a few
+flat lists and ints: stacks, street contributions and chips put in over
+the whole hand per seat, folded and settled seats as bitmasks, pot, current
+bet, street, seat to act, hole cards and board. apply() and deal() push
+an undo record onto an action stack and undo() pops it, so a search can
+walk a tree in place; clone() copies only the per-seat lists (N <= 10) and
+shares the immutable cards.
+
+Seats are numbered in table order from the head. The per-action rules are
+those of PokerEnv._apply_action (raise-to amounts capped at the stack, a
+raise not above the current bet is a call, call amounts computed by the
+engine), actions are checked by legal_actions.py exactly as PokerEnv checks
+them, and a street closes once no live seat with chips is unsettled.
+Board cards are chance events: when a street opens, `cards_needed()` says
+how many cards to deal() before the runout is complete.
+"""
+
+from utils.cards import encode_cards
+from utils.hand_evaluator import evaluate_cards
+from .legal_actions import ACTIONS, legal_actions
+from .pot_manager import settle_pots
+
+PREFLOP, FLOP, TURN, RIVER, SHOWDOWN = 0, 1, 2, 3, 4
+STREETS = ("Pre-Flop", "Flop", "Turn", "River")
+STREET_INDEX = {name: index for index, name in enumerate(STREETS)}
+BOARD_SIZE = (0, 3, 4, 5, 5)
+
+
+class HandState:
+    """
+    One hand in progress. Use start() for a fresh hand or
+    PokerEnv.hand_state() for the hand an environment is playing.
+    """
+
+    def __init__(self, stacks, contributions, pot, current_bet, street, to_act,
+                 first_to_act, hole_cards, board=(), folded=0, settled=0, big_blind=0,
+                 invested=None):
+        """
+        :param stacks: chips behind for every seat
+        :param contributions: chips each seat has put in on this street
+        :param pot: chips in the pot, including this street's contributions
+        :param current_bet: the amount to match on this street
+        :param street: PREFLOP .. RIVER
+        :param to_act: seat to act
+        :param first_to_act: seat that opens every street
+        :param hole_cards: a pair of cards per seat, or None where unknown
+        :param board: community cards dealt so far
+        :param folded: bitmask of folded seats
+        :param settled: bitmask of seats that need not act again this street
+        :param big_blind: the big blind, which is also the smallest bet
+        :param invested: chips each seat has put in over the hand, which
+                         decides the side pots (default: `contributions`)
+        """
+        self.num_players = len(stacks)
+        self.stacks = list(stacks)
+        self.contributions = list(contributions)
+        self.invested = list(contributions if invested is None else invested)
+        self.initial_stacks = tuple(self.stacks)
+        self.pot = pot
+        self.current_bet = current_bet
+        self.street = street
+        self.to_act = to_act
+        self.first_to_act = first_to_act
+        self.hole_cards = tuple(None if hand is None else tuple(encode_cards(hand)) for hand in hole_cards)
+        self.board = tuple(encode_cards(board))
+        self.folded = folded
+        self.settled = settled
+        self.big_blind = big_blind
+        self.live = self.num_players - bin(folded).count("1")
+        self._undo = []
+
+    @classmethod
+    def start(cls, stacks, hole_cards, small_blind, big_blind, small_blind_seat=0):
+        """
+        A fresh hand: post the blinds from `small_blind_seat` and the next seat,
+        with the seat after the big blind to act, as PokerEnv does.
+        """
+        n = len(stacks)
+        stacks = list(stacks)
+        contributions = [0] * n
+        for offset, blind in ((0, small_blind), (1, big_blind)):
+            seat = (small_blind_seat + offset) % n
+            stacks[seat] -= blind
+            contributions[seat] += blind
+        first = (small_blind_seat + 2) % n
+        state = cls(stacks, contributions, small_blind + big_blind, big_blind,
+                    PREFLOP, first, first, hole_cards, big_blind=big_blind)
+        state.initial_stacks = tuple(stack + paid for stack, paid in zip(stacks, contributions))
+        state.to_act = state._next_pending(first)
+        return state
+
+    def clone(self):
+        """
+        An independent copy of the current state with an empty undo stack.
+        Cards are immutable tuples and are shared.
+        """
+        state = HandState.__new__(HandState)
+        state.__dict__.update(self.__dict__)
+        state.stacks = self.stacks[:]
+        state.contributions = self.contributions[:]
+        state.invested = self.invested[:]
+        state._undo = []
+        return state
+
+    def is_terminal(self):
+        return self.live == 1 or self.street == SHOWDOWN
+
+    def cards_needed(self):
+        """
+        Board cards that must be dealt before the current street can be played.
+        """
+        return BOARD_SIZE[self.street] - len(self.board)
+
+    def legal_actions(self):
+        """
+        LegalActions for the seat to act.
+        """
+        seat = self.to_act
+        return legal_actions(self.current_bet, self.contributions[seat], self.stacks[seat], self.big_blind)
+
+    def apply(self, action, amount=0):
+        """
+        Apply `action` ("fold", "check", "call" or "raise" to `amount`) for the
+        seat to act and move on to the next seat or street. Illegal actions
+        are replaced as LegalActions.validate() describes.
+        Returns the (action, amount) actually applied.
+        """
+        if self.is_terminal():
+            raise ValueError("The hand is over.")
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action '{action}'.")
+
+        seat = self.to_act
+        stack = self.stacks[seat]
+        contribution = self.contributions[seat]
+        action, amount = self.legal_actions().validate(action, amount)
+        applied = (action, amount)
+        if action == "raise":
+            amount -= contribution
+
+        self._undo.append((seat, stack, contribution, self.contributions, self.pot, self.current_bet,
+                           self.folded, self.settled, self.live, self.street))
+
+        bit = 1 << seat
+        if action == "fold":
+            self.folded |= bit
+            self.live -= 1
+        elif amount:
+            self.stacks[seat] -= amount
+            self.contributions[seat] += amount
+            self.invested[seat] += amount
+            self.pot += amount
+            if action == "raise":
+                self.current_bet = self.contributions[seat]
+                self.settled = self.folded
+        self.settled |= bit
+
+        self._advance(seat)
+        return applied
+
+    def deal(self, cards):
+        """
+        Add community cards.
+        """
+        self._undo.append((None, self.board))
+        self.board = self.board + tuple(encode_cards(cards))
+
+    def undo(self):
+        """
+        Revert the last apply() or deal().
+        """
+        record = self._undo.pop()
+        if record[0] is None:
+            self.board = record[1]
+        else:
+            (seat, stack, contribution, contributions, self.pot, self.current_bet,
+             self.folded, self.settled, self.live, self.street) = record
+            self.contributions = contributions
+            self.invested[seat] -= stack - self.stacks[seat]
+            self.stacks[seat] = stack
+            contributions[seat] = contribution
+            self.to_act = seat
+
+    def payoffs(self):
+        """
+        Chips won or lost by every seat since the state was created, once the
+        hand is over. A showdown needs the full board and the hole cards of
+        every live seat. Main and side pots are settled from `invested` as in
+        PokerEnv, odd chips going to the winners nearest the small blind.
+        """
+        if not self.is_terminal():
+            raise ValueError("The hand is not over.")
+        live = [seat for seat in range(self.num_players) if not self.folded >> seat & 1]
+        if len(live) == 1:
+            payouts = {live[0]: self.pot}
+        else:
+            if len(self.board) != 5 or any(self.hole_cards[seat] is None for seat in live):
+                raise ValueError("A showdown needs the full board and every live hand.")
+            ranks = {seat: evaluate_cards(list(self.hole_cards[seat] + self.board)) for seat in live}
+            # The small blind sits two seats before the first to act
+            position = {seat: (seat - self.first_to_act + 2) % self.num_players
+                        for seat in range(self.num_players)}
+            payouts = settle_pots(dict(enumerate(self.invested)), ranks, position)
+
+        return [
+            stack + payouts.get(seat, 0) - initial
+            for seat, (stack, initial) in enumerate(zip(self.stacks, self.initial_stacks))
+        ]
+
+    def _next_pending(self, start):
+        """
+        The first live seat with chips that is not settled, at or after
+        `start`, or -1.
+        """
+        for offset in range(self.num_players):
+            seat = (start + offset) % self.num_players
+            if not (self.folded | self.settled) >> seat & 1 and self.stacks[seat] > 0:
+                return seat
+        return -1
+
+    def _advance(self, seat):
+        if self.live == 1:
+            self.to_act = -1
+            return
+        self.to_act = self._next_pending(seat + 1)
+        while self.to_act == -1:
+            # Street over: start the next one, running the board out while
+            # fewer than two live seats have chips to bet with
+            self.contributions = [0] * self.num_players
+            self.current_bet = 0
+            self.settled = 0
+            self.street += 1
+            if self.street == SHOWDOWN:
+                return
+            self.to_act = self._next_pending(self.first_to_act)
+            can_bet = sum(1 for s in range(self.num_players)
+                          if not self.folded >> s & 1 and self.stacks[s] > 0)
+            if can_bet < 2:
+                self.to_act = -1
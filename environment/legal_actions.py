@@ -0,0 +1,118 @@
+"""
+The legal actions at a decision point, computed in one place.
+
+PokerEnv, HandState and VecPokerEnv compute the legal actions once per
+decision point and hand them to the agent. They also run the agent's answer
+through validate(), so illegal actions are handled the same way everywhere:
+
+- fold is legal only when facing a bet, check only when not
+- call is legal when facing a bet; short stacks call all-in for less
+- raise is legal when the stack covers more than the call. Raises are
+  *to* an amount between min_raise and max_raise (all-in), where
+  min_raise = max(2 * current bet, big blind), or all-in if that is less
+- an illegal raise becomes a call if calling is legal, otherwise a check
+- any other illegal action becomes a check if checking is legal,
+  otherwise a fold
+
+The set of actions is a bitmask whose bits follow the order of ACTIONS.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+ACTIONS = ("fold", "check", "call", "raise")
+FOLD, CHECK, CALL, RAISE = 1, 2, 4, 8
+ACTION_BITS = {name: 1 << index for index, name in enumerate(ACTIONS)}
+
+
+class LegalActions(namedtuple("LegalActions", ["mask", "current_bet", "call_amount", "min_raise", "max_raise"])):
+    """
+    Legal actions for the player to act.
+
+    mask:         bitmask of FOLD, CHECK, CALL and RAISE
+    current_bet:  the amount to match on this street
+    call_amount:  chips a call puts in (less than the bet when all-in)
+    min_raise:    smallest legal raise-to amount (0 if raising is illegal)
+    max_raise:    largest legal raise-to amount, i.e. all-in (0 if illegal)
+    """
+    __slots__ = ()
+
+    def can(self, action):
+        return bool(self.mask & ACTION_BITS.get(action, 0))
+
+    def actions(self):
+        """
+        The legal action names, in ACTIONS order.
+        """
+        return [action for action in ACTIONS if self.mask & ACTION_BITS[action]]
+
+    def validate(self, action, amount=0):
+        """
+        The legal (action, amount) closest to what was asked for. Calls
+        always put in call_amount and raises are clamped to
+        [min_raise, max_raise]; a raise to no more than the current bet is a call.
+        """
+        if action == "raise" and self.mask & RAISE:
+            if amount <= self.current_bet:
+                action = "call"
+            else:
+                return "raise", min(max(amount, self.min_raise), self.max_raise)
+        elif action == "raise":
+            action = "call"
+
+        if not self.mask & ACTION_BITS.get(action, 0):
+            action = "check" if self.mask & CHECK else "fold"
+        if action == "call":
+            return "call", self.call_amount
+        return action, 0
+
+
+@lru_cache(maxsize=8192)
+def legal_actions(current_bet, contribution, stack, big_blind):
+    """
+    LegalActions for a player with `stack` chips behind who has put
+    `contribution` in on this street. Results are cached, as the same few
+    (bet, contribution, stack) combinations come up over and over.
+    """
+    owed = max(current_bet - contribution, 0)
+    mask = (FOLD | CALL) if owed else CHECK
+    min_raise = max_raise = 0
+    if stack > owed:
+        mask |= RAISE
+        max_raise = stack + contribution
+        min_raise = min(max(2 * current_bet, big_blind), max_raise)
+    return LegalActions(mask, current_bet, min(owed, stack), min_raise, max_raise)
+
+
+def legal_action_arrays(current_bet, contribution, stack, big_blind):
+    """
+    legal_actions() over arrays: returns (mask, call_amount, min_raise, max_raise).
+    """
+    owed = np.maximum(current_bet - contribution, 0)
+    can_raise = stack > owed
+    mask = np.where(owed > 0, FOLD | CALL, CHECK) | np.where(can_raise, RAISE, 0)
+    max_raise = np.where(can_raise, stack + contribution, 0)
+    min_raise = np.minimum(np.maximum(2 * current_bet, big_blind), max_raise)
+    return mask, np.minimum(owed, stack), min_raise, max_raise
+
+
+def validate_arrays(actions, amounts, current_bet, mask, call_amount, min_raise, max_raise):
+    """
+    LegalActions.validate() over arrays of action indices (positions in
+    ACTIONS) and amounts. Returns new (actions, amounts) arrays.
+    """
+    fold, check, call, raise_ = range(len(ACTIONS))
+    actions = np.asarray(actions, dtype=np.int64).copy()
+    amounts = np.asarray(amounts, dtype=np.int64).copy()
+
+    raises = actions == raise_
+    actions[raises & (((mask & RAISE) == 0) | (amounts <= current_bet))] = call
+
+    illegal = (mask & (1 << actions)) == 0
+    actions = np.where(illegal, np.where(mask & CHECK, check, fold), actions)
+
+    amounts = np.where(actions == raise_, np.clip(amounts, min_raise, max_raise),
+                       np.where(actions == call, call_amount, 0))
+    return actions, amounts
@@ -1,23 +1,55 @@
+import asyncio
 import random
 import time
-from itertools import combinations
-from utils.utils import evaluate_hand, compare_hands
-from .poker_table import PokerTable
-from game_objects.poker_game_animations import PokerGameAnimations
-import pygame
-from components.button import Button
+from utils.equity import showdown_equity
+from utils.rng import AGENT, DECK, hand_stream, role_seeds
+from utils.utils import hand_rank, hand_category
+from .events import ConsolePrinter, NullSink, format_game_state
+from .betting_round import BettingRound
+from .hand_state import HandState, STREET_INDEX
+from .legal_actions import legal_actions
+from .poker_table import MAX_SEATS, PokerTable
+from .pot_manager import PotManager
 
 class PokerEnv:
     """
     A simple environment to manage a multi-agent poker game.
     """
 
-    def __init__(self, agents, buy_in, screen):
+    def __init__(self, agents, buy_in, screen=None, event_sink=None, headless=False, ev_adjusted=False,
+                 seed=None, table_id=0):
         """
         :param agents: List of agent instances (e.g. [ConservativeAgent(...), AggressiveAgent(...), ...])
         :param buy_in: starting amount in dollars for each player
         :param screen: pygame screen object
+        :param event_sink: EventSink receiving game events (default: ConsolePrinter)
+        :param headless: no screen and no terminal I/O; events go to a NullSink
+                         unless an event_sink is given. pygame is never imported.
+        :param ev_adjusted: when an all-in ends the betting early, compute each
+                            live player's showdown equity and credit the
+                            difference between equity share and actual
+                            winnings to agent.all_in_adjustment
+        :param seed: root seed (a non-negative int). Every hand then shuffles
+                     its deck and gives each agent agent.rng from streams of
+                     (seed, table_id, hand index) (see utils/rng.py). Without
+                     a seed the global `random` module is used.
+        :param table_id: this table's key under `seed`
         """
+        if headless and screen is not None:
+            raise ValueError("A headless environment cannot have a screen.")
+        if event_sink is None:
+            event_sink = NullSink() if headless else ConsolePrinter()
+        self.event_sink = event_sink
+        self.headless = headless
+        self.ev_adjusted = ev_adjusted
+        self.all_in_equity = None         # {agent: equity} after an all-in runout
+
+        # Random streams: the deck's, and each agent's agent.rng, are reseeded
+        # for every hand when a seed is given
+        self.seed = seed
+        self.table_id = table_id
+        self.hand_index = 0
+        self.rng = random if seed is None else random.Random()
 
         self.agents = agents
         self.buy_in = buy_in
@@ -32,7 +64,9 @@ class PokerEnv:
         # Game state variables
         self.community_cards = []         # Current community cards
         self.pot = 0
+        self.pots = PotManager()          # What each player put in this hand
         self.current_bet = 0
+        self._seed_hand()
         self.deck = self._create_deck()
         
         self.small_blind = buy_in // 10
@@ -44,36 +78,42 @@ class PokerEnv:
 
         self.total_players = self.table.size()
 
+        # Seat whose agent is currently deciding, if any, and the state of
+        # the current (or last) betting round
+        self.action_seat = None
+        self.betting = None
+
         self.screen = screen
 
         self.running = True
 
         # Initialize frontend, replace with pygame later, which will be defined in init_frontend()
-        print("Initializing frontend...")
+        self.event_sink.emit("init", self)
         
 
     def reset(self):
         """
         Reset or start a new round of poker. Shuffle deck, deal cards, reset pots, etc.
         """
+        self.hand_index += 1
+        self._seed_hand()
 
         # reset agent specific state
-        curr = self.table.get_head()
-        for _ in range(self.table.size()):
+        for curr in self.table.occupied():
             # If an agent busted (stack <= 0), reset them to buy_in
             if curr.agent.stack < self.big_blind:
                 curr.agent.stack = self.buy_in
             curr.agent.hand = []
             curr.agent.folded = False
-            curr.agent.is_raiser = False
-            curr.agent.settled = False
             curr.agent.current_contribution = 0
             curr.agent.previous_action = None
-            curr = curr.next
         
         # Reset round-specific state
+        self.all_in_equity = None
+        self.betting = None
         self.community_cards = []
         self.pot = 0
+        self.pots.reset()
         self.current_bet = 0
         self.total_players = self.table.size()
         
@@ -90,6 +130,54 @@ class PokerEnv:
         Play a complete poker game from start to finish.
         Deals hands, reveals community cards, and manages betting rounds.
         """
+        return self._drive(self._play_hand())
+
+    async def play_async(self, decision_timeout=None):
+        """
+        Play a complete hand like play(), asking agents through
+        decide_action_async so other tables on the event loop keep running
+        while an agent thinks.
+
+        :param decision_timeout: seconds each decision may take; an agent that
+                                 runs out of time checks if it can, else folds
+        """
+        hand = self._play_hand()
+        try:
+            request = next(hand)
+            while True:
+                agent, agent_state = request
+                decision = await self._decide_async(agent, agent_state, decision_timeout)
+                request = hand.send(decision)
+        except StopIteration as stop:
+            return stop.value
+
+    async def _decide_async(self, agent, agent_state, decision_timeout):
+        try:
+            return await asyncio.wait_for(agent.decide_action_async(agent_state), decision_timeout)
+        except asyncio.TimeoutError:
+            legal = agent_state["legal_actions"]
+            decision = ("check", 0) if legal.can("check") else ("fold", 0)
+            self.event_sink.emit("timeout", self, agent=agent, action=decision[0])
+            return decision
+
+    def _drive(self, decisions):
+        """
+        Run a decision generator (_play_hand or _betting_round) to completion,
+        answering each (agent, game_state) request with agent.decide_action.
+        """
+        try:
+            request = next(decisions)
+            while True:
+                agent, agent_state = request
+                request = decisions.send(agent.decide_action(agent_state))
+        except StopIteration as stop:
+            return stop.value
+
+    def _play_hand(self):
+        """
+        The body of play() as a generator: yields (agent, game_state) for every
+        decision and expects the agent's (action, amount) back.
+        """
             
         # If we've already started a game, reset for a new round
         if self.started:
@@ -99,46 +187,29 @@ class PokerEnv:
     
         self.round_stage = "Dealing Hands"
         self._deal_hand()
-        self.print_game_state()  # After dealing hands
+        self.event_sink.emit("stage", self)  # After dealing hands
 
         self.round_stage = "Blinds"
         self._blinds()
-        self.print_game_state()  # After blinds
+        self.event_sink.emit("stage", self)  # After blinds
 
         # Pre-Flop
         self.round_stage = "Pre-Flop"
-        self.step()
-        self.print_game_state()  # After pre-flop betting
-
-        # Flop (first 3 community cards)
-        if not self.is_game_over():
-            flop_cards = [self.deck.pop() for _ in range(3)]
-            self.community_cards.extend(flop_cards)
-            self.round_stage = "Flop"
-            all_in_players = len([agent for agent in self.agents if agent.folded or agent.stack == 0])
-            if all_in_players < len(self.agents) - 1:
-                self.step()
-            self.print_game_state()  # After flop betting
-
-        # Turn (4th community card)
-        if not self.is_game_over():
-            turn_card = self.deck.pop()
-            self.community_cards.append(turn_card)
-            self.round_stage = "Turn"
-            all_in_players = len([agent for agent in self.agents if agent.folded or agent.stack == 0])
-            if all_in_players < len(self.agents) - 1:
-                self.step()
-            self.print_game_state()  # After turn betting
-        
-        # River (5th community card)
-        if not self.is_game_over():
-            river_card = self.deck.pop()
-            self.community_cards.append(river_card)
-            self.round_stage = "River"
-            all_in_players = len([agent for agent in self.agents if agent.folded or agent.stack == 0])
-            if all_in_players < len(self.agents) - 1:
-                self.step()
-            self.print_game_state()  # After river betting
+        yield from self._betting_round()
+        self.event_sink.emit("stage", self)  # After pre-flop betting
+
+        # Flop (3 community cards), then the turn and the river
+        for stage, num_cards in (("Flop", 3), ("Turn", 1), ("River", 1)):
+            if self.is_game_over():
+                break
+            if self.betting.active - self.betting.all_in < 2:
+                # Nobody can bet any more: deal the rest of the board at once
+                self._run_out()
+                break
+            self.community_cards.extend(self.deck.pop() for _ in range(num_cards))
+            self.round_stage = stage
+            yield from self._betting_round()
+            self.event_sink.emit("stage", self)  # After this street's betting
 
         # Determine the winner and end the round
         self._end_game()
@@ -147,114 +218,137 @@ class PokerEnv:
         return "game_over"
         
 
-    def step(self):
+    def _run_out(self):
         """
-        Progress one betting round. Query each agent in turn for an action,
-        starting from self.action_index.
-        """ 
-        curr_action_agent = self.table.get_action()
-        previous_action = None
-        total_actions = 0
+        All-in fast path: deal the remaining board in one go and skip the
+        streets nobody can bet on. With ev_adjusted, first record every live
+        player's equity: their expected share of the whole pot, summed over
+        the main and side pots they can win.
+        """
+        if self.ev_adjusted:
+            live = [agent for agent in self.agents if not agent.folded]
+            expected = dict.fromkeys(live, 0.0)
+            for pot in self.pots.pots(live):
+                if len(pot.eligible) == 1:
+                    expected[pot.eligible[0]] += pot.amount
+                    continue
+                # Seeded from the hand's stream, so seeded runs stay reproducible
+                equities = showdown_equity([agent.hand for agent in pot.eligible], self.community_cards,
+                                           seed=self.rng.getrandbits(64))
+                for agent, equity in zip(pot.eligible, equities):
+                    expected[agent] += equity * pot.amount
+            self.all_in_equity = {agent: chips / self.pot for agent, chips in expected.items()}
+        self.community_cards.extend(self.deck.pop() for _ in range(5 - len(self.community_cards)))
+        self.round_stage = "River"
+        self.event_sink.emit("runout", self, equities=self.all_in_equity)
 
-        print("\n" + "="*80)
-        print(f"{self.round_stage} ACTION".center(80))
-        print("="*80)
-        
-        while True:
-            if self.total_players == 1:
-                    break
-            
-            if not curr_action_agent.agent.folded and curr_action_agent.agent.stack > 0:
-                print("="*80)
-                print(f"Stack: {curr_action_agent.agent.stack}")
-                print(f"Current Bet: {curr_action_agent.agent.current_contribution}")
-                print(f"Net Profit: {curr_action_agent.agent.net_profit}")
-                print(f"Settled: {curr_action_agent.agent.settled}")
-                print(f"Raiser: {curr_action_agent.agent.is_raiser}")
-                print("="*80)
+    def step(self):
+        """
+        Play one betting round, querying each agent in turn for an action
+        starting from the table's action seat.
+        """
+        self._drive(self._betting_round())
 
-                if curr_action_agent.agent.is_raiser:
+    def _betting_round(self):
+        """
+        The body of step() as a generator, yielding (agent, game_state) for
+        every decision. A BettingRound keeps the counters that decide when
+        the round is over, so each action costs O(1).
+        """
+        betting = self.betting = BettingRound(self.table, self.table.get_action())
+        previous_action = None
+        emit = self.event_sink.emit
+
+        emit("betting_round", self)
+
+        while not betting.closed:
+            seat = betting.to_act
+            agent = seat.agent
+            if agent.folded or agent.stack == 0:
+                # Folded and all-in players have nothing left to decide
+                emit("skip", self, agent=agent)
+                betting.advance()
+                continue
+
+            emit("turn", self, agent=agent)
+            agent_state = {
+                "game_stage": self.round_stage,
+                "previous_action": previous_action,
+                "hand": agent.hand,
+                "community_cards": self.community_cards,
+                "pot": self.pot,
+                "num_players": self.total_players,
+                "current_bet": self.current_bet,
+                "buy_in": self.buy_in,
+                "small_blind": self.small_blind,
+                "big_blind": self.big_blind,
+            }
+            self.action_seat = seat
+            if agent.requires_hand_state:
+                agent_state["hand_state"] = self.hand_state(viewer=agent)
+
+            # Computed once per decision; whatever the agent answers is
+            # checked against it here and nowhere else
+            legal = self.legal_actions(agent)
+            agent_state["legal_actions"] = legal
+            decision = yield agent, agent_state
+            action, amount = legal.validate(*decision)
+            agent.previous_action = (action, amount)
+            self._apply_action(agent, action, amount)
+            betting.record(agent, action)
+
+            emit("action", self, agent=agent, action=action, amount=amount)
+            betting.advance()
+
+        emit("betting_closed", self, last_aggressor=betting.last_aggressor, actions=betting.actions)
+        self.action_seat = None
+        self.current_bet = 0
 
-                    # at original raiser, need to reset bets.
+        for agent in self.agents:
+            agent.net_profit -= agent.current_contribution
+            agent.current_contribution = 0
 
-                    settled_count = len([agent for agent in self.agents if agent.settled])
+    def legal_actions(self, agent):
+        """
+        LegalActions for `agent` at the current bet.
+        """
+        return legal_actions(self.current_bet, agent.current_contribution, agent.stack, self.big_blind)
 
-                    print("="*80)
-                    print("At original raiser")
-                    print(f"Settled Agents: {settled_count}")
-                    print(f"Total Players: {len(self.agents)}")
-                    print("="*80)
+    def hand_state(self, viewer=None):
+        """
+        A HandState snapshot of the hand in progress, with seats in table order
+        from the head and the agent currently asked to act (if any) to act.
 
-                    if len(self.agents) - settled_count == 1:
-                        print("Everyone called raise or folded")
-                        break                 
+        :param viewer: if given, only this agent's hole cards are included
+        """
+        seats = list(self.table.occupied())
+        agents = [seat.agent for seat in seats]
+        # Between rounds nobody has acted on the coming street yet
+        betting = self.betting if self.action_seat is not None else None
+        folded = settled = 0
+        for index, agent in enumerate(agents):
+            if agent.folded:
+                folded |= 1 << index
+            elif betting is not None and betting.is_settled(agent):
+                settled |= 1 << index
+
+        first_to_act = seats.index(self.table.get_action())
+        return HandState(
+            stacks=[agent.stack for agent in agents],
+            contributions=[agent.current_contribution for agent in agents],
+            pot=self.pot,
+            current_bet=self.current_bet,
+            street=STREET_INDEX.get(self.round_stage, 0),
+            to_act=first_to_act if self.action_seat is None else seats.index(self.action_seat),
+            first_to_act=first_to_act,
+            hole_cards=[agent.hand if viewer is None or agent is viewer else None for agent in agents],
+            board=self.community_cards,
+            folded=folded,
+            settled=settled,
+            big_blind=self.big_blind,
+            invested=[self.pots.contributions.get(agent, 0) for agent in agents],
+        )
 
-                    self.current_bet = 0
-        
-                    for agent in self.agents:
-                        agent.net_profit -= agent.current_contribution
-                        agent.current_contribution = 0
-                        agent.is_raiser = False
-
-                agent_state = {
-                    "game_stage": self.round_stage,
-                    "previous_action": previous_action,
-                    "hand": curr_action_agent.agent.hand,
-                    "community_cards": self.community_cards,
-                    "pot": self.pot,
-                    "current_bet": self.current_bet,
-                    "buy_in": self.buy_in,
-                    "small_blind": self.small_blind,
-                    "big_blind": self.big_blind,
-                }
-                action, amount = curr_action_agent.agent.decide_action(agent_state)
-                self._apply_action(curr_action_agent.agent, action, amount)
-
-                # Print current player's action in a formatted way
-                print("\n" + "="*80)
-                print("CURRENT PLAYER ACTION".center(80))
-                print("="*80)
-                print(f"Player: {curr_action_agent.agent.name}")
-                action_str = f"Action: {action.upper()}"
-                if amount > 0:
-                    action_str += f" ${amount}"
-                print(action_str)
-                print("="*80 + "\n")
-
-                total_actions += 1
-            
-            else:
-                print(f"{curr_action_agent.agent.name} has folded")
-                total_actions += 1
-        
-            if total_actions == len(self.agents):
-                settled_count = len([agent for agent in self.agents if agent.settled])
-                if settled_count == len(self.agents):
-                    print("="*80)
-                    print("All agents have settled")
-                    print(f"Settled Agents: {len([agent for agent in self.agents if agent.settled])}")
-                    print(f"Total Players: {len(self.agents)}")
-                    print(f"Total Actions: {total_actions}")
-                    print("="*80)
-                    break
-                else:
-                    print("="*80)
-                    print("Not all agents have settled")
-                    print(f"Settled Agents: {len([agent for agent in self.agents if agent.settled])}")
-                    print(f"Total Players: {len(self.agents)}")
-                    print(f"Total Actions: {total_actions}")
-                    print("="*80)
-                    total_actions = 0
-
-            curr_action_agent = curr_action_agent.next
-        
-        self.current_bet = 0
-        
-        for agent in self.agents:
-            agent.net_profit -= agent.current_contribution
-            agent.current_contribution = 0
-            agent.is_raiser = False
-    
     def rotate(self):
         self.table.move_positions()
     
@@ -264,10 +358,7 @@ class PokerEnv:
             
     def _end_game(self):
         winner, hand_type = self._determine_winner()
-        if hand_type == "Last Man Standing":
-            print(f"{winner.name} won the round because they did not fold.")
-        else:
-            print(f"{winner.name} won the round with a {hand_type}")
+        self.event_sink.emit("round_over", self, winner=winner, hand_type=hand_type)
 
     def _deal_hand(self):
         """
@@ -276,12 +367,10 @@ class PokerEnv:
         player_hands = {agent.name: [] for agent in self.agents}
 
         for _ in range(2):
-            curr = self.table.get_head()
-            for _ in range(self.table.size()):
+            for curr in self.table.occupied():
                 curr_hand = self.deck.pop()
                 curr.agent.hand.append(curr_hand)
                 player_hands[curr.agent.name].append(curr_hand)
-                curr = curr.next
 
     def _blinds(self):
         """
@@ -292,44 +381,40 @@ class PokerEnv:
         small_blind_agent.agent.stack -= self.small_blind
         small_blind_agent.agent.current_contribution += self.small_blind
         self.pot += self.small_blind
+        self.pots.add(small_blind_agent.agent, self.small_blind)
 
         # Big Blind
         big_blind_agent = self.table.get_big_blind()
         big_blind_agent.agent.stack -= self.big_blind
         big_blind_agent.agent.current_contribution += self.big_blind
         self.pot += self.big_blind
+        self.pots.add(big_blind_agent.agent, self.big_blind)
         self.current_bet = self.big_blind
 
     def _apply_action(self, agent, action, amount):
         """
         Apply the agent's action (fold, call, raise, etc.) to the game state.
+        The action must already be legal (see LegalActions.validate); a raise
+        amount is the total the agent raises to.
         """
         if action == "fold":
             agent.folded = True
-            agent.settled = True
             self.total_players -= 1
 
         elif action == "call":
             agent.stack -= amount
             agent.current_contribution += amount
             self.pot += amount   
-            agent.settled = True
+            self.pots.add(agent, amount)
 
         elif action == "raise":
-            agent.stack -= (amount - agent.current_contribution)
+            increment = amount - agent.current_contribution
+            agent.stack -= increment
             self.current_bet = amount 
-            agent.current_contribution += (amount - agent.current_contribution)
-            self.pot += agent.current_contribution
-            agent.is_raiser = True
-            for curr_agent in self.agents:
-                if not curr_agent.folded:
-                    curr_agent.settled = False
-                if curr_agent.name != agent.name:
-                    curr_agent.is_raiser = False
-    
-        elif action == "check":
-            agent.settled = True
-                    
+            agent.current_contribution += increment
+            self.pot += increment
+            self.pots.add(agent, increment)
+
     def is_game_over(self):
         """
         The game is over if only one player remains or if we've revealed all 5 community cards.
@@ -341,11 +426,22 @@ class PokerEnv:
         """
         Create a standard 52-card deck and shuffle it.
         """
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-        suits = ['hearts', 'clubs', 'diamonds', 'spades']
-        deck = [(rank, suit) for rank in ranks for suit in suits]
-        random.shuffle(deck)
-        return deck
+        return shuffled_deck(self.rng)
+
+    def _seed_hand(self):
+        """
+        With a seed, reseed the deck's stream and every seated agent's
+        agent.rng for hand `hand_index`. An agent's stream is keyed by its
+        table seat, so it does not change when others sit in or out.
+        """
+        if self.seed is None:
+            return
+        seeds = role_seeds(self.seed, self.table_id, self.hand_index, AGENT + MAX_SEATS)
+        self.rng.seed(seeds[DECK])
+        for seat in self.table.occupied():
+            if seat.agent.rng is random:
+                seat.agent.rng = random.Random()
+            seat.agent.rng.seed(seeds[AGENT + seat.index])
     
     def _determine_winner(self):
         """
@@ -359,55 +455,40 @@ class PokerEnv:
             self.pot = 0
             return winner, "Last Man Standing"
         
-        # Otherwise, compare the best 5-card hands for each active player
-        player_hands = []
-        player = self.table.get_head()
-        for _ in range(self.table.size()):
+        # Otherwise, rank each live player's best hand once and settle the
+        # main and side pots with those ranks
+        ranks = {}
+        position = {}
+        for distance, player in enumerate(self.table.occupied(self.table.get_small_blind())):
+            position[player.agent] = distance
             if not player.agent.folded:
-                # Combine community cards with player's hole cards
-                all_cards = self.community_cards + player.agent.hand
-                best_hand = None
-                best_hand_value = None
-                
-                # Evaluate all possible 5-card combinations
-                for five_cards in combinations(all_cards, 5):
-                    if best_hand is None:
-                        best_hand = five_cards
-                        best_hand_value = evaluate_hand(five_cards)
-                    else:
-                        current_value = evaluate_hand(five_cards)
-                        if compare_hands(five_cards, best_hand) == 1:
-                            best_hand = five_cards
-                            best_hand_value = current_value
-                
-                player_hands.append((player.agent, best_hand, best_hand_value))
-            player = player.next
-        
-        # Find the winner(s) – compare best hands
-        winners = [player_hands[0]]
-        for hand_info in player_hands[1:]:
-            comparison = compare_hands(hand_info[1], winners[0][1])
-            if comparison > 0:
-                winners = [hand_info]
-            elif comparison == 0:
-                winners.append(hand_info)
-        
-        # Split pot among all tying winners
-        split_amount = self.pot // len(winners)
-        for winner_data in winners:
-            winner_player, _, _ = winner_data
-            winner_player.stack += split_amount
-            winner_player.net_profit += split_amount
+                ranks[player.agent] = hand_rank(self.community_cards + player.agent.hand)
+        payouts = self.pots.settle(ranks, position)
+        for agent, won in payouts.items():
+            agent.stack += won
+            agent.net_profit += won
+
+        # EV-adjusted results: credit the equity share instead of the runout
+        if self.all_in_equity is not None:
+            for agent, equity in self.all_in_equity.items():
+                agent.all_in_adjustment += equity * self.pot - payouts.get(agent, 0)
         
         self.pot = 0
-        
-        # Return the first winner and their hand type (e.g., "Flush", "Straight", etc.)
-        return winners[0][0], winners[0][2][0]
+
+        # Return the first winner of the main pot and their hand type
+        # (e.g., "Flush", "Straight", etc.)
+        best_rank = max(ranks.values())
+        winner = min((agent for agent, rank in ranks.items() if rank == best_rank), key=position.get)
+        return winner, hand_category(best_rank)
 
     def _init_frontend(self):
         """
         Initialize the animations for the game.
         """
+        # Imported here so headless environments never load pygame
+        import pygame
+        from components.button import Button
+        from game_objects.poker_game_animations import PokerGameAnimations
 
         self.clock = pygame.time.Clock()
         self.running = True
@@ -492,6 +573,8 @@ class PokerEnv:
         """
         Helper method to update and draw all UI elements
         """
+        import pygame
+
         # Update animations
         self.animations.update(dt)
 
@@ -516,58 +599,39 @@ class PokerEnv:
         Prints a formatted view of the current game state including all player information,
         community cards, pot, and current betting information.
         """
-        print("\n" + "="*80)
-        print(f"{self.round_stage} RESULTS".center(80))
-        print("="*80)
+        print(format_game_state(self))
 
-        # Print dealer, small blind, and big blind positions
-        small_blind = self.table.get_small_blind().agent.name
-        big_blind = self.table.get_big_blind().agent.name
-        print(f"Small Blind (${self.small_blind}): {small_blind}")
-        print(f"Big Blind (${self.big_blind}): {big_blind}")
 
-        # Print community cards
-        if self.community_cards:
-            community_str = ", ".join([f"{rank} of {suit}" for rank, suit in self.community_cards])
-            print(f"\nCommunity Cards: {community_str}")
-        else:
-            print("\nCommunity Cards: None")
-
-        # Print pot and current bet
-        print(f"\nPot: ${self.pot}")
-        print(f"Current Bet: ${self.current_bet}")
-        print(f"Players Remaining: {self.total_players}")
-
-        # Print player information
-        print("\nPLAYER STATUS:")
-        print("-"*80)
-        curr = self.table.get_head()
-        for _ in range(self.table.size()):
-            agent = curr.agent
-            position = "Small Blind" if curr == self.table.get_small_blind() else \
-                      "Big Blind" if curr == self.table.get_big_blind() else \
-                      "Player"
-            
-            status = "FOLDED" if agent.folded else "ACTIVE"
-            
-            print(f"\nPlayer: {agent.name} ({position}) - {status}")
+def shuffled_deck(rng=random):
+    """
+    A standard 52-card deck shuffled with `rng`; cards are dealt from the end.
+    """
+    ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+    suits = ['hearts', 'clubs', 'diamonds', 'spades']
+    deck = [(rank, suit) for rank in ranks for suit in suits]
+    rng.shuffle(deck)
+    return deck
 
-            if self.round_stage == "Round Over" or agent.name == "User":
-                hand_str = ", ".join([f"{rank} of {suit}" for rank, suit in agent.hand]) if not agent.folded else "FOLDED"
-                print(f"Hand: {hand_str}")
-            else:
-                print("Hand: Hidden")
-            
-            print(f"Stack: ${agent.stack}")
-            print(f"Current Bet: ${agent.current_contribution}")
-            print(f"Net Profit: ${agent.net_profit}")
-            if agent.previous_action:
-                action, amount = agent.previous_action
-                action_str = f"Last Action: {action.upper()}"
-                if amount > 0:
-                    action_str += f" ${amount}"
-                print(action_str)
-            print("-"*40)
-            
-            curr = curr.next
-        print("\n")
\ No newline at end of file
+
+def hand_deck(seed, table_id, hand_index):
+    """
+    The deck a PokerEnv seeded with `seed` and `table_id` shuffled for hand
+    `hand_index` (0 for its first hand), e.g. to replay one hand of a large
+    simulation without logging its cards.
+    """
+    return shuffled_deck(hand_stream(seed, table_id, hand_index, DECK))
+
+
+async def play_tables(envs, num_hands=1, decision_timeout=None):
+    """
+    Play `num_hands` hands at each environment, all tables concurrently on the
+    running event loop, moving the blinds after every hand.
+
+    :param decision_timeout: per-decision deadline in seconds (see play_async)
+    """
+    async def run(env):
+        for _ in range(num_hands):
+            await env.play_async(decision_timeout)
+            env.rotate()
+
+    await asyncio.gather(*(run(env) for env in envs))
@@ -1,34 +1,78 @@
+from constants import SEAT_POSITIONS
+
+# One seat per position drawn on the table
+MAX_SEATS = len(SEAT_POSITIONS)
+
+
 class Node:
     """
-    A Node in a poker table as an agent and pointer to the next node.
+    A seat at a poker table: its seat index, the agent sitting there (None if
+    the seat is empty) and a pointer to the next occupied seat.
+
+    Seats are created once per table and keep their identity while agents sit
+    in and out, so references to them (blind and action pointers) stay valid.
     """
-    def __init__(self, agent):
-        self.agent = agent
-        self.next = None
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+        self.agent = None
+
+    @property
+    def next(self):
+        return self.table.seats[self.table._next[self.index]]
+
+    def is_empty(self):
+        return self.agent is None
 
 
 class PokerTable:
     """
-    A circular singly linked list implementation of a poker table.
-    Ensures at least two players in the table.
+    A ring of MAX_SEATS seats backed by a fixed array. Each seat stores the
+    index of the next occupied seat and the table keeps the occupied seats in
+    order from the head, so following `.next`, sitting in and out, seat and
+    position lookup and moving the blinds are all constant time (any
+    relinking is bounded by MAX_SEATS). Ensures at least two players in the table.
     """
     def __init__(self, agents):
         """
         Constructor that takes a list of agents. Enforces that there are at least two agents.
+        The agents are seated in order from seat 0.
         """
         if len(agents) < 2:
             raise ValueError("At least two players are required at a poker table.")
+        if len(agents) > MAX_SEATS:
+            raise ValueError(f"A poker table has at most {MAX_SEATS} seats.")
 
-        self.head = None
+        self.seats = [Node(self, index) for index in range(MAX_SEATS)]
+        self._next = list(range(MAX_SEATS))
+        self._order = []    # occupied seat indices, from the head
+        self._seat_of = {}
         self._size = 0
+        self.head = None
 
-        # Initialize the circular list
         for agent in agents:
             self.add(agent)
 
         # Set pointers: small_blind, big_blind, action
         self._update_positions()
 
+    def _relink(self):
+        """
+        Recompute the next-occupied-seat index of every seat and the
+        occupied seats in order from the head.
+        """
+        occupied = [seat.index for seat in self.seats if seat.agent is not None]
+        if not occupied:
+            self._order = []
+            return
+        start = occupied.index(self.head.index)
+        self._order = occupied[start:] + occupied[:start]
+        following = occupied[0]
+        for index in range(MAX_SEATS - 1, -1, -1):
+            self._next[index] = following
+            if self.seats[index].agent is not None:
+                following = index
+
     def _update_positions(self):
         """
         Update the three pointers (small_blind, big_blind, action) based on current list size.
@@ -41,7 +85,7 @@ class PokerTable:
 
         # Action pointer is the next node after big_blind
         self.action = self.big_blind.next
-    
+
     def move_positions(self):
         """
         Move the action pointer to the next player.
@@ -50,84 +94,114 @@ class PokerTable:
         self.big_blind = self.big_blind.next
         self.action = self.action.next
 
-    def add(self, agent):
+    def sit_in(self, agent, seat=None):
         """
-        Add a new node with 'agent' to the end of the circular list.
+        Seat 'agent' at seat index 'seat', or by default at the first empty
+        seat after the last player (so the agent joins the end of the ring).
+        Returns the seat. The blind and action pointers do not move.
         """
-        new_node = Node(agent)
-        
+        if agent in self._seat_of:
+            raise ValueError(f"{agent.name} is already seated.")
+        if seat is None:
+            seat = self._free_seat()
+        elif not 0 <= seat < MAX_SEATS:
+            raise IndexError("Seat out of range.")
+        elif self.seats[seat].agent is not None:
+            raise ValueError(f"Seat {seat} is taken.")
+
+        node = self.seats[seat]
+        node.agent = agent
+        self._seat_of[agent] = seat
+        self._size += 1
         if self.head is None:
-            # List is empty; new node points to itself
-            self.head = new_node
-            new_node.next = new_node
+            self.head = node
+        self._relink()
+        return node
+
+    def _free_seat(self):
+        """
+        The first empty seat clockwise from the last player before the head.
+        """
+        start = 0 if self.head is None else self.head.index
+        for offset in range(1, MAX_SEATS + 1):
+            index = (start - offset) % MAX_SEATS
+            if self.seats[index].agent is not None:
+                break
         else:
-            # Traverse to the last node (one that links back to head)
-            current = self.head
-            while current.next != self.head:
-                current = current.next
-            
-            # Insert the new node at the end
-            current.next = new_node
-            new_node.next = self.head
+            return start
+        for offset in range(1, MAX_SEATS):
+            if self.seats[(index + offset) % MAX_SEATS].agent is None:
+                return (index + offset) % MAX_SEATS
+        raise ValueError("The table is full.")
+
+    def sit_out(self, agent):
+        """
+        Empty the seat of 'agent', keeping the blinds where they are: a blind
+        or action pointer on the emptied seat moves on to the next player.
+        Returns the emptied seat. Enforces that at least two players remain.
+        """
+        if agent not in self._seat_of:
+            raise ValueError(f"{agent.name} is not seated at this table.")
+        if self._size <= 2:
+            raise ValueError("Cannot remove. A poker table must have at least two players.")
+
+        node = self.seats[self._seat_of.pop(agent)]
+        following = node.next
+        node.agent = None
+        self._size -= 1
+        if self.head is node:
+            self.head = following
+        self._relink()
+
+        if node in (self.small_blind, self.big_blind, self.action):
+            if self.small_blind is node:
+                self.small_blind = node.next
+            self.big_blind = self.small_blind.next
+            self.action = self.big_blind.next
+        return node
 
-        self._size += 1
+    def add(self, agent):
+        """
+        Add a new node with 'agent' to the end of the ring: the first empty
+        seat after the last player. When every seat between the last player
+        and the head is taken, the agent fills the first gap instead.
+        """
+        self.sit_in(agent)
 
     def remove(self, agent):
         """
-        Remove the node that contains 'agent' from the list.
-        If the agent is not found, this method does nothing.
+        Remove the node that contains 'agent' from the list and reset the
+        blinds to the head. If the agent is not found, this method does nothing.
 
         Enforces that removing a node does not reduce the list size below 2.
         """
-        if self.head is None:
-            # List is empty, nothing to remove
+        if agent not in self._seat_of:
             return
-        
-        current = self.head
-        prev = None
-        
-        while True:
-            if current.agent == agent:
-                # Found the node to remove
-                if prev is None:
-                    # We're removing the head node
-                    # Case 1: There's only one node in the list
-                    if current.next == self.head:
-                        # This would leave 0 players, not allowed
-                        raise ValueError("Cannot remove. A poker table must have at least two players.")
-                    else:
-                        # We need to find the last node to fix its .next pointer
-                        tail = self.head
-                        while tail.next != self.head:
-                            tail = tail.next
-                        self.head = current.next
-                        tail.next = self.head
-                else:
-                    # Removing a non-head node
-                    prev.next = current.next
-                
-                self._size -= 1
-
-                # Check if removing leaves fewer than 2 players
-                if self._size < 2:
-                    # Undo removal, restore node (to strictly enforce 2+ players):
-                    if prev is None:
-                        # Rare edge case (but we've already handled it above)
-                        pass
-                    else:
-                        prev.next = current
-                    self._size += 1
-                    raise ValueError("Cannot remove. A poker table must have at least two players.")
-                
-                self._update_positions()
-                return
-
-            prev = current
-            current = current.next
-            
-            # If we've looped back to head, the agent is not in the list
-            if current == self.head:
-                break
+        self.sit_out(agent)
+        self._update_positions()
+
+    def seat(self, index):
+        """
+        The seat with seat index 'index', occupied or not.
+        """
+        return self.seats[index]
+
+    def seat_of(self, agent):
+        """
+        The seat 'agent' is sitting in, or None.
+        """
+        index = self._seat_of.get(agent)
+        return None if index is None else self.seats[index]
+
+    def occupied(self, start=None):
+        """
+        Iterate over the occupied seats once around the table, from 'start'
+        (an occupied seat, default the head).
+        """
+        node = start or self.head
+        for _ in range(self._size):
+            yield node
+            node = node.next
 
     def get(self, index):
         """
@@ -136,21 +210,17 @@ class PokerTable:
         """
         if index < 0 or index >= self._size:
             raise IndexError("Index out of range.")
-        
-        current = self.head
-        for _ in range(index):
-            current = current.next
-        return current.agent
-    
+        return self.seats[self._order[index]].agent
+
     def get_head(self):
         return self.head
-    
+
     def get_action(self):
         return self.action
 
     def get_small_blind(self):
         return self.small_blind
-    
+
     def get_big_blind(self):
         return self.big_blind
 
@@ -167,15 +237,8 @@ class PokerTable:
         if self.head is None:
             print("List is empty.")
             return
-        
-        current = self.head
-        result = []
-        while True:
-            result.append(current.agent.name)
-            current = current.next
-            if current == self.head:
-                break
-        
+
+        result = [node.agent.name for node in self.occupied()]
         print(" -> ".join(result) + " (back to head)")
 
         # Optionally print the pointers for clarity:
@@ -0,0 +1,128 @@
+"""
+Main and side pots built from what every player put in over the hand.
+
+Players are sorted once by total contribution. Walking that order, each
+new contribution level closes a pot that holds the level's increment from
+every player who reached it. Only live (non-folded) players who reached it
+can win it. A pot only the bettor reached returns their uncalled chips.
+
+At showdown every player's rank key is computed once by the caller. One
+backward pass over the same order gives the best live hands of every
+suffix, i.e. the winners of every pot, so settling is O(n log n). Split pots
+are shared evenly, and odd chips go one each to the tied winners closest
+to the left of the button (the small blind first).
+"""
+
+from collections import namedtuple
+
+Pot = namedtuple("Pot", ["amount", "eligible"])
+
+
+def build_pots(contributions, live):
+    """
+    The pots, main pot first.
+
+    :param contributions: {player: chips put in this hand}
+    :param live: players who have not folded
+    :return: list of Pot(amount, eligible players)
+    """
+    order = sorted(contributions, key=contributions.get)
+    pots = []
+    previous = 0
+    carry = 0
+    for index, player in enumerate(order):
+        level = contributions[player]
+        if level > previous:
+            amount = (level - previous) * (len(order) - index) + carry
+            carry = 0
+            eligible = tuple(other for other in order[index:] if other in live)
+            if eligible:
+                pots.append(Pot(amount, eligible))
+            elif pots:
+                # Only folded players reached this level: it goes with the pot below
+                pots[-1] = Pot(pots[-1].amount + amount, pots[-1].eligible)
+            else:
+                carry = amount
+            previous = level
+    return pots
+
+
+def settle_pots(contributions, ranks, position):
+    """
+    Award every pot in one pass.
+
+    :param contributions: {player: chips put in this hand}
+    :param ranks: {player: rank key} for the live players; higher wins
+    :param position: {player: seat distance from the small blind}, which
+                     decides who gets odd chips
+    :return: {player: chips won} for every player who won something
+    """
+    order = sorted(contributions, key=contributions.get)
+
+    # winners[i]: the best live hands among order[i:]
+    winners = [()] * len(order)
+    best = None
+    current = ()
+    for index in range(len(order) - 1, -1, -1):
+        rank = ranks.get(order[index])
+        if rank is not None:
+            if best is None or rank > best:
+                best, current = rank, (order[index],)
+            elif rank == best:
+                current = current + (order[index],)
+        winners[index] = current
+
+    payouts = {}
+    previous = 0
+    carry = 0
+    last_winners = ()
+    for index, player in enumerate(order):
+        level = contributions[player]
+        if level <= previous:
+            continue
+        amount = (level - previous) * (len(order) - index) + carry
+        previous = level
+        # Nobody live reached this level: it goes with the pot below
+        pot_winners = winners[index] or last_winners
+        if not pot_winners:
+            carry = amount
+            continue
+        carry = 0
+        last_winners = pot_winners
+
+        share, odd_chips = divmod(amount, len(pot_winners))
+        for rank_order, winner in enumerate(sorted(pot_winners, key=position.get)):
+            payouts[winner] = payouts.get(winner, 0) + share + (rank_order < odd_chips)
+    return payouts
+
+
+class PotManager:
+    """
+    Tracks each player's total contribution to the hand and settles the
+    main and side pots at showdown.
+    """
+
+    def __init__(self):
+        self.contributions = {}
+
+    def reset(self):
+        self.contributions = {}
+
+    def add(self, player, amount):
+        if amount:
+            self.contributions[player] = self.contributions.get(player, 0) + amount
+
+    def total(self):
+        return sum(self.contributions.values())
+
+    def pots(self, live):
+        """
+        Main pot first, then side pots, as Pot(amount, eligible players).
+        """
+        return build_pots(self.contributions, set(live))
+
+    def settle(self, ranks, position):
+        """
+        {player: chips won}; see settle_pots.
+        """
+        return settle_pots(self.contributions, ranks, position)
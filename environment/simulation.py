@@ -0,0 +1,177 @@
+"""
+Multi-table simulation runner.
+
+Shards independent headless PokerEnv tables across worker processes. Every
+table draws its randomness from the streams of (seed, table id, hand) and
+builds its own agents from the agent configuration. Workers stream per-hand
+results back in batches over a queue, and the parent aggregates net profit,
+hands played and bb/100 per seat while the run progresses.
+"""
+
+import multiprocessing
+import time
+import traceback
+
+from agents.aggressive_agent import AggressiveAgent
+from agents.passive_agent import PassiveAgent
+from agents.random_agent import RandomAgent
+from reasoning.rule_based import RuleBasedReasoning
+from .poker_game import PokerEnv
+
+AGENT_TYPES = {
+    "random": RandomAgent,
+    "passive": PassiveAgent,
+    "aggressive": AggressiveAgent,
+}
+
+DEFAULT_AGENTS = ("random", "random", "passive", "aggressive")
+
+
+def seat_name(seat, kind):
+    return f"Seat {seat + 1} ({kind})"
+
+
+def build_agents(agent_kinds, reasoning_engine):
+    """
+    Create one agent per seat from a list of AGENT_TYPES keys.
+    """
+    agents = []
+    for seat, kind in enumerate(agent_kinds):
+        if kind not in AGENT_TYPES:
+            raise ValueError(f"Unknown agent type '{kind}'. Choose from {sorted(AGENT_TYPES)}.")
+        agents.append(AGENT_TYPES[kind](seat_name(seat, kind), reasoning_engine))
+    return agents
+
+
+def _run_tables(table_ids, hands_per_table, buy_in, agent_kinds, seed, batch_size, ev_adjusted, results):
+    """
+    Worker body: play every table in `table_ids` and push batches of
+    (table_id, hand_index, per-seat profit) tuples onto `results`. With
+    `ev_adjusted`, all-in hands count each seat's equity share instead.
+    Finishes with a ("done", None) message, or ("error", traceback).
+    """
+    try:
+        # One reasoning engine per worker, so its caches are shared by
+        # every table the worker plays
+        reasoning_engine = RuleBasedReasoning()
+        for table_id in table_ids:
+            agents = build_agents(agent_kinds, reasoning_engine)
+            env = PokerEnv(agents, buy_in, None, headless=True, ev_adjusted=ev_adjusted,
+                           seed=seed, table_id=table_id)
+
+            def profits():
+                return [agent.net_profit + agent.all_in_adjustment for agent in agents]
+
+            batch = []
+            for hand_index in range(hands_per_table):
+                before = profits()
+                env.play()
+                env.rotate()
+                batch.append((table_id, hand_index,
+                              tuple(after - start for after, start in zip(profits(), before))))
+                if len(batch) >= batch_size:
+                    results.put(("hands", batch))
+                    batch = []
+            if batch:
+                results.put(("hands", batch))
+        results.put(("done", None))
+    except Exception:
+        results.put(("error", traceback.format_exc()))
+
+
+class SimulationResult:
+    """
+    Per-seat totals of a simulation run.
+    """
+
+    def __init__(self, agent_kinds, big_blind):
+        self.names = [seat_name(seat, kind) for seat, kind in enumerate(agent_kinds)]
+        self.big_blind = big_blind
+        self.net_profit = [0] * len(agent_kinds)
+        self.hands_played = 0
+        self.elapsed = 0.0
+
+    def add(self, batch):
+        for _, _, profits in batch:
+            for seat, profit in enumerate(profits):
+                self.net_profit[seat] += profit
+        self.hands_played += len(batch)
+
+    def bb_per_100(self, seat):
+        if not self.hands_played:
+            return 0.0
+        return self.net_profit[seat] / self.big_blind / self.hands_played * 100
+
+    def summary(self):
+        """
+        {name: {"net_profit", "hands_played", "bb_per_100"}} for every seat.
+        """
+        return {
+            name: {
+                "net_profit": self.net_profit[seat],
+                "hands_played": self.hands_played,
+                "bb_per_100": self.bb_per_100(seat),
+            }
+            for seat, name in enumerate(self.names)
+        }
+
+
+def run_simulation(num_tables, hands_per_table, processes=None, seed=0,
+                   agent_kinds=DEFAULT_AGENTS, buy_in=20, batch_size=256, on_batch=None,
+                   ev_adjusted=False):
+    """
+    Play `num_tables` independent tables of `hands_per_table` hands each.
+
+    :param processes: worker processes (default: all cores, at most one per table)
+    :param seed: root seed (a non-negative int); hand h of table t draws from
+                 the streams of (seed, t, h), so results do not depend on how
+                 tables are sharded and any hand's deck can be rebuilt with
+                 poker_game.hand_deck(seed, t, h)
+    :param agent_kinds: AGENT_TYPES key for each seat
+    :param batch_size: hands per message sent back by a worker
+    :param on_batch: optional callback receiving each batch as it arrives
+    :param ev_adjusted: score all-in hands by equity rather than by the runout,
+                        which lowers the variance of bb/100
+    :return: SimulationResult
+    """
+    agent_kinds = list(agent_kinds)
+    build_agents(agent_kinds, None)  # validate before starting workers
+
+    processes = min(processes or multiprocessing.cpu_count(), num_tables)
+    shards = [list(range(worker, num_tables, processes)) for worker in range(processes)]
+
+    result = SimulationResult(agent_kinds, buy_in // 5)
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(
+            target=_run_tables,
+            args=(shard, hands_per_table, buy_in, agent_kinds, seed, batch_size, ev_adjusted, results),
+            daemon=True,
+        )
+        for shard in shards
+    ]
+
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+
+    try:
+        running = len(workers)
+        while running:
+            kind, payload = results.get()
+            if kind == "hands":
+                result.add(payload)
+                if on_batch is not None:
+                    on_batch(payload)
+            elif kind == "done":
+                running -= 1
+            else:
+                raise RuntimeError(f"Simulation worker failed:\n{payload}")
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+
+    result.elapsed = time.perf_counter() - start
+    return result
@@ -0,0 +1,300 @@
+"""
+Vectorized lockstep environment over many tables.
+
+VecPokerEnv keeps the state of B tables of N seats in NumPy arrays (stacks,
+street contributions, folded/settled flags, pots, hole cards and boards)
+and advances every table by one decision per step() call. Each table is
+always waiting on exactly one seat, `to_act`; when a hand ends the table's
+rewards are reported and the next hand is dealt straight away (auto-reset).
+
+The betting rules are those of PokerEnv: actions are checked against the
+legal actions of legal_actions.py (the observation carries them as a
+bitmask plus raise bounds) and illegal ones replaced the same way, then
+
+- a raise is a raise *to* `amount`
+- a call matches the current bet or puts the seat all-in
+- every action settles the acting seat; a raise unsettles every other live seat
+
+Blinds, positions and rebuys also follow PokerEnv: the small blind moves one
+seat per hand, the first seat after the big blind opens every street, and a
+seat that starts a hand with less than a big blind is topped back up to the
+buy-in. A street ends once no live seat with chips is left unsettled, and
+hands are settled with main and side pots like PokerEnv's.
+"""
+
+import numpy as np
+
+from utils.batch_evaluator import evaluate_batch
+from utils.cards import FULL_DECK
+from .legal_actions import ACTIONS, legal_action_arrays, validate_arrays
+
+# Action indices; the legal-action bitmask has bit 1 << index set for each
+FOLD, CHECK, CALL, RAISE = 0, 1, 2, 3
+ACTION_INDEX = {name: index for index, name in enumerate(ACTIONS)}
+
+PREFLOP, FLOP, TURN, RIVER = 0, 1, 2, 3
+STREETS = ("Pre-Flop", "Flop", "Turn", "River")
+BOARD_SIZE = (0, 3, 4, 5)
+
+_DECK = np.array(FULL_DECK, dtype=np.int64)
+
+
+class VecPokerEnv:
+    """
+    B independent tables of N seats stepped in lockstep.
+    """
+
+    def __init__(self, num_tables, num_players, buy_in, seed=None):
+        """
+        :param num_tables: number of tables B
+        :param num_players: seats per table N (at least two)
+        :param buy_in: starting stack; blinds are buy_in // 10 and buy_in // 5
+        :param seed: seed for the shuffles
+        """
+        if num_players < 2:
+            raise ValueError("At least two players are required at a poker table.")
+        self.num_tables = num_tables
+        self.num_players = num_players
+        self.buy_in = buy_in
+        self.small_blind = buy_in // 10
+        self.big_blind = buy_in // 5
+        self.rng = np.random.default_rng(seed)
+
+        shape = (num_tables, num_players)
+        self.stacks = np.zeros(shape, dtype=np.int64)
+        self.contributions = np.zeros(shape, dtype=np.int64)  # this street
+        self.invested = np.zeros(shape, dtype=np.int64)       # this hand
+        self.net_profit = np.zeros(shape, dtype=np.int64)
+        self.folded = np.zeros(shape, dtype=bool)
+        self.settled = np.zeros(shape, dtype=bool)
+        self.hole_cards = np.zeros(shape + (2,), dtype=np.int64)
+        self.board = np.zeros((num_tables, 5), dtype=np.int64)  # dealt up front, shown by street
+        self.pot = np.zeros(num_tables, dtype=np.int64)
+        self.current_bet = np.zeros(num_tables, dtype=np.int64)
+        self.total_players = np.zeros(num_tables, dtype=np.int64)
+        self.street = np.zeros(num_tables, dtype=np.int8)
+        self.button = np.zeros(num_tables, dtype=np.int64)    # small blind seat
+        self.to_act = np.zeros(num_tables, dtype=np.int64)
+        self.hands_played = np.zeros(num_tables, dtype=np.int64)
+
+        self._tables = np.arange(num_tables)
+        self._seats = np.arange(num_players)
+        self.reset()
+
+    def reset(self):
+        """
+        Reset every table to full stacks with seat 0 in the small blind and
+        deal the first hand.
+        """
+        self.stacks[:] = self.buy_in
+        self.net_profit[:] = 0
+        self.button[:] = 0
+        self.hands_played[:] = 0
+        self._start_hands(np.ones(self.num_tables, dtype=bool))
+        return self.observation()
+
+    def step(self, actions, amounts=None):
+        """
+        Apply one action at every table, for the seat in `to_act`.
+
+        :param actions: (B,) action indices (FOLD, CHECK, CALL, RAISE)
+        :param amounts: (B,) raise-to amounts; ignored for other actions
+        :return: (rewards, dones) where rewards is a (B, N) int64 array of
+                 chips won or lost in hands that ended on this step and dones
+                 flags those tables (their next hand is already dealt)
+        """
+        t = self._tables
+        seat = self.to_act
+        if amounts is None:
+            amounts = np.zeros(self.num_tables, dtype=np.int64)
+
+        stack = self.stacks[t, seat]
+        contribution = self.contributions[t, seat]
+        legal = legal_action_arrays(self.current_bet, contribution, stack, self.big_blind)
+        actions, amounts = validate_arrays(actions, amounts, self.current_bet, *legal)
+        calls = actions == CALL
+        raises = actions == RAISE
+        folds = actions == FOLD
+
+        paid = np.where(calls, amounts, np.where(raises, amounts - contribution, 0))
+        self.stacks[t, seat] -= paid
+        self.contributions[t, seat] += paid
+        self.invested[t, seat] += paid
+        self.pot += paid
+        self.current_bet = np.where(raises, amounts, self.current_bet)
+
+        self.folded[t[folds], seat[folds]] = True
+        self.total_players -= folds
+
+        self.settled[raises] = self.folded[raises]
+        self.settled[t, seat] = True
+
+        rewards = np.zeros((self.num_tables, self.num_players), dtype=np.int64)
+        dones = self.total_players == 1
+        next_seat, waiting = self._next_to_act(seat + 1)
+        self.to_act = np.where(waiting, next_seat, self.to_act)
+        street_over = ~waiting & ~dones
+        if street_over.any():
+            dones |= self._next_streets(street_over)
+        if dones.any():
+            self._finish_hands(dones, rewards)
+        return rewards, dones
+
+    def observation(self):
+        """
+        The state seen by the seat to act at every table, as (B,) or (B, k)
+        arrays. Board cards not yet dealt are 0.
+        """
+        t = self._tables
+        seat = self.to_act
+        visible = np.arange(5)[None, :] < np.array(BOARD_SIZE)[self.street][:, None]
+        stack = self.stacks[t, seat]
+        contribution = self.contributions[t, seat]
+        mask, call_amount, min_raise, max_raise = legal_action_arrays(
+            self.current_bet, contribution, stack, self.big_blind)
+        return {
+            "seat": seat.copy(),
+            "street": self.street.copy(),
+            "hand": self.hole_cards[t, seat],
+            "community_cards": np.where(visible, self.board, 0),
+            "pot": self.pot.copy(),
+            "current_bet": self.current_bet.copy(),
+            "num_players": self.total_players.copy(),
+            "stack": stack,
+            "contribution": contribution,
+            "legal_actions": mask,
+            "call_amount": call_amount,
+            "min_raise": min_raise,
+            "max_raise": max_raise,
+        }
+
+    def _next_to_act(self, start):
+        """
+        For every table, the first seat at or after `start` (cyclically) that
+        is live, has chips and is unsettled. Returns (seat, found).
+        """
+        order = (start[:, None] + self._seats[None, :]) % self.num_players
+        t = self._tables[:, None]
+        pending = ~self.folded[t, order] & ~self.settled[t, order] & (self.stacks[t, order] > 0)
+        first = pending.argmax(axis=1)
+        return order[self._tables, first], pending.any(axis=1)
+
+    def _next_streets(self, mask):
+        """
+        Close the current street at the tables in `mask` and deal until each
+        one either has a seat to act or reaches showdown. Returns the
+        (B,) mask of tables whose hand is over.
+        """
+        showdown = np.zeros(self.num_tables, dtype=bool)
+        mask = mask.copy()
+        while mask.any():
+            self.contributions[mask] = 0
+            self.current_bet[mask] = 0
+            self.settled[mask] = False
+
+            showdown |= mask & (self.street == RIVER)
+            mask &= self.street != RIVER
+            self.street[mask] += 1
+
+            # Betting only happens while two or more live seats have chips
+            can_bet = ((~self.folded & (self.stacks > 0)).sum(axis=1) >= 2) & mask
+            if can_bet.any():
+                next_seat, _ = self._next_to_act(self.button + 2)
+                self.to_act[can_bet] = next_seat[can_bet]
+            mask &= ~can_bet
+        return showdown
+
+    def _finish_hands(self, mask, rewards):
+        """
+        Award the pot at the tables in `mask`, record the rewards, then move
+        the blinds and deal the next hand there.
+        """
+        tables = self._tables[mask]
+        live = ~self.folded[tables]
+
+        # Rank every seat, then keep the best among the live seats
+        boards = np.repeat(self.board[tables, None, :], self.num_players, axis=1)
+        cards = np.concatenate([self.hole_cards[tables], boards], axis=2)
+        ranks, _ = evaluate_batch(cards.reshape(-1, 7))
+        ranks = np.where(live, ranks.reshape(len(tables), self.num_players), -1)
+        payout = self._settle_pots(self.invested[tables], ranks, self.button[tables])
+
+        rewards[tables] = payout - self.invested[tables]
+        self.stacks[tables] += payout
+        self.net_profit[tables] += rewards[tables]
+        self.hands_played[tables] += 1
+
+        self.button[tables] = (self.button[tables] + 1) % self.num_players
+        self._start_hands(mask)
+
+    def _settle_pots(self, invested, ranks, small_blind):
+        """
+        Payouts of the main and side pots at every table, as in PokerEnv
+        (see pot_manager.py): seats are sorted once by what they put in, each
+        contribution level closes a pot for the live seats that reached it,
+        and odd chips go to the winners nearest the small blind.
+        `ranks` is -1 for folded seats.
+        """
+        count, n = invested.shape
+        levels = np.sort(invested, axis=1)
+        # Seats in order from the small blind, for the odd chips
+        from_small_blind = (small_blind[:, None] + np.arange(n)) % n
+
+        payout = np.zeros_like(invested)
+        last_winners = np.zeros(invested.shape, dtype=bool)
+        previous = np.zeros(count, dtype=invested.dtype)
+        for k in range(n):
+            level = levels[:, k]
+            amount = (level - previous) * (n - k)
+            previous = level
+
+            eligible = (ranks >= 0) & (invested >= level[:, None])
+            eligible_ranks = np.where(eligible, ranks, -1)
+            winners = eligible & (eligible_ranks == eligible_ranks.max(axis=1, keepdims=True))
+            # Nobody live reached this level: it goes with the pot below
+            winners = np.where(eligible.any(axis=1)[:, None], winners, last_winners)
+            last_winners = winners
+
+            share, odd_chips = np.divmod(amount, np.maximum(winners.sum(axis=1), 1))
+            ordered = np.take_along_axis(winners, from_small_blind, axis=1)
+            odd = np.zeros_like(winners)
+            np.put_along_axis(odd, from_small_blind,
+                              ordered & (ordered.cumsum(axis=1) <= odd_chips[:, None]), axis=1)
+            payout += np.where(winners, share[:, None], 0) + odd
+        return payout
+
+    def _start_hands(self, mask):
+        """
+        Rebuy short stacks, shuffle, deal and post blinds at the tables in `mask`.
+        """
+        tables = self._tables[mask]
+        count = len(tables)
+        n = self.num_players
+
+        stacks = self.stacks[tables]
+        stacks[stacks < self.big_blind] = self.buy_in
+        self.stacks[tables] = stacks
+
+        self.contributions[tables] = 0
+        self.invested[tables] = 0
+        self.folded[tables] = False
+        self.settled[tables] = False
+        self.pot[tables] = 0
+        self.street[tables] = PREFLOP
+        self.total_players[tables] = n
+
+        # One card to each seat, then a second, then the board
+        deck = _DECK[self.rng.random((count, 52)).argsort(axis=1)]
+        self.hole_cards[tables] = deck[:, :2 * n].reshape(count, 2, n).transpose(0, 2, 1)
+        self.board[tables] = deck[:, 2 * n:2 * n + 5]
+
+        for offset, blind in ((0, self.small_blind), (1, self.big_blind)):
+            seat = (self.button[tables] + offset) % n
+            self.stacks[tables, seat] -= blind
+            self.contributions[tables, seat] += blind
+            self.invested[tables, seat] += blind
+            self.pot[tables] += blind
+        self.current_bet[tables] = self.big_blind
+
+        next_seat, _ = self._next_to_act(self.button + 2)
+        self.to_act[tables] = next_seat[tables]
@@ -0,0 +1,199 @@
+"""
+Compact, memory-mapped storage for a trained blueprint strategy.
+
+A blueprint maps information sets to action probabilities. Kept as a dict
+of lists of floats, every process playing it would have to unpickle its own
+copy. Written with write_blueprint() instead, it becomes one binary file:
+
+    header   "<4sHHIII"  magic b"BLPR", version, encoding (0 = uint8,
+                         1 = float16), width (most actions of any
+                         information set), count, slots
+    config   "<I" length, then the abstraction config as UTF-8 JSON
+    hashes   slots x uint64, open-addressing table of information-set
+             hashes, 0 marking an empty slot
+    index    slots x uint32, dense index (0 .. count-1) of each hash
+    actions  count x uint8, number of actions of each information set
+    rows     count x width probabilities, uint8 scaled by 255 (rounded so
+             every row sums to exactly 255) or float16, zero-padded
+
+Information sets are hashed with a 64-bit BLAKE2b digest of their repr, so
+the index does not depend on the process or on Python's hash seed. A key
+is found by linear probing from its hash in a table at most half full,
+which is O(1) on average. Two keys sharing a 64-bit digest is not
+detected; for the few million information sets of a blueprint it is
+vanishingly unlikely.
+
+Blueprint opens the file with a read-only mmap. Opening reads only the
+header, and every lookup is a few unpacks from the OS page cache, so any
+number of agent processes start at once and share one copy of the
+strategy.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"BLPR"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIII")
+CONFIG_LENGTH = struct.Struct("<I")
+SCALE = 255
+
+ENCODINGS = {"uint8": 0, "float16": 1}
+
+_HASH = struct.Struct("<Q")
+_INDEX = struct.Struct("<I")
+
+
+def key_hash(key):
+    """
+    The stable, non-zero 64-bit hash of an information-set key.
+    """
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=8).digest()
+    return _HASH.unpack(digest)[0] or 1
+
+
+def _quantize(probabilities):
+    """
+    uint8 levels of one row summing to exactly SCALE (largest remainders
+    round up).
+    """
+    total = sum(probabilities)
+    if total <= 0:
+        probabilities, total = [1.0] * len(probabilities), len(probabilities)
+    scaled = [p / total * SCALE for p in probabilities]
+    levels = [int(value) for value in scaled]
+    order = sorted(range(len(scaled)), key=lambda i: levels[i] - scaled[i])
+    for i in order[:SCALE - sum(levels)]:
+        levels[i] += 1
+    return levels
+
+
+def write_blueprint(path, strategy, config=None, encoding="uint8"):
+    """
+    Write `strategy` ({information set: action probabilities}) as a blueprint
+    file. The file is replaced atomically, so readers never see half of it.
+
+    :param config: JSON-serializable settings stored with the strategy,
+                   e.g. the Abstraction config it was trained with
+    :param encoding: "uint8" (1 byte per action) or "float16" (2 bytes)
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(f"encoding must be one of {', '.join(ENCODINGS)}.")
+
+    keys = list(strategy)
+    count = len(keys)
+    width = max((len(strategy[key]) for key in keys), default=0)
+    slots = 1
+    while slots < 2 * count:
+        slots *= 2
+    mask = slots - 1
+
+    hashes = np.zeros(slots, dtype="<u8")
+    index = np.zeros(slots, dtype="<u4")
+    for row, key in enumerate(keys):
+        value = key_hash(key)
+        slot = value & mask
+        while hashes[slot]:
+            if hashes[slot] == value:
+                raise ValueError(f"Information sets {keys[index[slot]]!r} and {key!r} share a hash.")
+            slot = (slot + 1) & mask
+        hashes[slot] = value
+        index[slot] = row
+
+    actions = np.array([len(strategy[key]) for key in keys], dtype="u1")
+    if encoding == "uint8":
+        rows = np.zeros((count, width), dtype="u1")
+        for row, key in enumerate(keys):
+            rows[row, :actions[row]] = _quantize(strategy[key])
+    else:
+        rows = np.zeros((count, width), dtype="<f2")
+        for row, key in enumerate(keys):
+            rows[row, :actions[row]] = strategy[key]
+
+    settings = json.dumps(config or {}).encode()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, ENCODINGS[encoding], width, count, slots))
+        f.write(CONFIG_LENGTH.pack(len(settings)))
+        f.write(settings)
+        f.write(hashes.tobytes())
+        f.write(index.tobytes())
+        f.write(actions.tobytes())
+        f.write(rows.tobytes())
+    os.replace(temporary, path)
+
+
+class Blueprint:
+    """
+    Read-only view of a blueprint file, memory-mapped on construction. It
+    answers get() like the strategy dict it was written from.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, encoding, width, count, slots = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != VERSION or encoding not in ENCODINGS.values():
+            raise ValueError(f"{path} is not a blueprint file (version {VERSION}).")
+
+        (length,) = CONFIG_LENGTH.unpack_from(self._buffer, HEADER.size)
+        start = HEADER.size + CONFIG_LENGTH.size
+        self.config = json.loads(self._buffer[start:start + length])
+        self.encoding = "uint8" if encoding == 0 else "float16"
+        self.width = width
+        self.count = count
+        self._mask = slots - 1
+        self._hashes_offset = start + length
+        self._index_offset = self._hashes_offset + slots * 8
+        self._actions_offset = self._index_offset + slots * 4
+        self._rows_offset = self._actions_offset + count
+        self._row_size = width * (1 if encoding == 0 else 2)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self.index(key) >= 0
+
+    def index(self, key):
+        """
+        The dense index (0 .. count-1) of an information set, or -1.
+        """
+        value = key_hash(key)
+        slot = value & self._mask
+        while True:
+            stored = _HASH.unpack_from(self._buffer, self._hashes_offset + slot * 8)[0]
+            if stored == value:
+                return _INDEX.unpack_from(self._buffer, self._index_offset + slot * 4)[0]
+            if stored == 0:
+                return -1
+            slot = (slot + 1) & self._mask
+
+    def row(self, index):
+        """
+        Action probabilities of the information set with dense index `index`.
+        """
+        actions = self._buffer[self._actions_offset + index]
+        offset = self._rows_offset + index * self._row_size
+        if self.encoding == "uint8":
+            return [level / SCALE for level in self._buffer[offset:offset + actions]]
+        return list(struct.unpack_from(f"<{actions}e", self._buffer, offset))
+
+    def get(self, key, default=None):
+        """
+        Action probabilities of an information set, or `default`.
+        """
+        index = self.index(key)
+        return self.row(index) if index >= 0 else default
+
+    def close(self):
+        self._buffer.close()
@@ -0,0 +1,542 @@
+"""
+External-sampling Monte Carlo CFR over an abstracted version of our game.
+
+The game is PokerEnv's no-limit hold'em for `num_players` seats with
+PokerEnv's blinds (buy_in // 10 and buy_in // 5), played on HandState.
+Stacks drift away from the buy-in as a PokerEnv session goes on, and its
+rebuys keep adding chips to the table, so every training hand deals each
+seat a stack drawn log-uniformly between one big blind and `max_stack`
+(default ten buy-ins), which covers short and deep play about equally. The abstraction:
+
+- cards: on every street a player's holding falls into one of `buckets`
+  buckets. Preflop that is its equity against the live opponents from the
+  169-class table; postflop, its hand strength against one random holding.
+- bets: fold, check or call, raises to `bet_sizes` fractions of the pot
+  (after calling), and all-in.
+- information sets are built only from what a player sees in a PokerEnv
+  game_state: street, bucket, live players, the pot in big blinds, the
+  amount to call and the effective stack relative to the pot (all on
+  doubling scales), and the abstract actions available. The effective
+  stack is capped by the deepest live opponent, so a stack grown by
+  PokerEnv's rebuys plays like the deepest stack it can lose; without a
+  hand_state in the game_state the player's own stack stands in. Raises of any size by
+  other players land on the same coarse keys. This abstraction
+  forgets the betting history (imperfect recall), but it lets the engine
+  map any PokerEnv decision to a trained information set.
+
+Each training iteration deals one hand and, with every seat in turn as the
+traverser, walks the tree. It tries every action at the traverser's nodes
+and samples one action at everybody else's, adding those players' current
+strategies to the average strategy. Iterations run in worker processes on
+a snapshot of the regret tables. Each worker returns the regret and
+strategy increments it accumulated. Every `merge_every` iterations the
+trainer adds them into its tables and, if asked, writes a checkpoint:
+
+    python -m reasoning.cfr --iterations 100000 --processes 4
+
+CFRReasoning plays the resulting average strategy through the usual
+evaluate(game_state, strategy) interface, either from a checkpoint or from
+a compact memory-mapped blueprint (reasoning/blueprint.py) that many agent
+processes share:
+
+    python -m reasoning.cfr --iterations 100000 --blueprint data/cfr_blueprint.bin
+"""
+
+import argparse
+import math
+import os
+import pickle
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from environment.hand_state import BOARD_SIZE, HandState, STREET_INDEX
+from utils.batch_evaluator import evaluate_batch
+from utils.cache import LRUCache
+from utils.cards import FULL_DECK, canonical_form, encode_cards
+from utils.hand_evaluator import evaluate_cards
+from utils.preflop import MAX_OPPONENTS, preflop_equity
+from utils.rng import stream
+
+from .blueprint import Blueprint, write_blueprint
+
+DEFAULT_BET_SIZES = (0.5, 1.0)
+DEFAULT_BUCKETS = 8
+DEFAULT_MERGE_EVERY = 1000
+
+DEFAULT_CHECKPOINT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cfr_strategy.pkl"
+)
+DEFAULT_BLUEPRINT_PATH = os.path.join(os.path.dirname(DEFAULT_CHECKPOINT_PATH), "cfr_blueprint.bin")
+CHECKPOINT_VERSION = 1
+
+_pair_indices = {}
+
+
+def _hand_strength(hole, board):
+    """
+    Share of opponent holdings the hand beats now (ties count half),
+    enumerated over every holding with the batch evaluator.
+    """
+    known = set(hole + board)
+    deck = np.array([card for card in FULL_DECK if card not in known], dtype=np.int64)
+    pairs = _pair_indices.get(len(deck))
+    if pairs is None:
+        pairs = _pair_indices[len(deck)] = np.array(np.triu_indices(len(deck), 1)).T
+    villains = np.concatenate([deck[pairs], np.tile(np.array(board, dtype=np.int64), (len(pairs), 1))], axis=1)
+    ranks, _ = evaluate_batch(villains)
+    hero = evaluate_cards(hole + board)
+    return (np.count_nonzero(ranks < hero) + np.count_nonzero(ranks == hero) / 2) / len(ranks)
+
+
+def _log_bucket(ratio, top):
+    """
+    0 for a ratio of 0, then one bucket per doubling from 1/8, up to `top`.
+    """
+    if ratio <= 0:
+        return 0
+    return min(max(int(math.log2(ratio)) + 4, 1), top)
+
+
+class Abstraction:
+    """
+    Card buckets, abstract bet sizes and information-set keys, shared by the
+    trainer and by CFRReasoning so both map a decision to the same key.
+    """
+
+    def __init__(self, bet_sizes=DEFAULT_BET_SIZES, buckets=DEFAULT_BUCKETS, cache_size=65536):
+        """
+        :param bet_sizes: raise sizes as fractions of the pot after calling
+        :param buckets: card buckets per street
+        :param cache_size: postflop spots kept in the hand-strength cache
+        """
+        self.bet_sizes = tuple(bet_sizes)
+        self.buckets = buckets
+        self.strength_cache = LRUCache(cache_size)
+
+    def config(self):
+        return {"bet_sizes": self.bet_sizes, "buckets": self.buckets}
+
+    def bucket(self, hole, board, live):
+        """
+        The bucket of encoded hole cards on an encoded board.
+        """
+        if not board:
+            strength = preflop_equity(hole, min(max(live - 1, 1), MAX_OPPONENTS))
+        else:
+            key = canonical_form(hole, board)
+            strength = self.strength_cache.get(key)
+            if strength is None:
+                strength = _hand_strength(list(key[0]), list(key[1]))
+                self.strength_cache.put(key, strength)
+        return min(int(strength * self.buckets), self.buckets - 1)
+
+    def actions(self, legal, pot):
+        """
+        The abstract actions at a decision as (label, action, amount),
+        amounts being what PokerEnv expects (raise-to totals).
+        """
+        if legal.can("check"):
+            choices = [("k", "check", 0)]
+        else:
+            choices = [("f", "fold", 0), ("c", "call", legal.call_amount)]
+        if legal.can("raise"):
+            amounts = set()
+            for size in self.bet_sizes:
+                amount = legal.current_bet + int(round(size * (pot + legal.call_amount)))
+                amount = min(max(amount, legal.min_raise), legal.max_raise)
+                if amount not in amounts and amount < legal.max_raise:
+                    amounts.add(amount)
+                    choices.append((f"r{size:g}", "raise", amount))
+            choices.append(("a", "raise", legal.max_raise))
+        return choices
+
+    def infoset(self, street, bucket, live, pot, legal, big_blind, labels, covered=None):
+        """
+        The information-set key of a decision.
+
+        :param covered: the most the deepest live opponent can put in this
+                        street (see _covered), if known
+        """
+        stack = legal.max_raise or legal.call_amount
+        if covered is not None:
+            stack = min(stack, max(covered, legal.current_bet))
+        return (street, bucket, live, _log_bucket(pot / big_blind, 10),
+                _log_bucket(legal.call_amount / pot, 6), _log_bucket(stack / pot, 7), labels)
+
+
+def _covered(state, seat):
+    """
+    The most any live opponent of `seat` in HandState `state` can have in
+    this street: their contribution plus their chips behind.
+    """
+    return max(state.stacks[other] + state.contributions[other]
+               for other in range(state.num_players)
+               if other != seat and not state.folded >> other & 1)
+
+
+def _regret_matching(regrets):
+    positive = [regret if regret > 0 else 0.0 for regret in regrets]
+    total = sum(positive)
+    if total > 0:
+        return [regret / total for regret in positive]
+    return [1.0 / len(regrets)] * len(regrets)
+
+
+class _Sampler:
+    """
+    Runs MCCFR iterations against a snapshot of the regret tables, keeping
+    the increments separately so they can be merged by the trainer.
+    """
+
+    def __init__(self, config, regrets, rng):
+        self.num_players = config["num_players"]
+        self.max_stack = config["max_stack"]
+        self.small_blind = config["buy_in"] // 10
+        self.big_blind = config["buy_in"] // 5
+        self.abstraction = Abstraction(config["bet_sizes"], config["buckets"])
+        self.base = regrets
+        self.regret_delta = {}
+        self.strategy_delta = {}
+        self.rng = rng
+
+    def _strategy(self, key, count):
+        regrets = self.regret_delta.get(key)
+        base = self.base.get(key)
+        if regrets is None:
+            return _regret_matching(base) if base is not None else [1.0 / count] * count
+        if base is not None:
+            regrets = [a + b for a, b in zip(base, regrets)]
+        return _regret_matching(regrets)
+
+    def iterate(self):
+        deck = FULL_DECK[:]
+        self.rng.shuffle(deck)
+        n = self.num_players
+        holes = [deck[2 * seat:2 * seat + 2] for seat in range(n)]
+        self.board = deck[2 * n:2 * n + 5]
+        self.holes = holes
+        self._buckets = {}
+        depth = self.max_stack / self.big_blind
+        stacks = [int(self.big_blind * depth ** self.rng.random()) for _ in range(n)]
+        state = HandState.start(stacks, holes, self.small_blind, self.big_blind)
+        for traverser in range(n):
+            self._traverse(state, traverser)
+
+    def _bucket(self, seat, street, live):
+        # Postflop buckets do not depend on the number of live players
+        key = (seat, street, live if street == 0 else 0)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            board = self.board[:BOARD_SIZE[street]]
+            bucket = self._buckets[key] = self.abstraction.bucket(self.holes[seat], board, live)
+        return bucket
+
+    def _traverse(self, state, traverser):
+        need = state.cards_needed()
+        if need > 0:
+            dealt = len(state.board)
+            state.deal(self.board[dealt:dealt + need])
+            value = self._traverse(state, traverser)
+            state.undo()
+            return value
+        if state.is_terminal():
+            return state.payoffs()[traverser] / self.big_blind
+
+        seat = state.to_act
+        legal = state.legal_actions()
+        choices = self.abstraction.actions(legal, state.pot)
+        labels = tuple(label for label, _, _ in choices)
+        bucket = self._bucket(seat, state.street, state.live)
+        key = self.abstraction.infoset(state.street, bucket, state.live, state.pot, legal, self.big_blind, labels,
+                                       _covered(state, seat))
+        strategy = self._strategy(key, len(choices))
+
+        if seat == traverser:
+            values = []
+            for _, action, amount in choices:
+                state.apply(action, amount)
+                values.append(self._traverse(state, traverser))
+                state.undo()
+            node_value = sum(p * v for p, v in zip(strategy, values))
+            delta = self.regret_delta.get(key)
+            if delta is None:
+                delta = self.regret_delta[key] = [0.0] * len(choices)
+            for index, value in enumerate(values):
+                delta[index] += value - node_value
+            return node_value
+
+        totals = self.strategy_delta.get(key)
+        if totals is None:
+            totals = self.strategy_delta[key] = [0.0] * len(choices)
+        for index, probability in enumerate(strategy):
+            totals[index] += probability
+        _, action, amount = choices[_sample(strategy, self.rng)]
+        state.apply(action, amount)
+        value = self._traverse(state, traverser)
+        state.undo()
+        return value
+
+
+def _sample(probabilities, rng):
+    roll = rng.random()
+    for index, probability in enumerate(probabilities):
+        roll -= probability
+        if roll < 0:
+            return index
+    return len(probabilities) - 1
+
+
+def _run_iterations(config, regrets, iterations, seed_key):
+    """
+    Worker body: run `iterations` MCCFR iterations on a snapshot of the
+    regret tables and return (regret increments, strategy increments).
+    """
+    sampler = _Sampler(config, regrets, stream(*seed_key))
+    for _ in range(iterations):
+        sampler.iterate()
+    return sampler.regret_delta, sampler.strategy_delta
+
+
+def _add_into(table, increments):
+    for key, delta in increments.items():
+        current = table.get(key)
+        if current is None:
+            table[key] = list(delta)
+        else:
+            for index, value in enumerate(delta):
+                current[index] += value
+
+
+class CFRTrainer:
+    """
+    Trains the abstracted game with parallel external-sampling MCCFR and
+    holds the cumulative regret and average-strategy tables.
+    """
+
+    def __init__(self, num_players=2, buy_in=20, bet_sizes=DEFAULT_BET_SIZES, buckets=DEFAULT_BUCKETS,
+                 max_stack=None, seed=0):
+        """
+        :param num_players: seats at the table
+        :param buy_in: PokerEnv's buy-in, which sets the blinds
+        :param bet_sizes: raise sizes as fractions of the pot after calling
+        :param buckets: card buckets per street
+        :param max_stack: largest stack dealt to a seat (default 10 * buy_in)
+        :param seed: root seed of the deals (see utils/rng.py)
+        """
+        self.config = {"num_players": num_players, "buy_in": buy_in,
+                       "bet_sizes": tuple(bet_sizes), "buckets": buckets,
+                       "max_stack": max_stack or 10 * buy_in}
+        self.seed = seed
+        self.regrets = {}
+        self.strategy_sum = {}
+        self.iterations = 0
+        self.merges = 0
+
+    @property
+    def abstraction(self):
+        return Abstraction(self.config["bet_sizes"], self.config["buckets"])
+
+    def train(self, iterations, processes=None, merge_every=DEFAULT_MERGE_EVERY,
+              checkpoint_path=None, checkpoint_every=1, on_merge=None):
+        """
+        Run `iterations` more iterations.
+
+        :param processes: worker processes (default: all cores); 1 trains in
+                          this process
+        :param merge_every: iterations between merges of the workers' tables
+        :param checkpoint_path: where to write checkpoints, if anywhere
+        :param checkpoint_every: merges between checkpoints
+        :param on_merge: optional callback receiving the trainer after each merge
+        """
+        processes = processes or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(max_workers=processes) if processes > 1 else None
+        try:
+            remaining = iterations
+            while remaining > 0:
+                chunk = min(merge_every, remaining)
+                shares = [chunk // processes + (worker < chunk % processes) for worker in range(processes)]
+                jobs = [(self.config, self.regrets, share, (self.seed, self.merges, worker))
+                        for worker, share in enumerate(shares) if share]
+                if pool is None:
+                    results = [_run_iterations(*job) for job in jobs]
+                else:
+                    results = list(pool.map(_run_iterations, *zip(*jobs)))
+                for regret_delta, strategy_delta in results:
+                    _add_into(self.regrets, regret_delta)
+                    _add_into(self.strategy_sum, strategy_delta)
+
+                remaining -= chunk
+                self.iterations += chunk
+                self.merges += 1
+                if checkpoint_path is not None and self.merges % checkpoint_every == 0:
+                    self.save(checkpoint_path)
+                if on_merge is not None:
+                    on_merge(self)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    def average_strategy(self):
+        """
+        {infoset: action probabilities} of the average strategy.
+        """
+        strategy = {}
+        for key, totals in self.strategy_sum.items():
+            total = sum(totals)
+            strategy[key] = [value / total for value in totals] if total > 0 else [1.0 / len(totals)] * len(totals)
+        return strategy
+
+    def save_blueprint(self, path=DEFAULT_BLUEPRINT_PATH, encoding="uint8"):
+        """
+        Write the average strategy as a blueprint file for CFRReasoning.
+        """
+        write_blueprint(path, self.average_strategy(), self.abstraction.config(), encoding)
+
+    def save(self, path=DEFAULT_CHECKPOINT_PATH):
+        """
+        Write a checkpoint. The file is replaced atomically, so an interrupted
+        run always leaves the previous checkpoint readable.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "config": self.config,
+            "seed": self.seed,
+            "iterations": self.iterations,
+            "merges": self.merges,
+            "regrets": self.regrets,
+            "strategy_sum": self.strategy_sum,
+        }
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as f:
+            pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_CHECKPOINT_PATH):
+        """
+        A trainer restored from a checkpoint, ready to train further.
+        """
+        with open(path, "rb") as f:
+            checkpoint = pickle.load(f)
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"{path} is not a version {CHECKPOINT_VERSION} CFR checkpoint.")
+        trainer = cls(seed=checkpoint["seed"], **checkpoint["config"])
+        trainer.iterations = checkpoint["iterations"]
+        trainer.merges = checkpoint["merges"]
+        trainer.regrets = checkpoint["regrets"]
+        trainer.strategy_sum = checkpoint["strategy_sum"]
+        return trainer
+
+
+class CFRReasoning:
+    """
+    Plays a trained average strategy. evaluate() maps the game_state to its
+    information set and samples an abstract action from the strategy there.
+    Agents using it should set requires_hand_state, as SearchAgent does,
+    so the information set can use the effective stack.
+    """
+
+    def __init__(self, strategy, abstraction, fallback=None, seed=None):
+        """
+        :param strategy: {infoset: action probabilities}, e.g. from
+                         CFRTrainer.average_strategy(), or a Blueprint
+        :param abstraction: the Abstraction the strategy was trained with
+        :param fallback: reasoning engine for information sets never
+                         trained (default: check, else call)
+        :param seed: seed of the engine's own random draws
+        """
+        self.strategy = strategy
+        self.abstraction = abstraction
+        self.fallback = fallback
+        self.rng = random.Random(seed)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_trainer(cls, trainer, **kwargs):
+        return cls(trainer.average_strategy(), trainer.abstraction, **kwargs)
+
+    @classmethod
+    def from_checkpoint(cls, path=DEFAULT_CHECKPOINT_PATH, **kwargs):
+        return cls.from_trainer(CFRTrainer.load(path), **kwargs)
+
+    @classmethod
+    def from_blueprint(cls, path=DEFAULT_BLUEPRINT_PATH, **kwargs):
+        blueprint = Blueprint(path)
+        return cls(blueprint, Abstraction(**blueprint.config), **kwargs)
+
+    def evaluate(self, game_state, strategy=None):
+        """
+        An (action, amount) from the trained strategy. `strategy` is accepted
+        for compatibility with the other engines; the trained strategy
+        decides on its own.
+        """
+        legal = game_state["legal_actions"]
+        hole = encode_cards(game_state["hand"])
+        board = encode_cards(game_state["community_cards"])
+        live = game_state["num_players"]
+        state = game_state.get("hand_state")
+        covered = _covered(state, state.to_act) if state is not None else None
+        choices = self.abstraction.actions(legal, game_state["pot"])
+        labels = tuple(label for label, _, _ in choices)
+        key = self.abstraction.infoset(STREET_INDEX.get(game_state["game_stage"], 0),
+                                       self.abstraction.bucket(hole, board, live), live,
+                                       game_state["pot"], legal, game_state["big_blind"], labels, covered)
+
+        probabilities = self.strategy.get(key)
+        if probabilities is None:
+            self.misses += 1
+            if self.fallback is not None:
+                return self.fallback.evaluate(game_state, strategy)
+            return ("check", 0) if legal.can("check") else ("call", legal.call_amount)
+        self.hits += 1
+        _, action, amount = choices[_sample(probabilities, self.rng)]
+        return action, amount
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the abstracted game with parallel MCCFR.")
+    parser.add_argument("--iterations", type=int, default=100_000, help="training iterations to run")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--merge-every", type=int, default=DEFAULT_MERGE_EVERY,
+                        help="iterations between merges of the workers' tables")
+    parser.add_argument("--players", type=int, default=2, help="seats at the table")
+    parser.add_argument("--buy-in", type=int, default=20, help="PokerEnv buy-in, which sets the blinds")
+    parser.add_argument("--bet-sizes", default=",".join(f"{size:g}" for size in DEFAULT_BET_SIZES),
+                        help="comma-separated raise sizes as fractions of the pot")
+    parser.add_argument("--buckets", type=int, default=DEFAULT_BUCKETS, help="card buckets per street")
+    parser.add_argument("--seed", type=int, default=0, help="root seed of the deals")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT_PATH, help="checkpoint file")
+    parser.add_argument("--resume", action="store_true", help="continue from the checkpoint file")
+    parser.add_argument("--blueprint", default=None, help="also write the average strategy as a blueprint file")
+    parser.add_argument("--encoding", choices=("uint8", "float16"), default="uint8",
+                        help="probability encoding of the blueprint file")
+    args = parser.parse_args()
+
+    if args.resume:
+        trainer = CFRTrainer.load(args.checkpoint)
+    else:
+        trainer = CFRTrainer(args.players, args.buy_in, [float(size) for size in args.bet_sizes.split(",")],
+                             args.buckets, seed=args.seed)
+
+    start = time.perf_counter()
+
+    def report(trainer):
+        elapsed = time.perf_counter() - start
+        print(f"{trainer.iterations:>10,} iterations  {len(trainer.regrets):>8,} infosets  {elapsed:>7.1f}s")
+
+    trainer.train(args.iterations, args.processes, args.merge_every, args.checkpoint, on_merge=report)
+    print(f"Wrote {args.checkpoint}")
+    if args.blueprint:
+        trainer.save_blueprint(args.blueprint, args.encoding)
+        print(f"Wrote {args.blueprint}")
+
+
+if __name__ == "__main__":
+    main()
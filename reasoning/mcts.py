@@ -0,0 +1,301 @@
+"""
+Information-set Monte Carlo tree search for live play.
+
+MCTSReasoning searches from the hand the agent is playing, which it reads
+from game_state["hand_state"] (agents using it set requires_hand_state, as
+SearchAgent does). Every iteration:
+
+- determinizes the hidden information: live opponents get random hole
+  cards and the rest of the board is drawn from the unseen cards
+- walks the tree from the root by UCB1, applying the chosen actions to a
+  clone of the hand, until it reaches an action not tried yet from there
+- adds that action's node, then plays the hand out by checking and calling
+- adds every seat's result for the hand to the nodes that seat chose
+
+Tree nodes follow the betting only; board cards come from the
+determinization. A node therefore gathers statistics over every holding
+and board consistent with what the searching player knows (single-observer
+IS-MCTS). Actions are those of the CFR abstraction (reasoning/cfr.py):
+fold, check or call, raises to fractions of the pot, and all-in.
+
+Budgets are per decision: at most `iterations` iterations and, if
+`time_limit` is set, no search past that many seconds after evaluate() was
+called. With `processes` > 1 the search is root-parallel: every worker
+process searches its own tree on its own determinizations, and the visit
+counts at the root are summed. The most visited action is played.
+
+Within a hand, each searcher keeps its tree between decisions. When the
+agent is asked again, the searcher looks for the node whose betting state
+matches the new decision, counting from the previous root, and continues
+from it with its statistics. That node can be the previous root itself,
+after a street closed with no bet. Trees are dropped when a new hand starts,
+which the searcher tells by the hole cards and the stacks the hand began with.
+"""
+
+import math
+import multiprocessing
+import random
+import time
+from collections import deque
+
+from utils.cards import FULL_DECK
+from utils.rng import stream
+
+from .cfr import Abstraction, DEFAULT_BET_SIZES
+
+DEFAULT_ITERATIONS = 2000
+DEFAULT_EXPLORATION = 0.5
+
+
+class _Node:
+    """
+    A betting state in the tree, reached by `seat` playing (action, amount).
+    """
+
+    __slots__ = ("seat", "action", "amount", "signature", "children", "visits", "value")
+
+    def __init__(self, seat, action, amount, signature):
+        self.seat = seat
+        self.action = action
+        self.amount = amount
+        self.signature = signature
+        self.children = {}
+        self.visits = 0
+        self.value = 0.0
+
+
+def _signature(state):
+    """
+    The public betting state of a HandState, which identifies a tree node.
+    """
+    return (state.street, state.to_act, state.pot, state.current_bet, state.folded, tuple(state.stacks))
+
+
+class _Searcher:
+    """
+    One IS-MCTS tree, kept across the decisions of a hand.
+    """
+
+    def __init__(self, bet_sizes=DEFAULT_BET_SIZES, exploration=DEFAULT_EXPLORATION):
+        self.abstraction = Abstraction(bet_sizes)
+        self.exploration = exploration
+        self.root = None
+        self.hand = None    # (hole cards, starting stacks) of the tree's hand
+        self.reused = 0
+
+    def _find(self, signature):
+        """
+        The node for `signature` under the current root, or None. The pot
+        never shrinks and streets only move on, so no branch past the
+        target's pot or street can lead to it.
+        """
+        street, pot = signature[0], signature[2]
+        queue = deque([self.root])
+        while queue:
+            node = queue.popleft()
+            if node.signature == signature:
+                return node
+            for child in node.children.values():
+                if child.signature[2] <= pot and child.signature[0] <= street:
+                    queue.append(child)
+        return None
+
+    def search(self, state, iterations, deadline, seed):
+        """
+        Search from HandState `state` (the hand in play, with the searching
+        seat to act) and return {label: (visits, value, action, amount)} for
+        the actions at the root.
+
+        :param deadline: time.monotonic() past which no iteration starts, or None
+        """
+        rng = random.Random(seed)
+        hero = state.to_act
+        hole = state.hole_cards[hero]
+        signature = _signature(state)
+        start = [stack + invested for stack, invested in zip(state.stacks, state.invested)]
+        # A later hand dealt the same hole cards starts from other stacks
+        hand = (hole, tuple(start))
+
+        root = None
+        if self.root is not None and self.hand == hand:
+            root = self._find(signature)
+        if root is None:
+            root = _Node(-1, None, 0, signature)
+        else:
+            self.reused += 1
+        self.root, self.hand = root, hand
+
+        # Net result of each seat over the whole hand, in units of the
+        # deepest stack it started with, so results are comparable between
+        # the decisions sharing the tree
+        scale = float(max(start[seat] for seat in range(state.num_players) if not state.folded >> seat & 1))
+        offsets = [-invested for invested in state.invested]
+
+        known = set(hole + state.board)
+        unseen = [card for card in FULL_DECK if card not in known]
+        opponents = [seat for seat in range(state.num_players)
+                     if seat != hero and not state.folded >> seat & 1]
+        to_deal = 5 - len(state.board)
+
+        for iteration in range(iterations):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            cards = rng.sample(unseen, 2 * len(opponents) + to_deal)
+            holes = list(state.hole_cards)
+            for index, seat in enumerate(opponents):
+                holes[seat] = tuple(cards[2 * index:2 * index + 2])
+            board = state.board + tuple(cards[2 * len(opponents):])
+            self._iterate(root, state, holes, board, rng, scale, offsets)
+
+        return {label: (child.visits, child.value, child.action, child.amount)
+                for label, child in root.children.items()}
+
+    def _iterate(self, root, state, holes, board, rng, scale, offsets):
+        game = state.clone()
+        game.hole_cards = tuple(holes)
+        node = root
+        path = [root]
+
+        # Selection and expansion
+        while True:
+            need = game.cards_needed()
+            if need > 0:
+                game.deal(board[len(game.board):len(game.board) + need])
+                continue
+            if game.is_terminal():
+                break
+            choices = self.abstraction.actions(game.legal_actions(), game.pot)
+            untried = [choice for choice in choices if choice[0] not in node.children]
+            seat = game.to_act
+            if untried:
+                label, action, amount = rng.choice(untried)
+                game.apply(action, amount)
+                child = node.children[label] = _Node(seat, action, amount, _signature(game))
+                path.append(child)
+                break
+            log_visits = math.log(node.visits)
+            best, best_score = None, -math.inf
+            for label, _, _ in choices:
+                child = node.children[label]
+                score = child.value / child.visits + self.exploration * math.sqrt(log_visits / child.visits)
+                if score > best_score:
+                    best, best_score = child, score
+            game.apply(best.action, best.amount)
+            node = best
+            path.append(node)
+
+        # Rollout: check or call down to the end of the hand
+        while True:
+            need = game.cards_needed()
+            if need > 0:
+                game.deal(board[len(game.board):len(game.board) + need])
+            elif game.is_terminal():
+                break
+            elif game.legal_actions().can("check"):
+                game.apply("check")
+            else:
+                game.apply("call")
+
+        payoffs = game.payoffs()
+        root.visits += 1
+        for node in path[1:]:
+            node.visits += 1
+            node.value += (payoffs[node.seat] + offsets[node.seat]) / scale
+
+
+def _worker(connection, bet_sizes, exploration):
+    """
+    Body of a search process: keep one tree, answer search requests until
+    sent None.
+    """
+    searcher = _Searcher(bet_sizes, exploration)
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        connection.send(searcher.search(*request))
+    connection.close()
+
+
+class MCTSReasoning:
+    """
+    Picks actions by information-set MCTS within a per-decision budget.
+    """
+
+    def __init__(self, iterations=DEFAULT_ITERATIONS, time_limit=None, processes=1,
+                 bet_sizes=DEFAULT_BET_SIZES, exploration=DEFAULT_EXPLORATION, seed=None):
+        """
+        :param iterations: most iterations per decision, over all processes
+        :param time_limit: most seconds per decision, if any
+        :param processes: search processes (root parallelization); 1
+                          searches in the calling process
+        :param bet_sizes: raise sizes as fractions of the pot after calling
+        :param exploration: UCB1 exploration constant
+        :param seed: seed of the engine's own random draws
+        """
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.processes = processes
+        self.bet_sizes = tuple(bet_sizes)
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self._searcher = _Searcher(self.bet_sizes, exploration) if processes == 1 else None
+        self._workers = []
+        self.last_visits = 0
+
+    def _start_workers(self):
+        context = multiprocessing.get_context()
+        for _ in range(self.processes):
+            parent, child = context.Pipe()
+            process = context.Process(target=_worker, args=(child, self.bet_sizes, self.exploration), daemon=True)
+            process.start()
+            child.close()
+            self._workers.append((process, parent))
+
+    def close(self):
+        """
+        Stop the search processes, if any.
+        """
+        for process, connection in self._workers:
+            try:
+                connection.send(None)
+            except OSError:
+                pass
+            connection.close()
+            process.join()
+        self._workers = []
+
+    def evaluate(self, game_state, strategy=None):
+        """
+        The (action, amount) of the most visited root action. `strategy`
+        is accepted for compatibility with the other engines; the search
+        decides on its own.
+        """
+        deadline = None if self.time_limit is None else time.monotonic() + self.time_limit
+        state = game_state.get("hand_state")
+        if state is None:
+            raise ValueError("MCTSReasoning needs game_state['hand_state']; "
+                             "play it with an agent that sets requires_hand_state.")
+
+        seed = self.rng.getrandbits(64)
+        if self._searcher is not None:
+            results = [self._searcher.search(state, self.iterations, deadline, seed)]
+        else:
+            if not self._workers:
+                self._start_workers()
+            for worker, (_, connection) in enumerate(self._workers):
+                share = self.iterations // self.processes + (worker < self.iterations % self.processes)
+                connection.send((state, share, deadline, stream(seed, worker).getrandbits(64)))
+            results = [connection.recv() for _, connection in self._workers]
+
+        visits = {}
+        actions = {}
+        for result in results:
+            for label, (count, _, action, amount) in result.items():
+                visits[label] = visits.get(label, 0) + count
+                actions[label] = (action, amount)
+        self.last_visits = sum(visits.values())
+        if not visits:
+            legal = game_state["legal_actions"]
+            return ("check", 0) if legal.can("check") else ("call", legal.call_amount)
+        return actions[max(visits, key=visits.get)]
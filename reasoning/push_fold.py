@@ -0,0 +1,389 @@
+"""
+Push/fold equilibrium charts for short-stacked play.
+
+With a few big blinds behind, nearly every preflop decision is all-in or
+fold. This module solves that game for N players with equal effective
+stacks of S big blinds, on the 169 starting-hand classes:
+
+- when everybody before them has folded, each player but the big blind
+  either shoves or folds
+- facing a shove, each later player in turn calls or folds. The first call
+  ends the hand and the remaining players fold. Overcalls are rare at these
+  depths, and leaving them out keeps every showdown heads-up, which the
+  precomputed class matchups (utils/preflop.py) cover exactly
+- card removal between the players' classes is ignored
+
+Players are numbered in preflop acting order, so player N-2 posts the small
+blind (half a big blind, as in PokerEnv) and player N-1 the big blind.
+Heads-up, player 0 is the small blind and acts first. Ranges are found by
+fictitious play. Every player best-responds to the others' average ranges
+and their own averages move towards that response. The result is the
+equilibrium of the two-player game and an approximate one for more players.
+
+The charts for 2 .. MAX_PLAYERS players and depths 1 .. MAX_DEPTH big
+blinds are computed once by running this module
+
+    python -m reasoning.push_fold [--iterations N] [--processes P]
+
+which writes a compact binary file (DEFAULT_CHART_PATH):
+
+    header   "<4sHHHHHI" magic b"PSHF", version, classes (169), fewest and
+                         most players, deepest stack, iterations
+    charts   for every player count, then every depth: N-1 push rows (one
+             per player), then one call row per (shover, caller) pair in
+             order, each 169 x uint8 probabilities scaled by 255
+
+The file is memory-mapped, so every lookup is one byte read from the OS
+page cache. PushFoldReasoning plays the charts with no search at all.
+"""
+
+import argparse
+import mmap
+import os
+import random
+import struct
+import time
+
+from utils.preflop import NUM_CLASSES, class_combos, class_index, get_preflop_table
+
+MIN_PLAYERS = 2
+MAX_PLAYERS = 10
+MAX_DEPTH = 20
+DEFAULT_ITERATIONS = 8000
+
+MAGIC = b"PSHF"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHHHI")
+SCALE = 255
+
+DEFAULT_CHART_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "push_fold.bin"
+)
+
+
+def blind(player, num_players):
+    """
+    Blind posted by a player, in big blinds.
+    """
+    if player == num_players - 1:
+        return 1.0
+    if player == num_players - 2:
+        return 0.5
+    return 0.0
+
+
+def pairs(num_players):
+    """
+    (shover, caller) pairs in chart order.
+    """
+    return [(shover, caller) for shover in range(num_players - 1)
+            for caller in range(shover + 1, num_players)]
+
+
+def chart_rows(num_players):
+    return num_players - 1 + num_players * (num_players - 1) // 2
+
+
+def call_row(num_players, shover, caller):
+    """
+    Row of the (shover, caller) calling range within a chart.
+    """
+    return num_players - 1 + shover * (2 * num_players - shover - 1) // 2 + caller - shover - 1
+
+
+def class_weights(np):
+    """
+    Share of all 1326 holdings that falls in each class.
+    """
+    return np.array([len(class_combos(index)) for index in range(NUM_CLASSES)]) / 1326
+
+
+def _action_values(np, push, call, matchups, weights, num_players, depth):
+    """
+    Expected stack change, in big blinds, of shoving (per player) and of
+    calling (per pair) with each class against the given ranges. Folding
+    loses the player's blind.
+    """
+    pair_list = pairs(num_players)
+    dead = {pair: 1.5 - blind(pair[0], num_players) - blind(pair[1], num_players) for pair in pair_list}
+
+    # Equity of each class against each range, and how often it is held
+    call_share = call @ weights
+    call_equity = (call * weights) @ matchups.T / np.maximum(call_share, 1e-12)[:, None]
+    push_share = push @ weights
+    push_equity = (push * weights) @ matchups.T / np.maximum(push_share, 1e-12)[:, None]
+    # A range never played is met with any hand, so its response stays defined
+    uniform = matchups @ weights
+    push_equity[push_share == 0] = uniform
+    call_equity[call_share == 0] = uniform
+
+    push_value = np.zeros((num_players - 1, NUM_CLASSES))
+    for shover in range(num_players - 1):
+        reach = 1.0
+        for caller in range(shover + 1, num_players):
+            row = call_row(num_players, shover, caller) - (num_players - 1)
+            pot = 2 * depth + dead[(shover, caller)]
+            push_value[shover] += reach * call_share[row] * (call_equity[row] * pot - depth)
+            reach *= 1 - call_share[row]
+        push_value[shover] += reach * (1.5 - blind(shover, num_players))
+
+    call_value = np.zeros((len(pair_list), NUM_CLASSES))
+    for row, (shover, caller) in enumerate(pair_list):
+        call_value[row] = push_equity[shover] * (2 * depth + dead[(shover, caller)]) - depth
+    return push_value, call_value
+
+
+def solve_push_fold(num_players, depth, iterations=DEFAULT_ITERATIONS, matchups=None):
+    """
+    Push/fold ranges for `num_players` with `depth` big blinds each, as
+    (push, call): push[player] and call[row] hold the probability of
+    shoving / calling with each class, call rows following pairs().
+    Needs NumPy.
+    """
+    import numpy as np
+
+    if matchups is None:
+        matchups = get_preflop_table().matchup_matrix()
+    weights = class_weights(np)
+    folds = np.array([-blind(player, num_players) for player in range(num_players)])
+    pair_list = pairs(num_players)
+    call_folds = np.array([folds[caller] for _, caller in pair_list])[:, None]
+
+    push = np.full((num_players - 1, NUM_CLASSES), 0.5)
+    call = np.full((len(pair_list), NUM_CLASSES), 0.5)
+    for iteration in range(1, iterations + 1):
+        push_value, call_value = _action_values(np, push, call, matchups, weights, num_players, depth)
+        step = 1.0 / (iteration + 1)
+        push += step * ((push_value > folds[:-1, None]) - push)
+        call += step * ((call_value > call_folds) - call)
+    return push, call
+
+
+def exploitability(num_players, depth, push, call, matchups=None):
+    """
+    An upper bound on what any one player gains, in big blinds per hand,
+    by deviating from the ranges on their own: their gains from the best
+    response in every spot, each counted as if the spot came up every
+    hand. Close to 0 at an equilibrium.
+    """
+    import numpy as np
+
+    if matchups is None:
+        matchups = get_preflop_table().matchup_matrix()
+    weights = class_weights(np)
+    push_value, call_value = _action_values(np, push, call, matchups, weights, num_players, depth)
+    gains = np.zeros(num_players)
+    for player in range(num_players - 1):
+        fold = -blind(player, num_players)
+        best = np.maximum(push_value[player], fold)
+        played = push[player] * push_value[player] + (1 - push[player]) * fold
+        gains[player] += (best - played) @ weights
+    for row, (_, caller) in enumerate(pairs(num_players)):
+        fold = -blind(caller, num_players)
+        best = np.maximum(call_value[row], fold)
+        played = call[row] * call_value[row] + (1 - call[row]) * fold
+        gains[caller] += (best - played) @ weights
+    return float(gains.max())
+
+
+class PushFoldCharts:
+    """
+    Read-only view of a push/fold chart file, memory-mapped on construction.
+    """
+
+    def __init__(self, path=DEFAULT_CHART_PATH):
+        with open(path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, classes, min_players, max_players, max_depth, iterations = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != VERSION or classes != NUM_CLASSES:
+            raise ValueError(f"{path} is not a push/fold chart file (version {VERSION}).")
+
+        self.min_players = min_players
+        self.max_players = max_players
+        self.max_depth = max_depth
+        self.iterations = iterations
+        self._chart_offsets = {}
+        offset = HEADER.size
+        for num_players in range(min_players, max_players + 1):
+            self._chart_offsets[num_players] = offset
+            offset += max_depth * chart_rows(num_players) * NUM_CLASSES
+
+    def _offset(self, num_players, depth, row, hand_class):
+        if not self.min_players <= num_players <= self.max_players:
+            raise ValueError(f"num_players must be between {self.min_players} and {self.max_players}.")
+        depth = min(max(depth, 1), self.max_depth)
+        chart = self._chart_offsets[num_players] + (depth - 1) * chart_rows(num_players) * NUM_CLASSES
+        return chart + row * NUM_CLASSES + hand_class
+
+    def push(self, num_players, depth, player, hand_class):
+        """
+        Probability that `player` shoves `hand_class` when folded to.
+        Depths are whole big blinds, clamped to 1 .. max_depth.
+        """
+        return self._buffer[self._offset(num_players, depth, player, hand_class)] / SCALE
+
+    def call(self, num_players, depth, shover, caller, hand_class):
+        """
+        Probability that `caller` calls a shove by `shover` with `hand_class`.
+        """
+        row = call_row(num_players, shover, caller)
+        return self._buffer[self._offset(num_players, depth, row, hand_class)] / SCALE
+
+
+_default_charts = None
+
+
+def get_push_fold_charts():
+    """
+    The shared charts at DEFAULT_CHART_PATH, loaded on first use.
+    """
+    global _default_charts
+    if _default_charts is None:
+        _default_charts = PushFoldCharts(DEFAULT_CHART_PATH)
+    return _default_charts
+
+
+class PushFoldReasoning:
+    """
+    Plays the push/fold charts preflop. Decisions are table lookups: the
+    agent's class, its place in the acting order, the effective stack in
+    big blinds and, facing a raise, who made it.
+
+    The charts cover two spots: everybody before the agent folded, or one
+    player raised and nobody called. Facing a raise smaller than all-in,
+    "call" means shoving over it. Every other spot (limps, several raises,
+    postflop) goes to `fallback`, or checks if it can and folds otherwise.
+    The engine needs game_state["hand_state"] (see SearchAgent).
+    """
+
+    def __init__(self, charts=None, fallback=None, seed=None):
+        """
+        :param charts: PushFoldCharts to play (default: the shared charts)
+        :param fallback: reasoning engine for spots the charts do not cover
+        :param seed: seed of the engine's own random draws
+        """
+        self.charts = charts
+        self.fallback = fallback
+        self.rng = random.Random(seed)
+
+    def _spot(self, state):
+        """
+        (player, shover or None, depth) of the seat to act, or None when the
+        spot is not in the charts.
+        """
+        n = state.num_players
+        if state.street != 0 or n < MIN_PLAYERS:
+            return None
+        player = (state.to_act - state.first_to_act) % n
+        big_blind = state.big_blind
+        raisers = [seat for seat in range(n) if state.contributions[seat] > big_blind]
+        limpers = [seat for seat in range(n)
+                   if state.contributions[seat] == big_blind and (seat - state.first_to_act) % n != n - 1]
+        if limpers or len(raisers) > 1:
+            return None
+
+        totals = [state.stacks[seat] + state.contributions[seat] for seat in range(n)]
+        shover = None
+        if raisers:
+            shover = (raisers[0] - state.first_to_act) % n
+            covered = totals[raisers[0]]
+        else:
+            covered = max(totals[seat] for seat in range(n)
+                          if seat != state.to_act and not state.folded >> seat & 1)
+        depth = int(min(totals[state.to_act], covered) / big_blind + 0.5)
+        return player, shover, depth
+
+    def evaluate(self, game_state, strategy=None):
+        """
+        An (action, amount) from the charts. `strategy` is accepted for
+        compatibility with the other engines.
+        """
+        state = game_state.get("hand_state")
+        if state is None:
+            raise ValueError("PushFoldReasoning needs game_state['hand_state']; "
+                             "play it with an agent that sets requires_hand_state.")
+        if self.charts is None:
+            self.charts = get_push_fold_charts()
+        legal = game_state["legal_actions"]
+
+        spot = self._spot(state)
+        if spot is not None and state.num_players <= self.charts.max_players:
+            player, shover, depth = spot
+            hand_class = class_index(state.hole_cards[state.to_act])
+            n = state.num_players
+            if shover is None and player < n - 1:
+                probability = self.charts.push(n, depth, player, hand_class)
+            elif shover is not None:
+                probability = self.charts.call(n, depth, shover, player, hand_class)
+            else:
+                probability = None
+            if probability is not None:
+                if self.rng.random() >= probability:
+                    return ("check", 0) if legal.can("check") else ("fold", 0)
+                if legal.can("raise"):
+                    return "raise", legal.max_raise
+                return "call", legal.call_amount
+
+        if self.fallback is not None:
+            return self.fallback.evaluate(game_state, strategy)
+        return ("check", 0) if legal.can("check") else ("fold", 0)
+
+
+# --- Generation ----------------------------------------------------------
+
+
+def _solve_chart(args):
+    num_players, depth, iterations = args
+    push, call = solve_push_fold(num_players, depth, iterations)
+    return num_players, depth, push, call, exploitability(num_players, depth, push, call)
+
+
+def generate_push_fold_charts(path=DEFAULT_CHART_PATH, iterations=DEFAULT_ITERATIONS, processes=None,
+                              max_players=MAX_PLAYERS, max_depth=MAX_DEPTH):
+    """
+    Solve every chart and write the chart file. Charts are solved in
+    parallel over `processes` workers. Returns the worst exploitability.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    import numpy as np
+
+    tasks = [(num_players, depth, iterations)
+             for num_players in range(MIN_PLAYERS, max_players + 1)
+             for depth in range(1, max_depth + 1)]
+    charts = {}
+    worst = 0.0
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        for num_players, depth, push, call, gain in pool.map(_solve_chart, tasks):
+            charts[num_players, depth] = np.concatenate([push, call])
+            worst = max(worst, gain)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, NUM_CLASSES, MIN_PLAYERS, max_players, max_depth, iterations))
+        for task in tasks:
+            f.write(np.round(charts[task[:2]] * SCALE).astype("u1").tobytes())
+    os.replace(temporary, path)
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve the push/fold charts.")
+    parser.add_argument("--output", default=DEFAULT_CHART_PATH, help="where to write the charts")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="fictitious-play iterations")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--max-players", type=int, default=MAX_PLAYERS, help="most players at the table")
+    parser.add_argument("--max-depth", type=int, default=MAX_DEPTH, help="deepest stack, in big blinds")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    worst = generate_push_fold_charts(args.output, args.iterations, args.processes,
+                                      args.max_players, args.max_depth)
+    print(f"Wrote {args.output} in {time.perf_counter() - start:.1f}s "
+          f"(worst exploitability {worst:.4f} bb/hand)")
+
+
+if __name__ == "__main__":
+    main()
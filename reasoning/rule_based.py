@@ -1,16 +1,33 @@
+from utils.cache import LRUCache
+from utils.cards import canonical_form
+from utils.hand_strength import DEFAULT_POTENTIAL_SAMPLES, effective_hand_strength, hand_strength
+from utils.preflop import MAX_OPPONENTS, preflop_equity
+
 class RuleBasedReasoning:
     """
     A simple rule-based reasoning engine for poker decisions.
     """
 
+    def __init__(self, cache_size=65536, potential_samples=DEFAULT_POTENTIAL_SAMPLES):
+        """
+        :param cache_size: postflop spots kept in the hand-strength cache
+        :param potential_samples: samples used to estimate hand potential
+        """
+        # Keyed by the suit-isomorphic form of (hand, board), so the same
+        # spot reached on any table, in any round, is computed only once
+        self.strength_cache = LRUCache(cache_size)
+        self.potential_samples = potential_samples
+
     def evaluate(self, game_state, strategy="conservative"):
         # Example pseudo-logic for a simple rule-based system:
         # 1. Evaluate current hand strength (need a hand evaluator).
         # 2. Adjust threshold based on the strategy parameter (conservative/aggressive).
         # 3. Output an action + raise amount (if any).
 
+        num_opponents = min(max(game_state.get("num_players", 2) - 1, 1), MAX_OPPONENTS)
         hand_strength = self._evaluate_hand_strength(game_state["hand"], 
-                                                     game_state["community_cards"])
+                                                     game_state["community_cards"],
+                                                     num_opponents)
         if strategy == "conservative":
             threshold = 0.6
         elif strategy == "aggressive":
@@ -18,20 +35,39 @@ class RuleBasedReasoning:
         else:
             threshold = 0.5
 
+        # Thresholds are stated for a heads-up pot; against more opponents
+        # the chance of beating all of them shrinks roughly as a power
+        raise_threshold = (threshold + 0.1) ** num_opponents
+        threshold = threshold ** num_opponents
+
         # Decide action
         if hand_strength < threshold:
             return ("fold", 0)
-        elif hand_strength < threshold + 0.1:
+        elif hand_strength < raise_threshold:
             return ("call", 0)
         else:
             # For demonstration, always "raise" with a fixed or minimal amount
             return ("raise", 10)
 
-    def _evaluate_hand_strength(self, hand, community_cards):
+    def _evaluate_hand_strength(self, hand, community_cards, num_opponents=1):
+        """
+        Strength of the hand against `num_opponents` random hands.
+        Preflop this is the all-in equity from the precomputed 169-class
+        table; postflop it is the effective hand strength (current strength
+        adjusted by positive and negative potential).
+        """
+        if not community_cards:
+            return preflop_equity(hand, num_opponents)
+
+        key = canonical_form(hand, community_cards)
+        strength = self.strength_cache.get(key)
+        if strength is None:
+            strength = hand_strength(key[0], key[1], self.potential_samples)
+            self.strength_cache.put(key, strength)
+        return effective_hand_strength(strength, num_opponents)
+
+    def cache_stats(self):
         """
-        Use a simple or advanced hand evaluation function 
-        (e.g., rank-based, hand potential, etc.).
-        For now, return a dummy number between 0 and 1.
+        Hit, miss and eviction counters of the hand-strength cache.
         """
-        # TODO: integrate real hand-evaluation logic from `utils/hand_evaluation.py`
-        return 0.7  # Hard-coded example
+        return self.strength_cache.stats()
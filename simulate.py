@@ -0,0 +1,40 @@
+import argparse
+
+from environment.simulation import AGENT_TYPES, DEFAULT_AGENTS, run_simulation
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless poker tables in parallel.")
+    parser.add_argument("--tables", type=int, default=8, help="number of independent tables")
+    parser.add_argument("--hands", type=int, default=1000, help="hands played at each table")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="root seed for every table")
+    parser.add_argument("--buy-in", type=int, default=20, help="starting stack of every seat")
+    parser.add_argument("--agents", default=",".join(DEFAULT_AGENTS),
+                        help=f"comma separated seat types from {sorted(AGENT_TYPES)}")
+    parser.add_argument("--ev-adjusted", action="store_true",
+                        help="score all-in hands by equity instead of by the runout")
+    args = parser.parse_args()
+
+    result = run_simulation(
+        args.tables,
+        args.hands,
+        processes=args.processes,
+        seed=args.seed,
+        agent_kinds=args.agents.split(","),
+        buy_in=args.buy_in,
+        ev_adjusted=args.ev_adjusted,
+    )
+
+    print("="*80)
+    print("SIMULATION RESULTS".center(80))
+    print("="*80)
+    print(f"Tables: {args.tables}  Hands: {result.hands_played}  "
+          f"Time: {result.elapsed:.1f}s  ({result.hands_played / result.elapsed:,.0f} hands/s)")
+    print("-"*80)
+    print(f"{'Agent':<30}{'Net profit':>15}{'Hands':>12}{'bb/100':>12}")
+    for name, stats in result.summary().items():
+        print(f"{name:<30}{stats['net_profit']:>15.0f}{stats['hands_played']:>12}{stats['bb_per_100']:>12.1f}")
+    print("="*80)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Modules import each other from the repository root (python -m style), so
+# make it importable however pytest is started
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,29 @@
+"""
+Framing of bot protocol messages, including connections that close early.
+"""
+
+import asyncio
+
+import pytest
+
+from environment.bot_protocol import HEADER, ProtocolError, encode_message, read_message
+
+
+def _read(data):
+    async def read():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return [await read_message(reader), await read_message(reader)]
+    return asyncio.run(read())
+
+
+def test_read_message_round_trip_then_eof():
+    message = {"id": 17, "action": "raise", "amount": 40}
+    assert _read(encode_message(message)) == [message, None]
+
+
+@pytest.mark.parametrize("cut", [2, HEADER.size + 5])
+def test_read_message_rejects_truncated_messages(cut):
+    with pytest.raises(ProtocolError):
+        _read(encode_message({"id": 1, "error": "busy"})[:cut])
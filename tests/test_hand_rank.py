@@ -0,0 +1,36 @@
+"""
+hand_rank and compare_hands on complete and incomplete hands.
+"""
+
+import pytest
+
+from utils.utils import compare_hands, hand_rank
+
+HOLE = [('A', 'hearts'), ('K', 'hearts')]
+BOARD = [('2', 'clubs'), ('2', 'spades'), ('7', 'hearts'), ('9', 'diamonds'), ('J', 'clubs')]
+
+
+def test_hand_rank_rejects_fewer_than_five_cards():
+    with pytest.raises(ValueError):
+        hand_rank(HOLE)
+    assert hand_rank(HOLE + BOARD) > hand_rank(BOARD[:2] + HOLE + BOARD[3:4])
+
+
+def test_compare_hands_keeps_incomplete_hand_fallback():
+    # Incomplete hands are (HIGH_CARD, []): they tie with each other and
+    # lose to any better category
+    assert compare_hands(HOLE, HOLE[:1]) == 0
+    assert compare_hands(HOLE, BOARD) == -1
+    assert compare_hands(BOARD, HOLE) == 1
+    assert compare_hands(HOLE + BOARD, BOARD) == 1
+
+
+def test_compare_hands_ranks_the_long_side_against_a_short_hand():
+    flush = [('2', 'hearts'), ('5', 'hearts'), ('7', 'hearts'), ('9', 'hearts'),
+             ('J', 'hearts'), ('3', 'clubs'), ('4', 'spades')]
+    assert compare_hands(flush, HOLE) == 1
+    assert compare_hands(HOLE, flush) == -1
+    assert compare_hands(flush[:5], HOLE) == 1
+    high_card = [('2', 'clubs'), ('5', 'hearts'), ('7', 'hearts'), ('9', 'diamonds'),
+                 ('J', 'clubs'), ('3', 'hearts')]
+    assert compare_hands(high_card, HOLE) == 0
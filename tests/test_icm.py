@@ -0,0 +1,26 @@
+"""
+icm_equity memoization on the exact and sampled paths.
+"""
+
+from utils.icm import icm_equity
+
+FIELD = [10] * 50
+PAYOUTS = [5, 3, 2]
+FIELD_PAYOUTS = list(range(15, 0, -1))    # too many subsets to solve exactly
+
+
+def test_sampled_results_are_cached_per_samples_and_seed():
+    rough = icm_equity(FIELD, FIELD_PAYOUTS, samples=10)
+    precise = icm_equity(FIELD, FIELD_PAYOUTS, samples=100_000)
+    assert precise != rough
+    # Equal stacks share the prize pool equally
+    fair = sum(FIELD_PAYOUTS) / len(FIELD)
+    assert max(abs(value - fair) for value in precise) < 0.1
+    assert icm_equity(FIELD, FIELD_PAYOUTS, samples=10) == rough
+    assert icm_equity(FIELD, FIELD_PAYOUTS, samples=10, seed=1) != rough
+
+
+def test_exact_results_ignore_samples_and_seed():
+    stacks = [50, 30, 20]
+    assert icm_equity(stacks, PAYOUTS, samples=10) == icm_equity(stacks, PAYOUTS, seed=7)
+    assert abs(sum(icm_equity(stacks, PAYOUTS)) - sum(PAYOUTS)) < 1e-9
@@ -0,0 +1,39 @@
+"""
+PokerTable position lookup as players sit in and out and the blinds move.
+"""
+
+import random
+
+from agents.base_agent import BaseAgent
+from environment.poker_table import MAX_SEATS, PokerTable
+
+
+class _Player(BaseAgent):
+    def decide_action(self, game_state):
+        return "check", 0
+
+
+def _assert_positions(table):
+    walked = [seat.agent for seat in table.occupied()]
+    assert [table.get(index) for index in range(table.size())] == walked
+    assert walked[0] is table.get_head().agent
+
+
+def test_get_follows_sit_in_sit_out_and_moving_blinds():
+    rng = random.Random(0)
+    players = [_Player(f"P{index}", None) for index in range(MAX_SEATS)]
+    table = PokerTable(players[:3])
+    _assert_positions(table)
+
+    for _ in range(500):
+        seated = [seat.agent for seat in table.occupied()]
+        roll = rng.random()
+        if roll < 0.4 and len(seated) < MAX_SEATS:
+            waiting = [player for player in players if table.seat_of(player) is None]
+            free = [seat.index for seat in table.seats if seat.is_empty()]
+            table.sit_in(rng.choice(waiting), rng.choice(free + [None]))
+        elif roll < 0.8 and len(seated) > 2:
+            table.sit_out(rng.choice(seated))
+        else:
+            table.move_positions()
+        _assert_positions(table)
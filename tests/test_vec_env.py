@@ -0,0 +1,185 @@
+"""
+Differential tests of VecPokerEnv against the scalar engines.
+
+The same seeded action sequences are played through VecPokerEnv and,
+table by table, through HandState (the per-action rules of
+PokerEnv._apply_action). HandState is in turn replayed against PokerEnv
+itself. After every action, stacks, pot, current bet, folded and all-in
+seats and the seat to act must agree, and so must the chips won when a hand
+ends. The vectorized side-pot settlement is compared with
+pot_manager.settle_pots on random contributions.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from agents.base_agent import BaseAgent
+from environment.hand_state import HandState
+from environment.poker_game import PokerEnv
+from environment.pot_manager import settle_pots
+from environment.vec_env import ACTION_INDEX, VecPokerEnv
+
+BUY_IN = 20
+
+
+def _choose(rng, legal):
+    """
+    A random decision as (action, amount), with raises of every size,
+    illegal requests and all-ins mixed in so validation is exercised too.
+    """
+    roll = rng.random()
+    if roll < 0.15 and legal.can("raise"):
+        return "raise", rng.randint(legal.min_raise, legal.max_raise)
+    if roll < 0.2:
+        return "raise", legal.max_raise
+    if roll < 0.3:
+        return "fold", 0
+    if roll < 0.33:
+        return "check", 0
+    return ("call", legal.call_amount) if legal.can("call") else ("check", 0)
+
+
+def _start_shadow(env, table):
+    """
+    A HandState for the hand just dealt at one VecPokerEnv table.
+    """
+    stacks = (env.stacks[table] + env.contributions[table]).tolist()
+    holes = [tuple(cards) for cards in env.hole_cards[table].tolist()]
+    return HandState.start(stacks, holes, env.small_blind, env.big_blind, int(env.button[table]))
+
+
+def _assert_same(env, table, state):
+    assert env.stacks[table].tolist() == state.stacks
+    assert env.pot[table] == state.pot
+    assert env.current_bet[table] == state.current_bet
+    folded = [bool(state.folded >> seat & 1) for seat in range(state.num_players)]
+    assert env.folded[table].tolist() == folded
+    all_in = [not f and stack == 0 for f, stack in zip(folded, state.stacks)]
+    assert (~env.folded[table] & (env.stacks[table] == 0)).tolist() == all_in
+    assert env.to_act[table] == state.to_act
+
+
+@pytest.mark.parametrize("num_players", [2, 3, 6, 10])
+def test_vec_env_matches_hand_state(num_players):
+    tables, steps = 16, 400
+    rng = random.Random(num_players)
+    env = VecPokerEnv(tables, num_players, BUY_IN, seed=num_players)
+    env.reset()
+    shadows = [_start_shadow(env, table) for table in range(tables)]
+    hands = 0
+
+    for _ in range(steps):
+        actions = np.zeros(tables, dtype=np.int64)
+        amounts = np.zeros(tables, dtype=np.int64)
+        for table, state in enumerate(shadows):
+            assert env.to_act[table] == state.to_act
+            action, amount = _choose(rng, state.legal_actions())
+            actions[table] = ACTION_INDEX[action]
+            amounts[table] = amount
+            state.apply(action, amount)
+            # The table's board is dealt up front; show it as streets open
+            board = env.board[table].tolist()
+            while state.cards_needed() > 0:
+                state.deal(board[len(state.board):len(state.board) + state.cards_needed()])
+
+        rewards, dones = env.step(actions, amounts)
+        for table, state in enumerate(shadows):
+            if dones[table]:
+                assert state.is_terminal()
+                assert rewards[table].tolist() == state.payoffs()
+                shadows[table] = _start_shadow(env, table)
+                hands += 1
+            else:
+                assert not state.is_terminal()
+                assert not rewards[table].any()
+                _assert_same(env, table, state)
+    assert hands > 0
+
+
+class _ShadowAgent(BaseAgent):
+    """
+    Plays random decisions and replays every action of its table, its own
+    and everybody else's, on a HandState, checking it against PokerEnv
+    before each decision.
+    """
+
+    def __init__(self, name, table_state):
+        super().__init__(name, None)
+        self.table_state = table_state
+
+    def decide_action(self, game_state):
+        env = self.table_state["env"]
+        seats = list(env.table.occupied())
+        state = self.table_state.get("state")
+        if state is None:
+            agents = [seat.agent for seat in seats]
+            initial = [agent.stack + agent.current_contribution for agent in agents]
+            state = HandState.start(initial, [agent.hand for agent in agents], env.small_blind, env.big_blind,
+                                    seats.index(env.table.get_small_blind()))
+            self.table_state.update(state=state, initial=initial)
+        while state.cards_needed() > 0:
+            state.deal(env.community_cards[len(state.board):len(state.board) + state.cards_needed()])
+
+        assert state.to_act == seats.index(env.action_seat)
+        assert state.stacks == [seat.agent.stack for seat in seats]
+        assert state.pot == env.pot
+        assert state.current_bet == env.current_bet
+        assert [bool(state.folded >> index & 1) for index in range(len(seats))] == \
+            [seat.agent.folded for seat in seats]
+        assert tuple(state.legal_actions()) == tuple(game_state["legal_actions"])
+
+        decision = _choose(self.rng, game_state["legal_actions"])
+        state.apply(*decision)
+        return decision
+
+
+@pytest.mark.parametrize("num_players", [2, 3, 6, 10])
+def test_hand_state_matches_poker_env(num_players):
+    table_state = {}
+    agents = [_ShadowAgent(f"P{index}", table_state) for index in range(num_players)]
+    env = PokerEnv(agents, BUY_IN, headless=True, seed=num_players)
+    table_state["env"] = env
+    hands = 0
+    for _ in range(300):
+        table_state.pop("state", None)
+        env.play()
+        state = table_state.get("state")
+        if state is not None:
+            while state.cards_needed() > 0:
+                state.deal(env.community_cards[len(state.board):len(state.board) + state.cards_needed()])
+            seats = list(env.table.occupied())
+            won = [seat.agent.stack - initial for seat, initial in zip(seats, table_state["initial"])]
+            assert state.payoffs() == won
+            hands += 1
+        env.rotate()
+    assert hands > 0
+
+
+def test_settle_pots_matches_pot_manager():
+    rng = np.random.default_rng(0)
+    env = VecPokerEnv(1, 2, BUY_IN)
+    for num_players in (2, 3, 6, 10):
+        count = 2000
+        # Few distinct amounts, so ties between contribution levels are common
+        invested = rng.choice([0, 1, 2, 5, 10, 17, 40], size=(count, num_players))
+        folded = rng.random((count, num_players)) < 0.3
+        ranks = np.where(folded, -1, rng.integers(0, 4, size=(count, num_players)))
+        small_blind = rng.integers(0, num_players, size=count)
+        # A folded seat never put in more than the live seat who put in most
+        live_most = np.where(folded, 0, invested).max(axis=1, keepdims=True)
+        invested = np.where(folded, np.minimum(invested, live_most), invested)
+
+        payout = env._settle_pots(invested, ranks, small_blind)
+        for row in range(count):
+            if (ranks[row] < 0).all():
+                continue
+            seats = range(num_players)
+            expected = settle_pots(
+                {seat: int(invested[row, seat]) for seat in seats},
+                {seat: int(ranks[row, seat]) for seat in seats if ranks[row, seat] >= 0},
+                {seat: (seat - small_blind[row]) % num_players for seat in seats},
+            )
+            assert payout[row].tolist() == [expected.get(seat, 0) for seat in seats]
+            assert payout[row].sum() == invested[row].sum()
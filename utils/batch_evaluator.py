@@ -0,0 +1,92 @@
+"""
+Vectorized hand evaluation with NumPy for large offline studies.
+
+Hands are passed as an (N, 5), (N, 6) or (N, 7) integer array of encoded
+cards (see cards.py) and ranked on the same 1..7462 scale as evaluate_5 and
+evaluate_cards, using only array operations on the evaluator's tables:
+
+- a hand with five or more cards of one suit takes FLUSH_BEST_RANKS of that
+  suit's rank mask
+- every other hand takes UNSUITED_RANKS of its rank-prime product, looked up
+  with a binary search over the sorted products
+
+Input is processed in chunks so temporaries stay bounded regardless of N;
+the input itself may be a np.memmap.
+"""
+
+import numpy as np
+
+from .cards import encode_cards
+from .hand_evaluator import CATEGORY_BOUNDS, FLUSH_BEST_RANKS, UNSUITED_RANKS
+
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+_FLUSH_BEST = np.array(FLUSH_BEST_RANKS, dtype=np.int32)
+_PRODUCT_KEYS = np.array(sorted(UNSUITED_RANKS), dtype=np.int64)
+_PRODUCT_RANKS = np.array([UNSUITED_RANKS[key] for key in sorted(UNSUITED_RANKS)], dtype=np.int32)
+_CATEGORY_BOUNDS = np.array(CATEGORY_BOUNDS, dtype=np.int32)
+_SUIT_BITS = (0x1000, 0x2000, 0x4000, 0x8000)
+
+
+def encode_batch(hands):
+    """
+    Convert a list of hands ((rank, suit) tuples or ints) into an int64 array.
+    """
+    return np.array([encode_cards(hand) for hand in hands], dtype=np.int64)
+
+
+def _rank_chunk(cards):
+    """
+    Rank every row of a (n, k) int64 array of encoded cards.
+    """
+    product = np.prod(cards & 0xFF, axis=1, dtype=np.int64)
+    ranks = _PRODUCT_RANKS[np.searchsorted(_PRODUCT_KEYS, product)]
+
+    rank_bits = cards >> 16
+    for suit_bit in _SUIT_BITS:
+        in_suit = (cards & suit_bit) != 0
+        flush = np.count_nonzero(in_suit, axis=1) >= 5
+        if flush.any():
+            masks = np.bitwise_or.reduce(np.where(in_suit[flush], rank_bits[flush], 0), axis=1)
+            ranks[flush] = _FLUSH_BEST[masks]
+    return ranks
+
+
+def hand_categories(ranks):
+    """
+    Map an array of ranks to PokerHand values (PokerHand(value) gives the enum).
+    """
+    return (np.searchsorted(_CATEGORY_BOUNDS, ranks) + 1).astype(np.int8)
+
+
+def iter_evaluate_batch(cards, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield (start, ranks, categories) for consecutive chunks of `cards`,
+    for callers that aggregate results without keeping all N of them.
+    """
+    cards = np.asanyarray(cards)
+    if cards.ndim != 2 or cards.shape[1] not in (5, 6, 7):
+        raise ValueError(f"Expected an (N, 5), (N, 6) or (N, 7) card array, got shape {cards.shape}.")
+
+    for start in range(0, len(cards), chunk_size):
+        chunk = np.asarray(cards[start:start + chunk_size], dtype=np.int64)
+        ranks = _rank_chunk(chunk)
+        yield start, ranks, hand_categories(ranks)
+
+
+def evaluate_batch(cards, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Rank N hands at once.
+
+    :param cards: (N, 5), (N, 6) or (N, 7) array of encoded cards
+    :param chunk_size: rows processed per step, bounding temporary memory
+    :return: (ranks, categories) where ranks is an (N,) int32 array on the
+             evaluate_5 scale and categories an (N,) int8 array of PokerHand values
+    """
+    num_hands = len(cards)
+    ranks = np.empty(num_hands, dtype=np.int32)
+    categories = np.empty(num_hands, dtype=np.int8)
+    for start, chunk_ranks, chunk_categories in iter_evaluate_batch(cards, chunk_size):
+        ranks[start:start + len(chunk_ranks)] = chunk_ranks
+        categories[start:start + len(chunk_ranks)] = chunk_categories
+    return ranks, categories
@@ -0,0 +1,70 @@
+"""
+Bounded least-recently-used cache with counters for sizing it.
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    A dict-like cache holding at most `maxsize` entries; inserting into a
+    full cache evicts the least recently used entry.
+    """
+
+    def __init__(self, maxsize=65536):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for `key` (marking it recently used), or
+        `default` on a miss.
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Insert or refresh an entry, evicting the oldest one if full.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        elif len(self._entries) >= self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        self._entries[key] = value
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def stats(self):
+        """
+        Counters for sizing the cache: hits, misses, evictions, current
+        size, capacity and hit rate.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
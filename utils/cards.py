@@ -0,0 +1,123 @@
+"""
+Integer card encoding used by the hand evaluators.
+
+Every card is packed into a single int with the layout
+
+    xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+
+where ``b`` is a one-hot bit for the rank, ``cdhs`` a one-hot bit for the
+suit, ``r`` the rank index (0 = deuce ... 12 = ace) and ``p`` the rank's
+prime.  OR-ing the rank bits of a hand gives its rank mask, AND-ing the suit
+bits detects a flush and multiplying the primes gives a key that is unique
+for every multiset of ranks.
+"""
+
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+SUITS = ['hearts', 'clubs', 'diamonds', 'spades']
+
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
+RANK_INDEX = {rank: i for i, rank in enumerate(RANKS)}
+SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+
+
+def make_card(rank_index, suit_index):
+    """
+    Build the encoded int for a rank index (0-12) and suit index (0-3).
+    """
+    return ((1 << (16 + rank_index))
+            | (0x1000 << suit_index)
+            | (rank_index << 8)
+            | PRIMES[rank_index])
+
+
+# (rank, suit) tuple <-> int, precomputed for all 52 cards
+_CARD_TO_INT = {
+    (rank, suit): make_card(r, s)
+    for r, rank in enumerate(RANKS)
+    for s, suit in enumerate(SUITS)
+}
+_INT_TO_CARD = {value: card for card, value in _CARD_TO_INT.items()}
+
+FULL_DECK = [_CARD_TO_INT[(rank, suit)] for rank in RANKS for suit in SUITS]
+
+
+def card_to_int(card):
+    """
+    Encode a ``(rank, suit)`` tuple such as ``('10', 'hearts')``.
+    Already-encoded ints are returned unchanged.
+    """
+    if isinstance(card, int):
+        return card
+    return _CARD_TO_INT[card]
+
+
+def int_to_card(card):
+    """
+    Decode an encoded int back into a ``(rank, suit)`` tuple.
+    """
+    return _INT_TO_CARD[card]
+
+
+def encode_cards(cards):
+    """
+    Encode a sequence of cards, accepting tuples or already-encoded ints.
+    """
+    return [card if isinstance(card, int) else _CARD_TO_INT[card] for card in cards]
+
+
+def rank_index(card):
+    """
+    Rank index (0 = deuce ... 12 = ace) of an encoded card.
+    """
+    return (card >> 8) & 0xF
+
+
+def suit_index(card):
+    """
+    Suit index (position in SUITS) of an encoded card.
+    """
+    return ((card >> 12) & 0xF).bit_length() - 1
+
+
+def card_str(card):
+    """
+    Human readable form of an encoded card, e.g. ``'10 of hearts'``.
+    """
+    rank, suit = _INT_TO_CARD[card]
+    return f"{rank} of {suit}"
+
+
+def canonical_form(hole_cards, board=()):
+    """
+    Suit-isomorphic canonical form of (hole cards, board).
+
+    Suits only matter through which cards share them, so spots that differ by
+    a relabelling of suits (AhKh on Qh Js 2c vs AsKs on Qs Jh 2d) are
+    strategically identical. Suits are renamed in order of their (hole ranks, board ranks)
+    signature, which makes every such spot map to the same pair of sorted
+    tuples of encoded ints. Suits with equal signatures are interchangeable,
+    so ties between them do not affect the result.
+    """
+    hole = encode_cards(hole_cards)
+    board = encode_cards(board)
+
+    signatures = [([], []) for _ in SUITS]
+    for card in hole:
+        signatures[suit_index(card)][0].append(rank_index(card))
+    for card in board:
+        signatures[suit_index(card)][1].append(rank_index(card))
+    for hole_ranks, board_ranks in signatures:
+        hole_ranks.sort(reverse=True)
+        board_ranks.sort(reverse=True)
+
+    order = sorted(range(len(SUITS)), key=lambda s: signatures[s], reverse=True)
+    relabel = [0] * len(SUITS)
+    for new_suit, suit in enumerate(order):
+        relabel[suit] = new_suit
+
+    def rename(card):
+        return make_card(rank_index(card), relabel[suit_index(card)])
+
+    return (tuple(sorted(rename(card) for card in hole)),
+            tuple(sorted(rename(card) for card in board)))
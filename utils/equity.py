@@ -0,0 +1,389 @@
+"""
+Win-probability (equity) estimation for a hero hand against random opponents.
+
+monte_carlo_equity deals random runouts and opponent holdings in seeded
+batches, optionally spread over a process pool, and stops as soon as the
+confidence interval of the estimate is narrower than the requested
+tolerance, the sample cap is reached or the deadline passes.
+
+exact_equity enumerates every runout and every set of opponent holdings,
+which is both faster and noise-free once few cards remain (turn, river,
+heads-up). calculate_equity picks between the two by enumeration size.
+
+showdown_equity handles the all-in case where every hand is known and only
+the board is left to come, ranking the runouts in bulk with NumPy.
+"""
+
+import atexit
+import math
+import os
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import combinations
+
+import numpy as np
+
+from .batch_evaluator import evaluate_batch
+from .cards import FULL_DECK, encode_cards
+from .hand_evaluator import evaluate_cards
+
+EquityResult = namedtuple(
+    "EquityResult",
+    ["win", "tie", "lose", "equity", "samples", "stderr", "exact"],
+)
+EquityResult.__doc__ = """
+Outcome of an equity calculation. win/tie/lose are fractions of the
+samples (or runouts), equity counts a tie as the hero's share of the split
+pot, stderr is the standard error of equity (0 for exact results).
+"""
+
+# Largest enumeration (runouts x opponent holdings) calculate_equity will
+# solve exactly. Heads-up turn (~46k) and 3-way river (~447k) spots enumerate
+# faster than sampling converges; heads-up flop (~1.07M) does not
+EXACT_THRESHOLD = 500_000
+
+# Runouts showdown_equity enumerates before it samples instead: any flop or
+# turn all-in is exact, a preflop all-in (1.7M runouts heads-up) is sampled
+SHOWDOWN_EXACT_THRESHOLD = 20_000
+SHOWDOWN_SAMPLES = 10_000
+
+_shared_pools = {}
+
+
+def _shared_pool(processes):
+    """
+    A process pool reused across calls so each decision does not pay for
+    starting workers. Pools are shut down at interpreter exit.
+    """
+    pool = _shared_pools.get(processes)
+    if pool is None:
+        pool = ProcessPoolExecutor(max_workers=processes)
+        _shared_pools[processes] = pool
+    return pool
+
+
+@atexit.register
+def _shutdown_pools():
+    for pool in _shared_pools.values():
+        pool.shutdown(wait=False, cancel_futures=True)
+    _shared_pools.clear()
+
+
+def _prepare(hole_cards, board, dead_cards, num_opponents):
+    """
+    Encode and validate the known cards and return (hero, board, deck).
+    """
+    hero = encode_cards(hole_cards)
+    board = encode_cards(board)
+    dead = encode_cards(dead_cards)
+
+    if len(hero) != 2:
+        raise ValueError("Hero must hold exactly two hole cards.")
+    if len(board) > 5:
+        raise ValueError("The board cannot have more than five cards.")
+    if num_opponents < 1:
+        raise ValueError("At least one opponent is required.")
+
+    known = hero + board + dead
+    if len(set(known)) != len(known):
+        raise ValueError("The same card appears more than once in hole cards, board and dead cards.")
+
+    known = set(known)
+    deck = [card for card in FULL_DECK if card not in known]
+    if len(deck) < 5 - len(board) + 2 * num_opponents:
+        raise ValueError("Not enough cards left in the deck for this many opponents.")
+    return hero, board, deck
+
+
+def _rollout_batch(args):
+    """
+    Run one seeded batch of Monte Carlo rollouts.
+    Returns (samples, wins, ties, share_sum, share_sq_sum).
+    """
+    hero, board, deck, num_opponents, samples, seed = args
+    rng = random.Random(seed)
+    need = 5 - len(board)
+    draw = need + 2 * num_opponents
+
+    wins = ties = 0
+    share_sum = share_sq_sum = 0.0
+    for _ in range(samples):
+        drawn = rng.sample(deck, draw)
+        full_board = board + drawn[:need]
+        hero_rank = evaluate_cards(hero + full_board)
+
+        best = 0
+        best_count = 0
+        for i in range(need, draw, 2):
+            rank = evaluate_cards(full_board + drawn[i:i + 2])
+            if rank > best:
+                best = rank
+                best_count = 1
+            elif rank == best:
+                best_count += 1
+
+        if hero_rank > best:
+            wins += 1
+            share_sum += 1.0
+            share_sq_sum += 1.0
+        elif hero_rank == best:
+            ties += 1
+            share = 1.0 / (best_count + 1)
+            share_sum += share
+            share_sq_sum += share * share
+    return samples, wins, ties, share_sum, share_sq_sum
+
+
+def _result(samples, wins, ties, share_sum, share_sq_sum, num_opponents):
+    if not samples:
+        # Nothing finished before the deadline: fall back to the prior
+        prior = 1.0 / (num_opponents + 1)
+        return EquityResult(prior, 0.0, 1.0 - prior, prior, 0, math.inf, False)
+    mean = share_sum / samples
+    variance = max(share_sq_sum / samples - mean * mean, 0.0)
+    return EquityResult(
+        wins / samples,
+        ties / samples,
+        (samples - wins - ties) / samples,
+        mean,
+        samples,
+        math.sqrt(variance / samples),
+        False,
+    )
+
+
+def monte_carlo_equity(hole_cards, board=(), dead_cards=(), num_opponents=1,
+                       tolerance=0.005, z=1.96, min_samples=1_000, max_samples=200_000,
+                       batch_size=1_000, deadline=None, time_budget=None, seed=None,
+                       processes=1, executor=None):
+    """
+    Estimate the hero's all-in equity against `num_opponents` random hands.
+
+    :param hole_cards: the hero's two cards, (rank, suit) tuples or encoded ints
+    :param board: known community cards (0-5)
+    :param dead_cards: cards known to be out of the deck (e.g. folded or burned)
+    :param num_opponents: number of opponents holding random cards
+    :param tolerance: stop once z * stderr of the equity is at most this
+    :param z: z-score of the confidence interval (1.96 ~ 95%)
+    :param min_samples: never stop on tolerance before this many samples
+    :param max_samples: hard cap on the number of samples
+    :param batch_size: samples per batch; the stopping rule and deadline are
+                       checked between batches
+    :param deadline: absolute time.monotonic() value by which to answer
+    :param time_budget: seconds from now by which to answer (combined with deadline)
+    :param seed: root seed; batch i is seeded from (seed, i), so a seeded call
+                 that is not cut short by the deadline is reproducible
+    :param processes: worker processes; 1 runs batches in the calling process
+    :param executor: an existing concurrent.futures executor to use instead
+                     of the shared pool
+    :return: EquityResult
+    """
+    hero, board, deck = _prepare(hole_cards, board, dead_cards, num_opponents)
+
+    if time_budget is not None:
+        budget_deadline = time.monotonic() + time_budget
+        deadline = budget_deadline if deadline is None else min(deadline, budget_deadline)
+    if seed is None:
+        seed = random.getrandbits(64)
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    def batch_args(index):
+        size = min(batch_size, max_samples - index * batch_size)
+        return (hero, board, deck, num_opponents, size, f"{seed}:{index}")
+
+    total_batches = math.ceil(max_samples / batch_size)
+    totals = [0, 0, 0, 0.0, 0.0]
+
+    def converged():
+        samples = totals[0]
+        if samples >= max_samples:
+            return True
+        if samples < min_samples:
+            return False
+        result = _result(*totals, num_opponents)
+        return z * result.stderr <= tolerance
+
+    def expired():
+        return deadline is not None and time.monotonic() >= deadline
+
+    if executor is None and processes <= 1:
+        for index in range(total_batches):
+            if expired():
+                break
+            for i, value in enumerate(_rollout_batch(batch_args(index))):
+                totals[i] += value
+            if converged():
+                break
+        return _result(*totals, num_opponents)
+
+    pool = executor or _shared_pool(processes)
+    in_flight = max(processes, 1) * 2
+    pending = {}
+    finished = {}
+    next_index = 0
+    consumed = 0
+
+    while True:
+        while next_index < total_batches and len(pending) < in_flight:
+            pending[pool.submit(_rollout_batch, batch_args(next_index))] = next_index
+            next_index += 1
+        if not pending:
+            break
+
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            finished[pending.pop(future)] = future.result()
+
+        # Consume batches in index order so a seeded run is reproducible
+        stop = False
+        while consumed in finished:
+            for i, value in enumerate(finished.pop(consumed)):
+                totals[i] += value
+            consumed += 1
+            if converged():
+                stop = True
+                break
+        if stop or expired():
+            break
+
+    for future in pending:
+        future.cancel()
+    return _result(*totals, num_opponents)
+
+
+def enumeration_size(board_cards, deck_cards, num_opponents):
+    """
+    Number of (runout, opponent holdings) combinations exact_equity visits
+    for a board of `board_cards` cards and `deck_cards` unseen cards.
+    Opponents are interchangeable, so their holdings are counted unordered.
+    """
+    size = math.comb(deck_cards, 5 - board_cards)
+    remaining = deck_cards - (5 - board_cards)
+    for i in range(num_opponents):
+        size *= math.comb(remaining - 2 * i, 2)
+    return size // math.factorial(num_opponents)
+
+
+def exact_equity(hole_cards, board=(), dead_cards=(), num_opponents=1):
+    """
+    Exact equity against `num_opponents` random hands by full enumeration.
+    Takes the same card arguments as monte_carlo_equity.
+
+    :return: EquityResult with exact=True and stderr 0
+    """
+    hero, board, deck = _prepare(hole_cards, board, dead_cards, num_opponents)
+    need = 5 - len(board)
+    bits = [1 << i for i in range(len(deck))]
+    holdings = [(i, j, bits[i] | bits[j]) for i, j in combinations(range(len(deck)), 2)]
+
+    # tally[k] counts outcomes where the hero ties with k opponents; tally[-1]
+    # counts losses and tally[0] wins
+    tally = [0] * (num_opponents + 2)
+
+    def assign(ranked, start, used, left, best, best_count, hero_rank):
+        if not left:
+            if hero_rank > best:
+                tally[0] += 1
+            elif hero_rank == best:
+                tally[best_count] += 1
+            else:
+                tally[-1] += 1
+            return
+        for index in range(start, len(ranked)):
+            mask, rank = ranked[index]
+            if used & mask:
+                continue
+            if rank > best:
+                assign(ranked, index + 1, used | mask, left - 1, rank, 1, hero_rank)
+            elif rank == best:
+                assign(ranked, index + 1, used | mask, left - 1, best, best_count + 1, hero_rank)
+            else:
+                assign(ranked, index + 1, used | mask, left - 1, best, best_count, hero_rank)
+
+    for runout in combinations(range(len(deck)), need):
+        used = 0
+        for i in runout:
+            used |= bits[i]
+        full_board = board + [deck[i] for i in runout]
+        hero_rank = evaluate_cards(hero + full_board)
+
+        # Rank every opponent holding compatible with this runout once and
+        # reuse it for all the sets of holdings it appears in
+        ranked = [
+            (mask, evaluate_cards(full_board + [deck[i], deck[j]]))
+            for i, j, mask in holdings if not used & mask
+        ]
+
+        if num_opponents == 1:
+            for _, rank in ranked:
+                if hero_rank > rank:
+                    tally[0] += 1
+                elif hero_rank == rank:
+                    tally[1] += 1
+                else:
+                    tally[-1] += 1
+        else:
+            assign(ranked, 0, 0, num_opponents, 0, 0, hero_rank)
+
+    total = sum(tally)
+    ties = sum(tally[1:-1])
+    share = tally[0] + sum(count / (k + 1) for k, count in enumerate(tally[1:-1], start=1))
+    return EquityResult(tally[0] / total, ties / total, tally[-1] / total, share / total, total, 0.0, True)
+
+
+def calculate_equity(hole_cards, board=(), dead_cards=(), num_opponents=1,
+                     exact_threshold=EXACT_THRESHOLD, **monte_carlo_options):
+    """
+    Equity against `num_opponents` random hands, enumerated exactly when the
+    enumeration has at most `exact_threshold` combinations and sampled with
+    monte_carlo_equity (which receives `monte_carlo_options`) otherwise.
+    """
+    unseen = 52 - len(hole_cards) - len(board) - len(dead_cards)
+    if enumeration_size(len(board), unseen, num_opponents) <= exact_threshold:
+        return exact_equity(hole_cards, board, dead_cards, num_opponents)
+    return monte_carlo_equity(hole_cards, board, dead_cards, num_opponents, **monte_carlo_options)
+
+
+def showdown_equity(hands, board=(), dead_cards=(), samples=SHOWDOWN_SAMPLES,
+                    exact_threshold=SHOWDOWN_EXACT_THRESHOLD, seed=None):
+    """
+    Each known hand's share of the pot over the rest of the board, with
+    split pots shared equally among the tied hands.
+
+    :param hands: two hole cards per player still in the hand
+    :param board: community cards already dealt
+    :param samples: runouts sampled when there are more than `exact_threshold`
+    :param seed: seed for the sampled runouts
+    :return: list of equities, one per hand, summing to 1
+    """
+    hands = [encode_cards(hand) for hand in hands]
+    board = encode_cards(board)
+    known = [card for hand in hands for card in hand] + board + encode_cards(dead_cards)
+    if len(set(known)) != len(known):
+        raise ValueError("The same card appears more than once in hands, board and dead cards.")
+    if len(board) > 5:
+        raise ValueError("The board cannot have more than five cards.")
+
+    known = set(known)
+    deck = np.array([card for card in FULL_DECK if card not in known], dtype=np.int64)
+    need = 5 - len(board)
+    if math.comb(len(deck), need) <= exact_threshold:
+        runouts = list(combinations(deck, need))
+        runouts = np.array(runouts, dtype=np.int64).reshape(len(runouts), need)
+    else:
+        rng = np.random.default_rng(seed)
+        runouts = deck[rng.random((samples, len(deck))).argsort(axis=1)[:, :need]]
+
+    boards = np.hstack([np.broadcast_to(np.array(board, dtype=np.int64), (len(runouts), len(board))), runouts])
+    ranks = np.empty((len(hands), len(runouts)), dtype=np.int32)
+    for index, hand in enumerate(hands):
+        cards = np.hstack([np.broadcast_to(np.array(hand, dtype=np.int64), (len(runouts), 2)), boards])
+        ranks[index] = evaluate_batch(cards)[0]
+
+    winners = ranks == ranks.max(axis=0)
+    shares = winners / winners.sum(axis=0)
+    return shares.mean(axis=1).tolist()
@@ -0,0 +1,293 @@
+"""
+Lookup-table poker hand evaluator working on encoded int cards (see cards.py).
+
+Every 5-card hand falls into one of 7462 equivalence classes.  Each class
+gets an integer rank from 1 (7-high) to 7462 (royal flush), so comparing two
+hands is a single integer comparison.  The tables are built once at import:
+
+- FLUSH_RANKS:   rank mask -> rank, for hands whose five cards share a suit
+- UNIQUE5_RANKS: rank mask -> rank, for five distinct ranks (straights and
+                 high cards), 0 when the mask does not have five bits
+- PRODUCT_RANKS: product of rank primes -> rank, for every paired hand
+"""
+
+from enum import Enum, auto
+from itertools import combinations
+
+from .cards import PRIMES
+
+
+class PokerHand(Enum):
+    HIGH_CARD = auto()
+    PAIR = auto()
+    TWO_PAIR = auto()
+    THREE_OF_A_KIND = auto()
+    STRAIGHT = auto()
+    FLUSH = auto()
+    FULL_HOUSE = auto()
+    FOUR_OF_A_KIND = auto()
+    STRAIGHT_FLUSH = auto()
+    ROYAL_FLUSH = auto()
+
+
+# Straight rank masks from weakest (wheel, A-2-3-4-5) to strongest (A-K-Q-J-10)
+STRAIGHT_MASKS = [0x100F] + [0x1F << i for i in range(9)]
+
+FLUSH_RANKS = [0] * 8192
+UNIQUE5_RANKS = [0] * 8192
+PRODUCT_RANKS = {}
+
+# RANK_CLASSES[rank] = (PokerHand, tie-break values); index 0 is unused
+RANK_CLASSES = [None]
+
+# CATEGORY_BOUNDS[i] = highest rank belonging to the i-th category, in
+# PokerHand order, so a category is found with a bisect or a short scan
+CATEGORY_BOUNDS = []
+
+
+def _mask_values(mask):
+    """
+    Card values (2-14) of the set bits in a rank mask, highest first.
+    """
+    return [r + 2 for r in range(12, -1, -1) if mask & (1 << r)]
+
+
+def _straight_values(mask):
+    if mask == 0x100F:
+        return [5, 4, 3, 2, 1]  # Ace counts as low
+    return _mask_values(mask)
+
+
+def _build_tables():
+    straights = set(STRAIGHT_MASKS)
+
+    # Five distinct ranks that do not form a straight, weakest first
+    distinct = []
+    for ranks in combinations(range(13), 5):
+        mask = sum(1 << r for r in ranks)
+        if mask not in straights:
+            distinct.append(mask)
+    distinct.sort(key=_mask_values)
+
+    def product(values):
+        result = 1
+        for value in values:
+            result *= PRIMES[value - 2]
+        return result
+
+    def add(category, values, table=None, key=()):
+        rank = len(RANK_CLASSES)
+        RANK_CLASSES.append((category, tuple(values)))
+        if table is None:
+            PRODUCT_RANKS[product(key)] = rank
+        else:
+            table[key] = rank
+
+    values = range(2, 15)
+
+    for mask in distinct:
+        add(PokerHand.HIGH_CARD, _mask_values(mask), UNIQUE5_RANKS, mask)
+    CATEGORY_BOUNDS.append(len(RANK_CLASSES) - 1)
+
+    for pair in values:
+        kickers = [v for v in values if v != pair]
+        for kick in sorted(sorted(k, reverse=True) for k in combinations(kickers, 3)):
+            add(PokerHand.PAIR, [pair] + kick, key=[pair, pair] + kick)
+    CATEGORY_BOUNDS.append(len(RANK_CLASSES) - 1)
+
+    for high, low in sorted((h, l) for l, h in combinations(values, 2)):
+        for kick in values:
+            if kick not in (high, low):
+                add(PokerHand.TWO_PAIR, [high, low, kick], key=[high, high, low, low, kick])
+    CATEGORY_BOUNDS.append(len(RANK_CLASSES) - 1)
+
+    for trips in values:
+        kickers = [v for v in values if v != trips]
+        for high, low in sorted((h, l) for l, h in combinations(kickers, 2)):
+            add(PokerHand.THREE_OF_A_KIND, [trips, high, low], key=[trips] * 3 + [high, low])
+    CATEGORY_BOUNDS.append(len(RANK_CLASSES) - 1)
+
+    for mask in STRAIGHT_MASKS:
+        add(PokerHand.STRAIGHT, _straight_values(mask), UNIQUE5_RANKS, mask)
+    CATEGORY_BOUNDS.append(len(RANK_CLASSES) - 1)
+
+    for mask in distinct:
+        add(PokerHand.FLUSH, _mask_values(mask), FLUSH_RANKS, mask)
+    CATEGORY_BOUNDS.append(len(RANK_CLASSES) - 1)
+
+    for trips in values:
+        for pair in values:
+            if pair != trips:
+                add(PokerHand.FULL_HOUSE, [trips, pair], key=[trips] * 3 + [pair] * 2)
+    CATEGORY_BOUNDS.append(len(RANK_CLASSES) - 1)
+
+    for quads in values:
+        for kick in values:
+            if kick != quads:
+                add(PokerHand.FOUR_OF_A_KIND, [quads, kick], key=[quads] * 4 + [kick])
+    CATEGORY_BOUNDS.append(len(RANK_CLASSES) - 1)
+
+    for mask in STRAIGHT_MASKS[:-1]:
+        add(PokerHand.STRAIGHT_FLUSH, _straight_values(mask), FLUSH_RANKS, mask)
+    CATEGORY_BOUNDS.append(len(RANK_CLASSES) - 1)
+
+    add(PokerHand.ROYAL_FLUSH, _straight_values(STRAIGHT_MASKS[-1]), FLUSH_RANKS, STRAIGHT_MASKS[-1])
+    CATEGORY_BOUNDS.append(len(RANK_CLASSES) - 1)
+
+
+_build_tables()
+
+NUM_RANKS = len(RANK_CLASSES) - 1  # 7462
+
+
+def evaluate_5(c1, c2, c3, c4, c5):
+    """
+    Rank five encoded cards. Higher is better; equal ranks are a tie.
+    """
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return FLUSH_RANKS[(c1 | c2 | c3 | c4 | c5) >> 16]
+    rank = UNIQUE5_RANKS[(c1 | c2 | c3 | c4 | c5) >> 16]
+    if rank:
+        return rank
+    return PRODUCT_RANKS[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+
+
+def hand_category(rank):
+    """
+    The PokerHand category of a rank returned by the evaluator.
+    """
+    return RANK_CLASSES[rank][0]
+
+
+def rank_values(rank):
+    """
+    The tie-break card values (2-14, ace-low straights use 1) of a rank,
+    in the same form the original evaluate_hand returned them.
+    """
+    return RANK_CLASSES[rank][1]
+
+
+# --- 6 and 7 card hands -------------------------------------------------
+#
+# With at most seven cards a flush can never share the hand with quads or a
+# full house, so the best hand is found in one pass:
+#   - count suits; if one suit has five or more cards, look its rank mask up
+#     in FLUSH_BEST_RANKS (best straight flush or flush inside the mask)
+#   - otherwise look the product of all rank primes up in UNSUITED_RANKS,
+#     which maps every multiset of 5-7 ranks to its best 5-card rank
+
+FLUSH_BEST_RANKS = [0] * 8192
+UNSUITED_RANKS = {}
+
+# Per-card suit counter increments, indexed by the one-hot suit bits; each
+# suit gets its own 4-bit lane so seven cards never overflow into the next
+_SUIT_LANES = [0, 1 << 0, 1 << 4, 0, 1 << 8, 0, 0, 0, 1 << 12]
+
+
+def _top_bits(mask, count):
+    """
+    Keep only the `count` highest set bits of a rank mask.
+    """
+    result = 0
+    for r in range(12, -1, -1):
+        if mask & (1 << r):
+            result |= 1 << r
+            count -= 1
+            if not count:
+                break
+    return result
+
+
+def _best_straight(mask):
+    for straight in reversed(STRAIGHT_MASKS):
+        if mask & straight == straight:
+            return straight
+    return 0
+
+
+def _best_unsuited(counts):
+    """
+    Best 5-card rank for a multiset of ranks, given as counts per rank index.
+    """
+    by_count = {4: [], 3: [], 2: [], 1: []}
+    mask = 0
+    for r in range(12, -1, -1):
+        if counts[r]:
+            by_count[counts[r]].append(r)
+            mask |= 1 << r
+
+    def lookup(ranks):
+        product = 1
+        for r in ranks:
+            product *= PRIMES[r]
+        return PRODUCT_RANKS[product]
+
+    def kickers(exclude, count):
+        return [r for r in range(12, -1, -1) if counts[r] and r not in exclude][:count]
+
+    if by_count[4]:
+        quads = by_count[4][0]
+        return lookup([quads] * 4 + kickers((quads,), 1))
+    if by_count[3] and len(by_count[3]) + len(by_count[2]) >= 2:
+        trips = by_count[3][0]
+        pair = max(by_count[3][1:] + by_count[2])
+        return lookup([trips] * 3 + [pair] * 2)
+    straight = _best_straight(mask)
+    if straight:
+        return UNIQUE5_RANKS[straight]
+    if by_count[3]:
+        trips = by_count[3][0]
+        return lookup([trips] * 3 + kickers((trips,), 2))
+    if len(by_count[2]) >= 2:
+        high, low = by_count[2][:2]
+        return lookup([high, high, low, low] + kickers((high, low), 1))
+    if by_count[2]:
+        pair = by_count[2][0]
+        return lookup([pair, pair] + kickers((pair,), 3))
+    return UNIQUE5_RANKS[_top_bits(mask, 5)]
+
+
+def _build_multi_card_tables():
+    for mask in range(8192):
+        if bin(mask).count("1") >= 5:
+            straight = _best_straight(mask)
+            FLUSH_BEST_RANKS[mask] = FLUSH_RANKS[straight or _top_bits(mask, 5)]
+
+    counts = [0] * 13
+
+    def fill(r, cards, product):
+        if cards >= 5:
+            UNSUITED_RANKS[product] = _best_unsuited(counts)
+        if r == 13 or cards == 7:
+            return
+        for count in range(min(4, 7 - cards) + 1):
+            counts[r] = count
+            fill(r + 1, cards + count, product * PRIMES[r] ** count)
+        counts[r] = 0
+
+    fill(0, 0, 1)
+
+
+_build_multi_card_tables()
+
+
+def evaluate_cards(cards):
+    """
+    Rank the best 5-card hand contained in 5, 6 or 7 encoded cards.
+    Returns the same rank scale as evaluate_5.
+    """
+    suits = 0
+    product = 1
+    for card in cards:
+        suits += _SUIT_LANES[(card >> 12) & 0xF]
+        product *= card & 0xFF
+
+    flush = (suits + 0x3333) & 0x8888
+    if flush:
+        suit_bit = 0x1000 << ((flush.bit_length() - 4) // 4)
+        mask = 0
+        for card in cards:
+            if card & suit_bit:
+                mask |= card >> 16
+        return FLUSH_BEST_RANKS[mask]
+    return UNSUITED_RANKS[product]
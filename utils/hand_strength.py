@@ -0,0 +1,100 @@
+"""
+Postflop hand strength, hand potential and effective hand strength (EHS).
+
+Following the usual definitions:
+
+- HS, hand strength: the share of opponent holdings the hero currently
+  beats (ties count half), enumerated exactly over every holding.
+- PPot, positive potential: the chance that a hand currently behind or tied
+  ends up ahead by the river.
+- NPot, negative potential: the chance that a hand currently ahead or tied
+  ends up behind.
+- EHS against n opponents: HS^n * (1 - NPot) + (1 - HS^n) * PPot.
+
+The potentials are estimated from a fixed number of (opponent holding,
+runout) samples drawn from an RNG seeded by the spot itself, so a spot
+always gets the same answer.
+"""
+
+import random
+from collections import namedtuple
+from itertools import combinations
+
+from .cards import FULL_DECK, encode_cards
+from .hand_evaluator import evaluate_cards
+
+AHEAD, TIED, BEHIND = 0, 1, 2
+
+HandStrength = namedtuple("HandStrength", ["strength", "positive_potential", "negative_potential"])
+
+DEFAULT_POTENTIAL_SAMPLES = 1_000
+
+
+def _compare(hero_rank, villain_rank):
+    if hero_rank > villain_rank:
+        return AHEAD
+    if hero_rank == villain_rank:
+        return TIED
+    return BEHIND
+
+
+def hand_strength(hole_cards, board, potential_samples=DEFAULT_POTENTIAL_SAMPLES):
+    """
+    HS, PPot and NPot of the hero against one random opponent.
+
+    :param hole_cards: the hero's two cards
+    :param board: three to five community cards
+    :param potential_samples: (holding, runout) samples used for the potentials
+    :return: HandStrength
+    """
+    hero = encode_cards(hole_cards)
+    board = encode_cards(board)
+    if not 3 <= len(board) <= 5:
+        raise ValueError("Hand strength needs a flop, turn or river board.")
+
+    known = set(hero + board)
+    deck = [card for card in FULL_DECK if card not in known]
+    hero_rank = evaluate_cards(hero + board)
+
+    counts = [0, 0, 0]
+    holdings = []
+    for villain in combinations(deck, 2):
+        state = _compare(hero_rank, evaluate_cards(list(villain) + board))
+        counts[state] += 1
+        holdings.append((villain, state))
+
+    strength = (counts[AHEAD] + counts[TIED] / 2) / len(holdings)
+    if len(board) == 5:
+        return HandStrength(strength, 0.0, 0.0)
+
+    # transitions[now][final] over sampled (holding, runout) pairs
+    transitions = [[0, 0, 0] for _ in range(3)]
+    totals = [0, 0, 0]
+    rng = random.Random(str((tuple(sorted(hero)), tuple(sorted(board)))))
+    need = 5 - len(board)
+    for _ in range(potential_samples):
+        villain, state = holdings[rng.randrange(len(holdings))]
+        remaining = [card for card in deck if card not in villain]
+        final_board = board + rng.sample(remaining, need)
+        final = _compare(evaluate_cards(hero + final_board), evaluate_cards(list(villain) + final_board))
+        transitions[state][final] += 1
+        totals[state] += 1
+
+    behind_weight = totals[BEHIND] + totals[TIED] / 2
+    ahead_weight = totals[AHEAD] + totals[TIED] / 2
+    positive = (transitions[BEHIND][AHEAD] + transitions[BEHIND][TIED] / 2 + transitions[TIED][AHEAD] / 2)
+    negative = (transitions[AHEAD][BEHIND] + transitions[TIED][BEHIND] / 2 + transitions[AHEAD][TIED] / 2)
+    return HandStrength(
+        strength,
+        positive / behind_weight if behind_weight else 0.0,
+        negative / ahead_weight if ahead_weight else 0.0,
+    )
+
+
+def effective_hand_strength(strength, num_opponents=1):
+    """
+    EHS against `num_opponents` from a HandStrength result.
+    """
+    multiway = strength.strength ** num_opponents
+    return (multiway * (1 - strength.negative_potential)
+            + (1 - multiway) * strength.positive_potential)
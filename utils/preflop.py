@@ -0,0 +1,301 @@
+"""
+Preflop equity for the 169 starting-hand classes.
+
+Two hole cards fall into one of 169 classes: 13 pocket pairs, 78 suited
+and 78 offsuit hands. A class is indexed on a 13x13 grid by rank index
+(0 = deuce ... 12 = ace): pairs sit on the diagonal, suited hands at
+(high, low) and offsuit hands at (low, high), index = row * 13 + column.
+
+The equities are precomputed once by running this module
+
+    python -m utils.preflop [--samples N] [--processes P] [--seed S]
+
+which writes a compact binary file (DEFAULT_TABLE_PATH):
+
+    header   "<4sHHHI"  magic b"PFEQ", version, classes (169),
+                        max opponents (9), samples per entry
+    matchups 169 x 169 uint16, all-in equity of the row class against the
+             column class, scaled by 65535
+    field    169 x 9 uint16, all-in equity against 1..9 random hands
+
+The file is memory-mapped on first use, so every lookup is a single
+unpack from the OS page cache and processes share one copy.
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import time
+
+from .cards import RANKS, SUITS, card_to_int, rank_index, suit_index
+
+NUM_CLASSES = 169
+MAX_OPPONENTS = 9
+
+MAGIC = b"PFEQ"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHI")
+SCALE = 65535
+
+DEFAULT_TABLE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "preflop_equity.bin"
+)
+
+_RANK_CHARS = "23456789TJQKA"
+
+# Keys of the sampling streams, under the root seed: (role, hand class)
+_MATCHUPS = 0
+_FIELD = 1
+
+
+def class_index(hole_cards):
+    """
+    The 0-168 class of two hole cards ((rank, suit) tuples or encoded ints).
+    """
+    first, second = card_to_int(hole_cards[0]), card_to_int(hole_cards[1])
+    high, low = rank_index(first), rank_index(second)
+    if high < low:
+        high, low = low, high
+    if high == low or suit_index(first) != suit_index(second):
+        return low * 13 + high
+    return high * 13 + low
+
+
+def class_name(index):
+    """
+    Conventional name of a class, e.g. 'AKs', 'T9o' or '77'.
+    """
+    row, column = divmod(index, 13)
+    if row == column:
+        return _RANK_CHARS[row] * 2
+    if row > column:
+        return _RANK_CHARS[row] + _RANK_CHARS[column] + "s"
+    return _RANK_CHARS[column] + _RANK_CHARS[row] + "o"
+
+
+def class_combos(index):
+    """
+    Every concrete pair of encoded cards in a class (6, 4 or 12 combos).
+    """
+    row, column = divmod(index, 13)
+    cards = [[card_to_int((rank, suit)) for suit in SUITS] for rank in RANKS]
+    if row == column:
+        return [(cards[row][a], cards[row][b]) for a in range(4) for b in range(a + 1, 4)]
+    if row > column:
+        return [(cards[row][s], cards[column][s]) for s in range(4)]
+    return [(cards[column][a], cards[row][b]) for a in range(4) for b in range(4) if a != b]
+
+
+class PreflopEquityTable:
+    """
+    Read-only view of a preflop equity file, memory-mapped on construction.
+    """
+
+    def __init__(self, path=DEFAULT_TABLE_PATH):
+        with open(path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, classes, max_opponents, samples = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != VERSION or classes != NUM_CLASSES:
+            raise ValueError(f"{path} is not a preflop equity table (version {VERSION}).")
+
+        self.max_opponents = max_opponents
+        self.samples = samples
+        self._matchup_offset = HEADER.size
+        self._field_offset = HEADER.size + NUM_CLASSES * NUM_CLASSES * 2
+
+    def matchup(self, hero_class, villain_class):
+        """
+        All-in equity of one class against another.
+        """
+        offset = self._matchup_offset + (hero_class * NUM_CLASSES + villain_class) * 2
+        return struct.unpack_from("<H", self._buffer, offset)[0] / SCALE
+
+    def matchup_matrix(self):
+        """
+        Every matchup as a 169 x 169 float array (row class against column
+        class). Needs NumPy.
+        """
+        import numpy as np
+
+        levels = np.frombuffer(self._buffer, dtype="<u2", count=NUM_CLASSES * NUM_CLASSES,
+                               offset=self._matchup_offset)
+        return levels.reshape(NUM_CLASSES, NUM_CLASSES) / SCALE
+
+    def against_field(self, hero_class, num_opponents):
+        """
+        All-in equity of a class against `num_opponents` random hands.
+        """
+        if not 1 <= num_opponents <= self.max_opponents:
+            raise ValueError(f"num_opponents must be between 1 and {self.max_opponents}.")
+        offset = self._field_offset + (hero_class * self.max_opponents + num_opponents - 1) * 2
+        return struct.unpack_from("<H", self._buffer, offset)[0] / SCALE
+
+
+_default_table = None
+
+
+def get_preflop_table():
+    """
+    The shared table at DEFAULT_TABLE_PATH, loaded on first use.
+    """
+    global _default_table
+    if _default_table is None:
+        _default_table = PreflopEquityTable(DEFAULT_TABLE_PATH)
+    return _default_table
+
+
+def preflop_equity(hole_cards, num_opponents=1):
+    """
+    All-in equity of two hole cards against `num_opponents` random hands.
+    """
+    return get_preflop_table().against_field(class_index(hole_cards), num_opponents)
+
+
+def preflop_matchup_equity(hero_cards, villain_cards):
+    """
+    All-in equity of the hero's class against the villain's class.
+    """
+    return get_preflop_table().matchup(class_index(hero_cards), class_index(villain_cards))
+
+
+# --- Generation ----------------------------------------------------------
+
+
+def _combo_arrays(np):
+    """
+    (169, 12, 2) padded combo array and (169,) combo counts.
+    """
+    combos = np.zeros((NUM_CLASSES, 12, 2), dtype=np.int64)
+    counts = np.zeros(NUM_CLASSES, dtype=np.int64)
+    for index in range(NUM_CLASSES):
+        class_cards = class_combos(index)
+        combos[index, :len(class_cards)] = class_cards
+        counts[index] = len(class_cards)
+    return combos, counts
+
+
+def _deal_excluding(np, rng, deck, excluded, count):
+    """
+    Deal `count` cards per row from the deck, skipping each row's excluded cards.
+    """
+    keys = rng.random((len(excluded), len(deck)))
+    for column in range(excluded.shape[1]):
+        keys[excluded[:, column, None] == deck[None, :]] = 2.0
+    picks = np.argpartition(keys, count, axis=1)[:, :count]
+    return deck[picks]
+
+
+def _matchup_rows(args):
+    """
+    Equity of hero class `row` against classes row..168, from `samples` deals
+    each; the rest of the row follows from antisymmetry.
+    """
+    import numpy as np
+
+    from .batch_evaluator import evaluate_batch
+    from .cards import FULL_DECK
+    from .rng import numpy_stream
+
+    row, samples, seed = args
+    rng = numpy_stream(seed, _MATCHUPS, row)
+    deck = np.array(FULL_DECK, dtype=np.int64)
+    combos, counts = _combo_arrays(np)
+
+    equities = np.zeros(NUM_CLASSES)
+    for column in range(row, NUM_CLASSES):
+        hero = combos[row, rng.integers(counts[row], size=samples)]
+        villain = combos[column, rng.integers(counts[column], size=samples)]
+
+        # Redraw villain combos that share a card with the hero
+        while True:
+            clash = (villain[:, :, None] == hero[:, None, :]).any(axis=(1, 2))
+            if not clash.any():
+                break
+            villain[clash] = combos[column, rng.integers(counts[column], size=int(clash.sum()))]
+
+        board = _deal_excluding(np, rng, deck, np.concatenate([hero, villain], axis=1), 5)
+        hero_ranks, _ = evaluate_batch(np.concatenate([hero, board], axis=1))
+        villain_ranks, _ = evaluate_batch(np.concatenate([villain, board], axis=1))
+        equities[column] = ((hero_ranks > villain_ranks).sum() + 0.5 * (hero_ranks == villain_ranks).sum()) / samples
+    return row, equities
+
+
+def _field_row(args):
+    """
+    Equity of hero class `row` against 1..MAX_OPPONENTS random hands.
+    """
+    import numpy as np
+
+    from .batch_evaluator import evaluate_batch
+    from .cards import FULL_DECK
+    from .rng import numpy_stream
+
+    row, samples, seed = args
+    rng = numpy_stream(seed, _FIELD, row)
+    deck = np.array(FULL_DECK, dtype=np.int64)
+    combos, counts = _combo_arrays(np)
+
+    equities = np.zeros(MAX_OPPONENTS)
+    for opponents in range(1, MAX_OPPONENTS + 1):
+        hero = combos[row, rng.integers(counts[row], size=samples)]
+        dealt = _deal_excluding(np, rng, deck, hero, 5 + 2 * opponents)
+        board = dealt[:, :5]
+
+        hero_ranks, _ = evaluate_batch(np.concatenate([hero, board], axis=1))
+        best = np.zeros(samples, dtype=np.int32)
+        best_count = np.zeros(samples, dtype=np.int32)
+        for i in range(opponents):
+            ranks, _ = evaluate_batch(np.concatenate([dealt[:, 5 + 2 * i:7 + 2 * i], board], axis=1))
+            best_count = np.where(ranks > best, 1, np.where(ranks == best, best_count + 1, best_count))
+            best = np.maximum(best, ranks)
+
+        share = np.where(hero_ranks > best, 1.0, np.where(hero_ranks == best, 1.0 / (best_count + 1), 0.0))
+        equities[opponents - 1] = share.mean()
+    return row, equities
+
+
+def generate_preflop_table(path=DEFAULT_TABLE_PATH, samples=20_000, processes=None, seed=0):
+    """
+    Compute every matchup and field equity by sampling and write the table.
+    Needs NumPy; rows are computed in parallel over `processes` workers.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    import numpy as np
+
+    matchups = np.zeros((NUM_CLASSES, NUM_CLASSES))
+    field = np.zeros((NUM_CLASSES, MAX_OPPONENTS))
+    tasks = [(row, samples, seed) for row in range(NUM_CLASSES)]
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        for row, equities in pool.map(_matchup_rows, tasks):
+            matchups[row, row:] = equities[row:]
+            matchups[row:, row] = 1.0 - equities[row:]
+            matchups[row, row] = 0.5  # a class against itself is symmetric
+        for row, equities in pool.map(_field_row, tasks):
+            field[row] = equities
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, NUM_CLASSES, MAX_OPPONENTS, samples))
+        f.write(np.round(matchups * SCALE).astype("<u2").tobytes())
+        f.write(np.round(field * SCALE).astype("<u2").tobytes())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the preflop equity table.")
+    parser.add_argument("--output", default=DEFAULT_TABLE_PATH, help="where to write the table")
+    parser.add_argument("--samples", type=int, default=20_000, help="deals per matchup and per field size")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="root seed for the sampler")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    generate_preflop_table(args.output, args.samples, args.processes, args.seed)
+    print(f"Wrote {args.output} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Reproducible random streams derived from one root seed.
+
+Every stream comes from numpy's SeedSequence for (seed, key...). Streams
+with different keys are statistically independent. The same seed and key
+always give the same stream, whichever process creates it and in whatever
+order, so parallel workers never share or collide on random state.
+
+PokerEnv keys its streams by (table, hand). Within a hand, role DECK
+shuffles the deck and role AGENT + seat is the stream of the agent in that
+table seat. Any hand of a large parallel run can therefore be dealt again
+from (seed, table, hand) alone, without storing decks.
+
+NumPy consumers take a Generator from numpy_stream instead: the preflop
+equity generator (utils/preflop.py) keys each worker's sampling by
+(table section, hand class).
+"""
+
+import random
+
+import numpy as np
+
+DECK = 0
+AGENT = 1    # the agent in table seat s draws from role AGENT + s
+
+_WORDS = 2   # 128-bit seed per role
+
+
+def seed_sequence(seed, *key):
+    """
+    The SeedSequence of `key` under the root `seed` (non-negative ints).
+    """
+    return np.random.SeedSequence(seed, spawn_key=key)
+
+
+def stream(seed, *key):
+    """
+    A random.Random for (seed, key...).
+    """
+    words = seed_sequence(seed, *key).generate_state(4, np.uint64)
+    return random.Random(int.from_bytes(words.tobytes(), "little"))
+
+
+def numpy_stream(seed, *key):
+    """
+    A numpy Generator for (seed, key...).
+    """
+    return np.random.default_rng(seed_sequence(seed, *key))
+
+
+def role_seeds(seed, table, hand, roles):
+    """
+    Integer seeds of roles 0 .. roles-1 of one hand, for reseeding existing
+    random.Random objects. They come from one SeedSequence per hand, and a
+    role's seed does not depend on how many roles are asked for.
+    """
+    words = seed_sequence(seed, table, hand).generate_state(_WORDS * roles, np.uint64)
+    return [int(words[i]) << 64 | int(words[i + 1]) for i in range(0, len(words), _WORDS)]
+
+
+def hand_stream(seed, table, hand, role=DECK):
+    """
+    A fresh random.Random for one role of one hand, in the same state the
+    environment's stream was in when the hand started.
+    """
+    return random.Random(role_seeds(seed, table, hand, role + 1)[role])